@@ -0,0 +1,27 @@
+"""add pool seed to game history
+
+Revision ID: d3a9c1e5f7b2
+Revises: c7f2e4a1b2d3
+Create Date: 2026-10-17 10:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd3a9c1e5f7b2'
+down_revision = 'c7f2e4a1b2d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('game_history', sa.Column('pool_seed', sa.BigInteger(), nullable=True))
+    op.add_column('game_history', sa.Column('pool_generator_version', sa.SmallInteger(), nullable=True))
+    op.add_column('game_history', sa.Column('pool_size', sa.SmallInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('game_history', 'pool_size')
+    op.drop_column('game_history', 'pool_generator_version')
+    op.drop_column('game_history', 'pool_seed')
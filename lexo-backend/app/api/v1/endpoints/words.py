@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
-from app.models.schemas import ValidateWordRequest, ValidateWordResponse
+from app.models.schemas import (
+    ValidateWordRequest,
+    ValidateWordResponse,
+    ValidateWordsRequest,
+    ValidateWordsResponse,
+    WordValidationResult,
+)
 from app.services.word_service import WordService
+from app.utils.game_logic import validate_word_length
 from app.dependencies import get_word_service
 from app.core.logging import get_logger
 from app.api.dependencies.auth import AuthenticatedUser, get_current_user
@@ -10,6 +17,38 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+_DICTIONARY_CACHE_CONTROL = "private, max-age=3600"
+_MAX_WORD_LENGTH = 50
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """gzip is acceptable unless refused with q=0, explicitly or through ``*`` (RFC 9110 §12.5.3)."""
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+    q = qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0)))
+    return q > 0
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110 §13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
 
 @router.post("/validate-word", response_model=ValidateWordResponse)
 @router.post("/validate", response_model=ValidateWordResponse)
@@ -41,3 +80,64 @@ def validate_word(
     except Exception as e:
         logger.error(f"Error validating word: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/validate-words", response_model=ValidateWordsResponse)
+async def validate_words(
+    request: ValidateWordsRequest,
+    word_service: WordService = Depends(get_word_service),
+    _current_user: AuthenticatedUser = Depends(get_current_user)
+) -> ValidateWordsResponse:
+    """
+    Validate up to 100 words in one request. Lookups are in-memory and cheap,
+    so this runs on the event loop instead of hopping through the threadpool.
+    Malformed entries (too short or too long) are reported as invalid per item.
+    """
+    results = []
+    for raw_word in request.words:
+        word = raw_word.strip().lower()
+        is_valid = (
+            len(word) <= _MAX_WORD_LENGTH
+            and validate_word_length(word)
+            and word_service.is_valid_word(word)
+        )
+        results.append(WordValidationResult(
+            word=word,
+            valid=is_valid,
+            score=word_service.get_word_score(word) if is_valid else 0,
+        ))
+    return ValidateWordsResponse(results=results)
+
+
+@router.get("/dictionary")
+def download_dictionary(
+    request: Request,
+    word_service: WordService = Depends(get_word_service),
+    _current_user: AuthenticatedUser = Depends(get_current_user)
+) -> Response:
+    """
+    Versioned, front-coded dictionary for local validation on clients.
+    Clients should send the ETag back in If-None-Match; unchanged versions get
+    an empty 304. Server-side validation in submit_word remains authoritative.
+    """
+    bundle = word_service.get_client_dictionary()
+    use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    etag = bundle.gzip_etag if use_gzip else bundle.etag
+    headers = {
+        "ETag": etag,
+        "Cache-Control": _DICTIONARY_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+        "X-Dictionary-Version": bundle.version,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    headers["X-Dictionary-Words"] = str(bundle.word_count)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        body = bundle.gzipped
+    else:
+        body = bundle.raw
+    return Response(content=body, media_type="text/plain; charset=utf-8", headers=headers)
@@ -0,0 +1,49 @@
+"""
+Sub-multiset ("anagram") index over the packed dictionary.
+
+Answers "which dictionary words can be spelled from this letter pool" using the
+per-word letter bitmasks and count vectors stored in the dictionary artifact.
+Both tables are zero-copy NumPy views over the memory-mapped file, so the index
+adds almost nothing to a worker's heap.
+"""
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from app.core.constants import ALPHABET, LETTER_INDEX
+from app.core.word_table import WordTable
+
+
+def pool_signature(letter_pool: Iterable[str]) -> Tuple[int, np.ndarray]:
+    """Bitmask and per-letter count vector for a letter pool; unknown letters are ignored."""
+    counts = np.zeros(len(ALPHABET), dtype=np.uint8)
+    mask = 0
+    for letter in letter_pool:
+        index = LETTER_INDEX.get(letter.lower())
+        if index is None:
+            continue
+        counts[index] += 1
+        mask |= 1 << index
+    return mask, counts
+
+
+class AnagramIndex:
+
+    def __init__(self, table: WordTable):
+        self.table = table
+        self.dictionary = table.dictionary
+
+    def find_indices(self, letter_pool: Iterable[str], min_length: int = 1) -> np.ndarray:
+        """Dictionary indices of every word formable from ``letter_pool``."""
+        table = self.table
+        mask, counts = pool_signature(letter_pool)
+        excluded = np.uint32(~mask & 0xFFFFFFFF)
+        candidates = np.flatnonzero((table.masks & excluded) == 0)
+        if min_length > 1:
+            candidates = candidates[table.lengths[candidates] >= min_length]
+        fits = (table.letter_counts[candidates] <= counts).all(axis=1)
+        return candidates[fits]
+
+    def find_words(self, letter_pool: Iterable[str], min_length: int = 1) -> List[str]:
+        word_at = self.dictionary.word_at
+        return [word_at(int(i)) for i in self.find_indices(letter_pool, min_length)]
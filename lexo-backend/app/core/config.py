@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import List, Literal
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -19,6 +19,25 @@ class GameSettings(BaseSettings):
     length_bonus_threshold_2: int = 7
     length_bonus_multiplier_1: int = 3
     length_bonus_multiplier_2: int = 4
+    pool_min_words: int = Field(default=150, alias='POOL_MIN_WORDS')
+    pool_min_total_score: int = Field(default=1200, alias='POOL_MIN_TOTAL_SCORE')
+    pool_bank_size: int = Field(default=500, alias='POOL_BANK_SIZE')
+    pool_bank_batch_size: int = 20
+    pool_bank_local_buffer: int = 20
+    # "static": the pool never changes; "consumable": played letters are replaced
+    pool_mode: Literal['static', 'consumable'] = Field(default='static', alias='POOL_MODE')
+    # Keep writing letter_pool next to the seed in game history (verification period)
+    history_store_letter_pool: bool = Field(default=False, alias='HISTORY_STORE_LETTER_POOL')
+    # Lone queued players are matched against a server-side bot after this wait
+    bot_enabled: bool = Field(default=True, alias='BOT_ENABLED')
+    bot_match_after_seconds: int = Field(default=15, alias='BOT_MATCH_AFTER_SECONDS')
+    bot_skill: float = Field(default=0.5, ge=0.0, le=1.0, alias='BOT_SKILL')
+    # Another worker ends and saves a game this long past its deadline if the owner is gone
+    orphan_reap_interval_seconds: int = Field(default=5, alias='ORPHAN_REAP_INTERVAL_SECONDS')
+    orphan_reap_after_seconds: int = Field(default=10, alias='ORPHAN_REAP_AFTER_SECONDS')
+    # On shutdown, games this close to their end finish here; longer ones move to a peer worker
+    drain_finish_seconds: int = Field(default=15, alias='DRAIN_FINISH_SECONDS')
+    drain_timeout_seconds: int = Field(default=30, alias='DRAIN_TIMEOUT_SECONDS')
 
     model_config = {
         'env_file': str(Path(__file__).parent.parent.parent / '.env'),
@@ -90,6 +109,10 @@ class WebSocketSettings(BaseSettings):
     grace_period_seconds: int = Field(default=10, alias='WS_GRACE_PERIOD_SECONDS')
     token_check_interval_seconds: int = Field(default=300, alias='WS_TOKEN_CHECK_INTERVAL_SECONDS')
     ping_interval_seconds: int = Field(default=25, alias='WS_PING_INTERVAL_SECONDS')
+    prefix_check_max_messages: int = Field(default=150, alias='WS_PREFIX_CHECK_MAX_MESSAGES')
+    prefix_check_window_seconds: int = Field(default=10, alias='WS_PREFIX_CHECK_WINDOW_SECONDS')
+    # This worker's own /ws/queue URL; matched players are asked to reconnect here
+    public_url: str = Field(default='', alias='WS_PUBLIC_URL')
 
     model_config = {
         'env_file': str(Path(__file__).parent.parent.parent / '.env'),
@@ -111,6 +134,7 @@ class SentrySettings(BaseSettings):
 
 class FileSettings(BaseSettings):
     words_file: str = Field(default='turkish_words.txt', alias='WORDS_FILE')
+    dictionary_file: str = Field(default='turkish_words.dict', alias='DICTIONARY_FILE')
 
     model_config = {
         'env_file': str(Path(__file__).parent.parent.parent / '.env'),
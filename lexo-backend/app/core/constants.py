@@ -21,3 +21,11 @@ CONSONANTS = [
     'b', 'c', 'ç', 'd', 'f', 'g', 'ğ', 'h', 'j', 'k', 
     'l', 'm', 'n', 'p', 'r', 's', 'ş', 't', 'v', 'y', 'z'
 ]
+
+# Canonical Turkish alphabet order used for letter-count vectors and bitmasks.
+ALPHABET = [
+    'a', 'b', 'c', 'ç', 'd', 'e', 'f', 'g', 'ğ', 'h', 'ı', 'i', 'j', 'k', 'l',
+    'm', 'n', 'o', 'ö', 'p', 'r', 's', 'ş', 't', 'u', 'ü', 'v', 'y', 'z'
+]
+
+LETTER_INDEX = {letter: index for index, letter in enumerate(ALPHABET)}
@@ -0,0 +1,292 @@
+"""
+Compact, read-only word dictionary backed by a memory-mapped packed string table.
+
+Layout of the binary artifact (all integers little-endian):
+
+    header   magic (8s) | format version (u32) | word count (u32) | slot count (u32)
+             | SHA-256 of everything after the header (32s) | alphabet (64s, UTF-8)
+    offsets  (word count + 1) x u32, byte offsets into the blob
+    slots    slot count x u32, open-addressing hash table of word index + 1 (0 = empty)
+    masks    word count x u32, letter-presence bitmask per word (alphabet order)
+    counts   word count x len(alphabet) x u8, letter-count vector per word
+    blob     UTF-8 words, sorted by their encoded bytes, concatenated
+
+Words containing characters outside the alphabet get ``UNPLAYABLE_MASK`` in
+their bitmask so no letter pool can ever match them.
+
+The file is opened with ``mmap`` so every worker process maps the same
+page-cache pages instead of holding its own copy of ~89k Python strings.
+Membership is a CRC32-hashed probe into the slot table; the sorted blob
+keeps ordered access (iteration, ``word_at``) available.
+
+Artifacts are produced offline by ``python -m app.tools.build_dictionary``.
+The checksum doubles as the dictionary version.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from app.core.constants import ALPHABET, LETTER_INDEX
+
+DICTIONARY_MAGIC = b"LEXODICT"
+DICTIONARY_FORMAT_VERSION = 3
+UNPLAYABLE_MASK = 1 << 31
+
+_HEADER = struct.Struct("<8sIII32s64s")
+_U32_SIZE = 4
+_ALPHABET_BYTES = "".join(ALPHABET).encode("utf-8")
+CLIENT_FORMAT = "LEXODICT-FC1"
+
+
+class DictionaryFormatError(Exception):
+    """Raised when a dictionary artifact is missing, truncated or incompatible."""
+    pass
+
+
+def normalize_words(lines: Iterable[str]) -> List[bytes]:
+    """Normalize raw word-list lines into sorted, de-duplicated UTF-8 keys."""
+    words = {line.strip().lower() for line in lines}
+    words.discard("")
+    return sorted(word.encode("utf-8") for word in words)
+
+
+def _slot_count(word_count: int) -> int:
+    size = 1
+    while size < word_count * 2:
+        size <<= 1
+    return size
+
+
+def _build_slots(keys: List[bytes]) -> array:
+    size = _slot_count(len(keys))
+    mask = size - 1
+    slots = array("I", [0]) * size
+    for index, key in enumerate(keys):
+        slot = zlib.crc32(key) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+    return slots
+
+
+def letter_signature(word: str) -> Tuple[int, bytes]:
+    """Letter-presence bitmask and per-letter count vector of a normalized word."""
+    counts = bytearray(len(ALPHABET))
+    mask = 0
+    for char in word:
+        index = LETTER_INDEX.get(char)
+        if index is None:
+            mask |= UNPLAYABLE_MASK
+            continue
+        counts[index] = min(counts[index] + 1, 255)
+        mask |= 1 << index
+    return mask, bytes(counts)
+
+
+def _u32_view(buffer: memoryview):
+    if sys.byteorder == "little":
+        return buffer.cast("I")
+    values = array("I", buffer)
+    values.byteswap()
+    buffer.release()
+    return values
+
+
+def write_dictionary(words: Iterable[str], path: Union[str, Path]) -> int:
+    """
+    Build a packed dictionary artifact from raw words and write it atomically.
+
+    Returns the number of words written.
+    """
+    keys = normalize_words(words)
+    offsets = array("I", [0])
+    position = 0
+    for key in keys:
+        position += len(key)
+        offsets.append(position)
+    slots = _build_slots(keys)
+    masks = array("I")
+    counts = bytearray()
+    for key in keys:
+        mask, vector = letter_signature(key.decode("utf-8"))
+        masks.append(mask)
+        counts += vector
+    if sys.byteorder != "little":
+        offsets.byteswap()
+        slots.byteswap()
+        masks.byteswap()
+    payload = offsets.tobytes() + slots.tobytes() + masks.tobytes() + bytes(counts) + b"".join(keys)
+    checksum = hashlib.sha256(payload).digest()
+
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(
+                DICTIONARY_MAGIC, DICTIONARY_FORMAT_VERSION, len(keys), len(slots),
+                checksum, _ALPHABET_BYTES,
+            ))
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return len(keys)
+
+
+def encode_client_dictionary(words: Iterable[str], version: str) -> bytes:
+    """
+    Front-coded text encoding of a sorted word list for client-side validation.
+
+    First line: ``LEXODICT-FC1<TAB>version<TAB>word count``. Each following
+    line is ``<shared prefix length with previous word><TAB><suffix>``.
+    Sorted neighbours share long prefixes, so this compresses well with gzip.
+    """
+    lines = []
+    previous = ""
+    for word in words:
+        limit = min(len(word), len(previous))
+        shared = 0
+        while shared < limit and word[shared] == previous[shared]:
+            shared += 1
+        lines.append(f"{shared}\t{word[shared:]}")
+        previous = word
+    header = f"{CLIENT_FORMAT}\t{version}\t{len(lines)}"
+    return "\n".join([header, *lines]).encode("utf-8") + b"\n"
+
+
+def decode_client_dictionary(data: bytes) -> List[str]:
+    """Inverse of ``encode_client_dictionary`` (reference for client implementations)."""
+    lines = data.decode("utf-8").split("\n")
+    fmt, _version, count = lines[0].split("\t")
+    if fmt != CLIENT_FORMAT:
+        raise DictionaryFormatError(f"Unknown client dictionary format {fmt}")
+    words = []
+    previous = ""
+    for line in lines[1:int(count) + 1]:
+        shared, suffix = line.split("\t", 1)
+        previous = previous[:int(shared)] + suffix
+        words.append(previous)
+    return words
+
+
+class PackedDictionary:
+    """Read-only, memory-mapped sorted string table with hashed O(1) membership."""
+
+    def __init__(self, path: Union[str, Path], verify: bool = True):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise DictionaryFormatError(f"{self.path} is empty") from exc
+
+        if len(self._mm) < _HEADER.size:
+            raise DictionaryFormatError(f"{self.path} is truncated")
+        magic, version, count, slot_count, checksum, alphabet = _HEADER.unpack_from(self._mm, 0)
+        if magic != DICTIONARY_MAGIC:
+            raise DictionaryFormatError(f"{self.path} is not a dictionary artifact")
+        if version != DICTIONARY_FORMAT_VERSION:
+            raise DictionaryFormatError(
+                f"{self.path} has format version {version}, expected {DICTIONARY_FORMAT_VERSION}"
+            )
+
+        if alphabet.rstrip(b"\0") != _ALPHABET_BYTES:
+            raise DictionaryFormatError(f"{self.path} was built for a different alphabet")
+        if slot_count & (slot_count - 1) or slot_count < count:
+            raise DictionaryFormatError(f"{self.path} has an invalid slot table")
+
+        offsets_start = _HEADER.size
+        slots_start = offsets_start + (count + 1) * _U32_SIZE
+        masks_start = slots_start + slot_count * _U32_SIZE
+        counts_start = masks_start + count * _U32_SIZE
+        self._blob_start = counts_start + count * len(ALPHABET)
+        if len(self._mm) < self._blob_start:
+            raise DictionaryFormatError(f"{self.path} is truncated")
+        view = memoryview(self._mm)
+        self._offsets = _u32_view(view[offsets_start:slots_start])
+        self._slots = _u32_view(view[slots_start:masks_start])
+        self.letter_masks = _u32_view(view[masks_start:counts_start])
+        self.letter_counts = view[counts_start:self._blob_start]
+        view.release()
+        self._mask = slot_count - 1
+        self._count = count
+        if len(self._mm) < self._blob_start + self._offsets[count]:
+            raise DictionaryFormatError(f"{self.path} is truncated")
+        if verify and hashlib.sha256(self._mm[_HEADER.size:]).digest() != checksum:
+            raise DictionaryFormatError(f"{self.path} failed checksum verification")
+        self.checksum = checksum.hex()
+
+    @property
+    def version(self) -> str:
+        """Short content-addressed version, stable across rebuilds of the same words."""
+        return self.checksum[:16]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        return self.index_of(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self.word_at(i)
+
+    def _key_at(self, index: int) -> bytes:
+        base = self._blob_start
+        return self._mm[base + self._offsets[index]:base + self._offsets[index + 1]]
+
+    def word_at(self, index: int) -> str:
+        return self._key_at(index).decode("utf-8")
+
+    def index_of(self, word: str) -> int:
+        """Position of ``word`` in sorted order, or -1 if absent."""
+        key = word.encode("utf-8")
+        mm, offsets, slots, base, mask = self._mm, self._offsets, self._slots, self._blob_start, self._mask
+        slot = zlib.crc32(key) & mask
+        while True:
+            entry = slots[slot]
+            if not entry:
+                return -1
+            if mm[base + offsets[entry - 1]:base + offsets[entry]] == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def indices_of(self, words: Iterable[str]) -> array:
+        """``index_of`` for many words in one pass (-1 for absent ones), for bulk scoring."""
+        mm, offsets, slots, base, mask = self._mm, self._offsets, self._slots, self._blob_start, self._mask
+        crc32 = zlib.crc32
+        indices = array("i")
+        append = indices.append
+        for word in words:
+            key = word.encode("utf-8")
+            slot = crc32(key) & mask
+            while True:
+                entry = slots[slot]
+                if not entry:
+                    append(-1)
+                    break
+                if mm[base + offsets[entry - 1]:base + offsets[entry]] == key:
+                    append(entry - 1)
+                    break
+                slot = (slot + 1) & mask
+        return indices
+
+    def close(self):
+        """Unmap the artifact. Views handed out (e.g. to an AnagramIndex) must be dropped first."""
+        for table in (self._offsets, self._slots, self.letter_masks, self.letter_counts):
+            if isinstance(table, memoryview):
+                table.release()
+        self._mm.close()
@@ -0,0 +1,112 @@
+"""
+Counted letter pool.
+
+Keeps a fixed-size count array indexed by letter ordinal (``ALPHABET`` order)
+next to the display order clients index into. Containment checks walk the
+word once against a 29-byte copy of the counts, instead of copying the pool
+list and calling ``list.remove`` per letter.
+"""
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from app.core.constants import ALPHABET, LETTER_INDEX
+
+
+class LetterPool:
+    __slots__ = ("_counts", "_letters")
+
+    def __init__(self, letters: Iterable[str] = ()):
+        self._counts = bytearray(len(ALPHABET))
+        self._letters: List[str] = []
+        self.refill(letters)
+
+    def __len__(self) -> int:
+        return len(self._letters)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._letters)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LetterPool):
+            return self._letters == other._letters
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LetterPool({self.encode()!r})"
+
+    def count(self, letter: str) -> int:
+        index = LETTER_INDEX.get(letter)
+        return self._counts[index] if index is not None else 0
+
+    def contains_word(self, word: str) -> bool:
+        """True if every letter of ``word`` is available, honouring multiplicity."""
+        counts = self._counts[:]
+        index_of = LETTER_INDEX.get
+        for letter in word.lower():
+            index = index_of(letter)
+            if index is None or not counts[index]:
+                return False
+            counts[index] -= 1
+        return True
+
+    def consume(self, word: str) -> List[str]:
+        """Remove the letters of ``word`` from the pool; returns them. Raises ValueError if missing."""
+        letters = list(word.lower())
+        if not self.contains_word(word):
+            raise ValueError(f"Pool does not contain the letters of {word!r}")
+        for letter in letters:
+            self._counts[LETTER_INDEX[letter]] -= 1
+            self._letters.remove(letter)
+        return letters
+
+    def exchange(self, word: str, replacements: List[str]) -> List[Tuple[int, str]]:
+        """
+        Swap the letters of ``word`` for ``replacements`` in place, so untouched
+        tiles keep their positions. Returns ``(position, new letter)`` pairs.
+        Raises ValueError if the word is not in the pool or the sizes differ.
+        """
+        word = word.lower()
+        if len(replacements) != len(word):
+            raise ValueError("Need exactly one replacement per consumed letter")
+        if not self.contains_word(word):
+            raise ValueError(f"Pool does not contain the letters of {word!r}")
+        replacements = [letter.lower() for letter in replacements]
+        if any(letter not in LETTER_INDEX for letter in replacements):
+            raise ValueError("Replacement is not a pool letter")
+        taken = set()
+        changes = []
+        for letter, replacement in zip(word, replacements):
+            position = self._letters.index(letter)
+            while position in taken:
+                position = self._letters.index(letter, position + 1)
+            taken.add(position)
+            changes.append((position, replacement))
+        for (position, replacement), letter in zip(changes, word):
+            self._counts[LETTER_INDEX[letter]] -= 1
+            self._counts[LETTER_INDEX[replacement]] += 1
+            self._letters[position] = replacement
+        return changes
+
+    def refill(self, letters: Iterable[str]):
+        """Append letters to the pool; characters outside the alphabet are rejected."""
+        for letter in letters:
+            letter = letter.lower()
+            index = LETTER_INDEX.get(letter)
+            if index is None:
+                raise ValueError(f"{letter!r} is not a pool letter")
+            self._counts[index] += 1
+            self._letters.append(letter)
+
+    def to_list(self) -> List[str]:
+        """Letters in display order, as sent to clients."""
+        return list(self._letters)
+
+    def encode(self) -> str:
+        """Compact snapshot form: the letters concatenated in display order."""
+        return "".join(self._letters)
+
+    @classmethod
+    def decode(cls, raw: Union[str, bytes]) -> "LetterPool":
+        """Inverse of ``encode``; also accepts the older comma-separated form."""
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return cls(letter for letter in raw if letter != ",")
@@ -0,0 +1,38 @@
+"""
+Prefix lookup over the words playable from one letter pool.
+
+Built from the anagram-index result for a room's pool (a few hundred words),
+so every keystroke check is a single dict lookup. Each prefix maps to the
+number of still-unused words that extend it; playing a word decrements the
+counts along its path instead of rebuilding the index.
+"""
+from typing import Dict, Iterable, Set, Tuple
+
+
+class PrefixIndex:
+
+    def __init__(self, words: Iterable[str]):
+        self._words: Set[str] = set()
+        self._completions: Dict[str, int] = {}
+        for word in words:
+            if word in self._words:
+                continue
+            self._words.add(word)
+            for end in range(1, len(word) + 1):
+                prefix = word[:end]
+                self._completions[prefix] = self._completions.get(prefix, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def lookup(self, prefix: str) -> Tuple[bool, bool]:
+        """(can still lead to a playable word, is itself a playable word)."""
+        return self._completions.get(prefix, 0) > 0, prefix in self._words
+
+    def discard(self, word: str):
+        """Stop counting ``word`` once it has been played."""
+        if word not in self._words:
+            return
+        self._words.remove(word)
+        for end in range(1, len(word) + 1):
+            self._completions[word[:end]] -= 1
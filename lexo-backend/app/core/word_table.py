@@ -0,0 +1,72 @@
+"""
+Precomputed per-word metadata for one dictionary version.
+
+Letter-count vectors and bitmasks are zero-copy views over the memory-mapped
+artifact; lengths and scores are computed once at load with NumPy (scores
+depend on the length-bonus settings, so they are not baked into the artifact).
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from app.core.constants import ALPHABET
+from app.core.dictionary import UNPLAYABLE_MASK, PackedDictionary
+from app.utils.game_logic import calculate_word_score, calculate_word_scores
+
+
+@dataclass(frozen=True)
+class WordMetadata:
+    word: str
+    score: int
+    length: int
+    letter_counts: Dict[str, int]
+
+
+class WordTable:
+
+    def __init__(self, dictionary: PackedDictionary):
+        self.dictionary = dictionary
+        count = len(dictionary)
+        self.masks = np.frombuffer(dictionary.letter_masks, dtype=np.uint32)
+        self.letter_counts = np.frombuffer(dictionary.letter_counts, dtype=np.uint8).reshape(
+            count, len(ALPHABET)
+        )
+        lengths = self.letter_counts.sum(axis=1, dtype=np.uint16)
+        # Count vectors skip characters outside the alphabet; fix up those few words.
+        for index in np.flatnonzero(self.masks & UNPLAYABLE_MASK):
+            lengths[index] = len(dictionary.word_at(int(index)))
+        self.lengths = lengths
+        self.scores = calculate_word_scores(self.letter_counts, lengths)
+
+    def __len__(self) -> int:
+        return len(self.dictionary)
+
+    def score_of(self, word: str) -> Optional[int]:
+        """Precomputed score of a dictionary word, or None if it is not in the dictionary."""
+        index = self.dictionary.index_of(word.lower())
+        return int(self.scores[index]) if index >= 0 else None
+
+    def scores_of(self, words: Sequence[str]) -> np.ndarray:
+        """
+        Scores for many words: one bulk index lookup, then a gather from the
+        score array. Words outside the dictionary are scored individually.
+        """
+        words = [word.lower() for word in words]
+        indices = np.frombuffer(self.dictionary.indices_of(words), dtype=np.intc)
+        scores = self.scores[indices].astype(np.int32)
+        for i in np.flatnonzero(indices < 0):
+            scores[i] = calculate_word_score(words[i])
+        return scores
+
+    def get(self, word: str) -> Optional[WordMetadata]:
+        index = self.dictionary.index_of(word.lower())
+        if index < 0:
+            return None
+        counts = self.letter_counts[index]
+        return WordMetadata(
+            word=self.dictionary.word_at(index),
+            score=int(self.scores[index]),
+            length=int(self.lengths[index]),
+            letter_counts={ALPHABET[i]: int(n) for i, n in enumerate(counts) if n},
+        )
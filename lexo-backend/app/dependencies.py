@@ -1,28 +1,44 @@
 import redis.asyncio as aioredis
 
 from app.services.word_service import WordService
+from app.services.bot_service import BotService
 from app.services.game_service import GameService
 from app.services.matchmaking_service import MatchmakingService
+from app.services.pool_bank_service import PoolBankService
+from app.services.dictionary_reload_service import DictionaryReloadService
+from app.services.drain_service import WorkerDrainService
 from app.services.presence_service import PresenceService
+from app.services.room_reaper_service import RoomReaperService
 from app.services.ws_bridge import WebSocketBridge
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 _word_service: WordService = None
+_pool_bank: PoolBankService = None
+_dictionary_reloader: DictionaryReloadService = None
 _game_service: GameService = None
 _matchmaking_service: MatchmakingService = None
+_bot_service: BotService = None
 _presence_service: PresenceService = None
+_room_reaper: RoomReaperService = None
+_worker_drain: WorkerDrainService = None
 _bridge: WebSocketBridge = None
 
 
 def init_services(redis: aioredis.Redis, bridge: WebSocketBridge):
-    global _word_service, _game_service, _matchmaking_service, _presence_service, _bridge
+    global _word_service, _pool_bank, _dictionary_reloader, _game_service, _matchmaking_service, \
+        _bot_service, _presence_service, _room_reaper, _worker_drain, _bridge
 
     _word_service = WordService()
-    _game_service = GameService(_word_service)
+    _pool_bank = PoolBankService(_word_service, redis)
+    _dictionary_reloader = DictionaryReloadService(_word_service, redis)
+    _game_service = GameService(_word_service, _pool_bank)
     _matchmaking_service = MatchmakingService(_game_service, redis)
+    _bot_service = BotService(_game_service, bridge, _matchmaking_service.room_log)
     _presence_service = PresenceService()
+    _room_reaper = RoomReaperService(_matchmaking_service, bridge)
+    _worker_drain = WorkerDrainService(_matchmaking_service, bridge)
     _bridge = bridge
 
     logger.info("Services initialized successfully")
@@ -34,6 +50,18 @@ def get_word_service() -> WordService:
     return _word_service
 
 
+def get_pool_bank() -> PoolBankService:
+    if _pool_bank is None:
+        raise RuntimeError("Services not initialized. Call init_services() first.")
+    return _pool_bank
+
+
+def get_dictionary_reloader() -> DictionaryReloadService:
+    if _dictionary_reloader is None:
+        raise RuntimeError("Services not initialized. Call init_services() first.")
+    return _dictionary_reloader
+
+
 def get_game_service() -> GameService:
     if _game_service is None:
         raise RuntimeError("Services not initialized. Call init_services() first.")
@@ -46,6 +74,24 @@ def get_matchmaking_service() -> MatchmakingService:
     return _matchmaking_service
 
 
+def get_bot_service() -> BotService:
+    if _bot_service is None:
+        raise RuntimeError("Services not initialized. Call init_services() first.")
+    return _bot_service
+
+
+def get_room_reaper() -> RoomReaperService:
+    if _room_reaper is None:
+        raise RuntimeError("Services not initialized. Call init_services() first.")
+    return _room_reaper
+
+
+def get_worker_drain() -> WorkerDrainService:
+    if _worker_drain is None:
+        raise RuntimeError("Services not initialized. Call init_services() first.")
+    return _worker_drain
+
+
 def get_presence_service() -> PresenceService:
     if _presence_service is None:
         raise RuntimeError("Services not initialized. Call init_services() first.")
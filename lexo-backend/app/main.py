@@ -33,7 +33,12 @@ from app.dependencies import (
     get_word_service,
     get_matchmaking_service,
     get_presence_service,
+    get_pool_bank,
+    get_dictionary_reloader,
     get_bridge,
+    get_bot_service,
+    get_room_reaper,
+    get_worker_drain,
 )
 from app.api.v1.router import api_router
 from app.api.v1.endpoints.health import router as health_router
@@ -97,16 +102,45 @@ async def lifespan(app: FastAPI):
         word_service = get_word_service()
         matchmaking_service = get_matchmaking_service()
         matchmaking_service.worker_id = bridge.worker_id
-        logger.info(f"✅ Loaded {word_service.get_word_count()} valid Turkish words")
+        # Runs messages forwarded by workers whose players sit in rooms owned here
+        room_action_handler = GameWebSocketHandler(
+            matchmaking_service, word_service, bridge, get_bot_service()
+        )
+        bridge.set_room_action_handler(room_action_handler.handle_forwarded_action)
+        get_worker_drain().set_hand_off(room_action_handler.hand_off_room)
+        logger.info(
+            f"✅ Loaded {word_service.get_word_count()} valid Turkish words "
+            f"(dictionary {word_service.get_version()})"
+        )
     except Exception as e:
         logger.error(f"❌ Service initialization failed: {e}")
         raise
 
+    dictionary_reloader = get_dictionary_reloader()
+    await dictionary_reloader.start()
+    logger.info("✅ Dictionary hot reload listener started")
+
+    pool_bank = get_pool_bank()
+    await pool_bank.start()
+    logger.info("✅ Letter pool bank producer started")
+
+    room_reaper = get_room_reaper()
+    await room_reaper.start()
+    logger.info("✅ Orphaned room reaper started")
+
     logger.info("🚀 Application started successfully")
 
     yield
 
     logger.info("Shutting down application...")
+    # Before anything stops: handed-off rooms need the bridge, and the heartbeat keeps ours unreaped
+    drained = await get_worker_drain().drain()
+    logger.info(f"Drain finished: {drained['handed_off']} room(s) handed off, {drained['remaining']} left")
+    await get_bot_service().stop()
+    await room_reaper.stop()
+    await get_matchmaking_service().timers.stop()
+    await pool_bank.stop()
+    await dictionary_reloader.stop()
     await bridge.stop()
     await close_redis()
     logger.info("Application shutdown complete")
@@ -170,7 +204,7 @@ async def websocket_queue_endpoint(websocket: WebSocket):
     matchmaking_service = get_matchmaking_service()
     word_service = get_word_service()
     bridge = get_bridge()
-    handler = GameWebSocketHandler(matchmaking_service, word_service, bridge)
+    handler = GameWebSocketHandler(matchmaking_service, word_service, bridge, get_bot_service())
     await handler.handle_connection(websocket)
 
 
@@ -209,6 +243,9 @@ async def get_stats():
     queue_depth = await matchmaking_service.get_queue_depth()
     return {
         "active_rooms": stats["active_rooms"],
+        "players_in_rooms": stats["players_in_rooms"],
+        "bot_rooms": stats["bot_rooms"],
+        "pending_timers": stats["pending_timers"],
         "waiting_players": queue_depth,
         "total_words": word_service.get_word_count(),
         "online_players": presence_service.get_online_count(),
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Index
+from sqlalchemy import BigInteger, Column, Integer, SmallInteger, String, Float, DateTime, ForeignKey, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -49,7 +49,11 @@ class GameHistory(Base):
     winner_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     
     duration = Column(Integer, default=60)
-    letter_pool = Column(String)
+    # Either the pool letters, or the (seed, generator version, size) they regenerate from
+    letter_pool = Column(String, nullable=True)
+    pool_seed = Column(BigInteger, nullable=True)
+    pool_generator_version = Column(SmallInteger, nullable=True)
+    pool_size = Column(SmallInteger, nullable=True)
     started_at = Column(DateTime, default=datetime.utcnow, index=True)
     ended_at = Column(DateTime, default=datetime.utcnow, index=True)
     
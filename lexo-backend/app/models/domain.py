@@ -1,17 +1,25 @@
-from typing import List, Dict, Set, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
+import random
+import time
 
 from app.core.config import settings
+from app.core.letter_pool import LetterPool
+from app.utils.game_logic import seeded_letter_pool
 
 
 class Player:
-    def __init__(self, player_id: str, username: str):
+    __slots__ = ("id", "username", "is_bot", "score", "words", "connected", "disconnected_at")
+
+    def __init__(self, player_id: str, username: str, is_bot: bool = False):
         self.id = player_id
         self.username = username
+        self.is_bot = is_bot
         self.score = 0
         self.words: List[str] = []
         self.connected = True
-        self.last_disconnect_time: Optional[datetime] = None
+        # time.monotonic() of the last disconnect; only meaningful inside this process
+        self.disconnected_at: Optional[float] = None
 
     def add_score(self, points: int) -> int:
         self.score += points
@@ -31,47 +39,114 @@ class Player:
 
 
 class GameRoom:
+    __slots__ = (
+        "id", "player1", "player2", "letter_pool", "initial_letter_pool", "used_words",
+        "duration", "started_monotonic", "started_wall", "game_started", "game_ended",
+        "game_saved", "dictionary", "prefix_index", "pool_mode", "pool_version",
+        "pool_seed", "pool_generator_version", "_refill_rng", "pending_events",
+    )
+
     def __init__(self, room_id: str, player1: Player, player2: Player, duration: int = 60):
         self.id = room_id
         self.player1 = player1
         self.player2 = player2
-        self.letter_pool: List[str] = []
+        self.letter_pool = LetterPool()
+        self.initial_letter_pool: List[str] = []
         self.used_words: Set[str] = set()
         self.duration = duration
-        self.start_time: Optional[datetime] = None
+        # In-game timing runs on the monotonic clock; the wall-clock start (epoch seconds)
+        # is captured once and only used for clients, snapshots and game history
+        self.started_monotonic: Optional[float] = None
+        self.started_wall: Optional[float] = None
         self.game_started = False
         self.game_ended = False
         self.game_saved = False
-        self.reconnect_grace_period = settings.websocket.grace_period_seconds
+        # Dictionary pinned at creation so a hot reload never changes the rules mid-game
+        self.dictionary: Optional[Any] = None
+        # Lazily built PrefixIndex of playable words; dropped whenever the pool changes
+        self.prefix_index: Optional[Any] = None
+        self.pool_mode = settings.game.pool_mode
+        # Bumped on every pool mutation so clients can detect a missed delta
+        self.pool_version = 0
+        # (pool_seed, pool_generator_version) regenerates the pool; refill_rng continues
+        # the same seeded stream, so refills are reproducible too
+        self.pool_seed: Optional[int] = None
+        self.pool_generator_version: Optional[int] = None
+        # A Random() is ~2.5 KB, so it is only built on the first refill; seeded rooms
+        # replay their seed to resume the same stream
+        self._refill_rng: Optional[random.Random] = None
+        # Event-log entries not yet written to Redis (see RoomEventLog.flush)
+        self.pending_events: List[Dict[str, str]] = []
+
+    @property
+    def refill_rng(self) -> random.Random:
+        if self._refill_rng is None:
+            if self.pool_seed is None:
+                self._refill_rng = random.Random()
+            else:
+                _, self._refill_rng = seeded_letter_pool(
+                    self.pool_seed, len(self.initial_letter_pool), self.pool_generator_version
+                )
+        return self._refill_rng
+
+    @refill_rng.setter
+    def refill_rng(self, rng: random.Random):
+        self._refill_rng = rng
+
+    @property
+    def reconnect_grace_period(self) -> int:
+        return settings.websocket.grace_period_seconds
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Wall-clock start, for persistence; never use it to measure elapsed time."""
+        if self.started_wall is None:
+            return None
+        return datetime.fromtimestamp(self.started_wall)
+
+    @property
+    def start_time_ms(self) -> Optional[int]:
+        if self.started_wall is None:
+            return None
+        return int(self.started_wall * 1000)
 
     def start_game(self):
         self.game_started = True
-        self.start_time = datetime.now()
+        self.started_monotonic = time.monotonic()
+        self.started_wall = time.time()
 
     def end_game(self):
         self.game_ended = True
+        self.prefix_index = None
 
-    def set_letter_pool(self, letters: List[str]):
-        self.letter_pool = letters
+    def set_letter_pool(self, letters: Iterable[str]):
+        self.letter_pool = LetterPool(letters)
+        self.initial_letter_pool = self.letter_pool.to_list()
+        self.prefix_index = None
 
     def add_used_word(self, word: str) -> bool:
         word_lower = word.lower()
         if word_lower in self.used_words:
             return False
         self.used_words.add(word_lower)
+        if self.prefix_index is not None:
+            self.prefix_index.discard(word_lower)
         return True
 
     def has_letters(self, word: str) -> bool:
-        temp_pool = self.letter_pool.copy()
-        for letter in word.lower():
-            if letter in temp_pool:
-                temp_pool.remove(letter)
-            else:
-                return False
-        return True
+        return self.letter_pool.contains_word(word)
 
     def add_letters(self, letters: List[str]):
-        self.letter_pool.extend(letters)
+        self.letter_pool.refill(letters)
+        self.prefix_index = None
+        self.pool_version += 1
+
+    def exchange_letters(self, word: str, letters: List[str]) -> List[Tuple[int, str]]:
+        """Replace the tiles used by ``word`` in place; returns (position, letter) changes."""
+        changes = self.letter_pool.exchange(word, letters)
+        self.prefix_index = None
+        self.pool_version += 1
+        return changes
 
     def get_player(self, player_id: str) -> Optional[Player]:
         if self.player1.id == player_id:
@@ -83,6 +158,10 @@ class GameRoom:
     def get_opponent(self, player: Player) -> Player:
         return self.player2 if player == self.player1 else self.player1
 
+    @property
+    def has_bot(self) -> bool:
+        return self.player1.is_bot or self.player2.is_bot
+
     def get_scores(self) -> List[Dict]:
         return [
             {"username": self.player1.username, "score": self.player1.score},
@@ -90,9 +169,9 @@ class GameRoom:
         ]
 
     def get_time_remaining(self) -> Optional[int]:
-        if not self.start_time or self.game_ended:
+        if self.started_monotonic is None or self.game_ended:
             return None
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = time.monotonic() - self.started_monotonic
         remaining = self.duration - int(elapsed)
         return max(0, remaining)
 
@@ -108,7 +187,7 @@ class GameRoom:
             "id": self.id,
             "player1": self.player1.to_dict(),
             "player2": self.player2.to_dict(),
-            "letter_pool": self.letter_pool,
+            "letter_pool": self.letter_pool.to_list(),
             "used_words": list(self.used_words),
             "duration": self.duration,
             "game_started": self.game_started,
@@ -125,15 +204,56 @@ class GameRoom:
             "player1_score": str(self.player1.score),
             "player1_words": ",".join(self.player1.words),
             "player1_connected": "1" if self.player1.connected else "0",
+            "player1_bot": "1" if self.player1.is_bot else "0",
             "player2_id": self.player2.id,
             "player2_username": self.player2.username,
             "player2_score": str(self.player2.score),
             "player2_words": ",".join(self.player2.words),
             "player2_connected": "1" if self.player2.connected else "0",
-            "letter_pool": ",".join(self.letter_pool),
+            "player2_bot": "1" if self.player2.is_bot else "0",
+            "letter_pool": self.letter_pool.encode(),
+            "pool_mode": self.pool_mode,
+            "pool_seed": str(self.pool_seed) if self.pool_seed is not None else "",
+            "pool_generator_version": str(self.pool_generator_version or ""),
+            "pool_version": str(self.pool_version),
             "used_words": ",".join(self.used_words),
             "duration": str(self.duration),
             "start_time": self.start_time.isoformat() if self.start_time else "",
             "game_started": "1" if self.game_started else "0",
             "game_ended": "1" if self.game_ended else "0",
         }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict) -> "GameRoom":
+        """Rebuild a room from ``to_snapshot`` output, e.g. to finalize a dead worker's game."""
+        players = []
+        for prefix in ("player1", "player2"):
+            player = Player(
+                snapshot[f"{prefix}_id"],
+                snapshot[f"{prefix}_username"],
+                is_bot=snapshot.get(f"{prefix}_bot") == "1",
+            )
+            player.score = int(snapshot.get(f"{prefix}_score") or 0)
+            player.words = [w for w in snapshot.get(f"{prefix}_words", "").split(",") if w]
+            player.connected = snapshot.get(f"{prefix}_connected") == "1"
+            players.append(player)
+
+        room = cls(snapshot["id"], players[0], players[1], int(snapshot.get("duration") or 60))
+        room.letter_pool = LetterPool.decode(snapshot.get("letter_pool", ""))
+        room.pool_mode = snapshot.get("pool_mode") or room.pool_mode
+        room.pool_version = int(snapshot.get("pool_version") or 0)
+        room.used_words = {w for w in snapshot.get("used_words", "").split(",") if w}
+        if snapshot.get("pool_seed"):
+            room.pool_seed = int(snapshot["pool_seed"])
+            room.pool_generator_version = int(snapshot["pool_generator_version"])
+            room.initial_letter_pool, _ = seeded_letter_pool(
+                room.pool_seed, len(room.letter_pool), room.pool_generator_version
+            )
+        else:
+            room.initial_letter_pool = room.letter_pool.to_list()
+        if snapshot.get("start_time"):
+            room.started_wall = datetime.fromisoformat(snapshot["start_time"]).timestamp()
+            room.started_monotonic = time.monotonic() - (time.time() - room.started_wall)
+        room.game_started = snapshot.get("game_started") == "1"
+        room.game_ended = snapshot.get("game_ended") == "1"
+        return room
@@ -19,6 +19,21 @@ class ValidateWordResponse(BaseModel):
     message: str
 
 
+class ValidateWordsRequest(BaseModel):
+    # Items are unconstrained on purpose: bad words come back valid=false per item
+    words: List[str] = Field(..., min_length=1, max_length=100)
+
+
+class WordValidationResult(BaseModel):
+    word: str
+    valid: bool
+    score: int
+
+
+class ValidateWordsResponse(BaseModel):
+    results: List[WordValidationResult]
+
+
 class CreateUserRequest(BaseModel):
     user_id: str = Field(..., min_length=1)
     username: str = Field(..., min_length=1, max_length=30)
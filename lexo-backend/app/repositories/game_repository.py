@@ -43,9 +43,12 @@ class GameRepository(BaseRepository[GameHistory]):
         player2_words: List[str],
         winner_id: Optional[int],
         duration: int,
-        letter_pool: List[str],
+        letter_pool: Optional[List[str]],
         started_at: datetime,
-        ended_at: datetime
+        ended_at: datetime,
+        pool_seed: Optional[int] = None,
+        pool_generator_version: Optional[int] = None,
+        pool_size: Optional[int] = None,
     ) -> GameHistory:
         game = GameHistory(
             room_id=room_id,
@@ -57,7 +60,10 @@ class GameRepository(BaseRepository[GameHistory]):
             player2_words=json.dumps(player2_words),
             winner_id=winner_id,
             duration=duration,
-            letter_pool=','.join(letter_pool),
+            letter_pool=','.join(letter_pool) if letter_pool is not None else None,
+            pool_seed=pool_seed,
+            pool_generator_version=pool_generator_version,
+            pool_size=pool_size,
             started_at=started_at,
             ended_at=ended_at
         )
@@ -65,6 +71,17 @@ class GameRepository(BaseRepository[GameHistory]):
         logger.info(f"Created game history for room: {room_id}")
         return created_game
 
+    async def get_seeded_games(self, after_id: int = 0, limit: int = 1000) -> List[GameHistory]:
+        """Games with a stored pool seed, in id order, for keyset-paginated batch jobs."""
+        stmt = (
+            select(GameHistory)
+            .where(GameHistory.pool_seed.isnot(None), GameHistory.id > after_id)
+            .order_by(GameHistory.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_recent_games(self, limit: int = 100) -> List[GameHistory]:
         stmt = select(GameHistory).order_by(desc(GameHistory.ended_at)).limit(limit)
         result = await self.db.execute(stmt)
@@ -0,0 +1,124 @@
+import asyncio
+import math
+import random
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.domain import GameRoom
+from app.services.game_service import GameService
+from app.services.room_event_log import RoomEventLog
+from app.services.ws_bridge import WebSocketBridge
+
+logger = get_logger(__name__)
+
+
+def plan_words(candidates: List[str], skill: float, rng: random.Random) -> List[str]:
+    """
+    Order score-ranked candidates for play, once per pool version. Skill 0 is a
+    uniform shuffle; higher skill keeps top-ranked words nearer the front
+    (weighted shuffle with rank weights of the ``u ** (1 + 4 * skill)`` pick).
+    """
+    n = len(candidates)
+    exponent = 1 / (1 + 4 * skill)
+    keyed = []
+    for rank, word in enumerate(candidates):
+        weight = ((rank + 1) / n) ** exponent - (rank / n) ** exponent
+        keyed.append((math.log(1.0 - rng.random()) / weight, word))
+    keyed.sort(reverse=True)
+    return [word for _, word in keyed]
+
+
+def choose_word(plan: List[str], cursor: int, used: Set[str]) -> Tuple[Optional[str], int]:
+    """Next word of ``plan`` from ``cursor`` that nobody played yet, and the cursor past it."""
+    while cursor < len(plan):
+        word = plan[cursor]
+        cursor += 1
+        if word not in used:
+            return word, cursor
+    return None, cursor
+
+
+def think_time(skill: float, rng: random.Random) -> float:
+    """Seconds between bot submissions: ~8s at skill 0, ~3s at skill 1."""
+    mean = 8.0 - 5.0 * skill
+    return rng.uniform(0.6 * mean, 1.4 * mean)
+
+
+class BotService:
+    """
+    Plays the bot side of bot rooms.
+    - Candidates: one anagram-index query per pool version, ranked by the
+      precomputed word-table scores and shuffled by skill into a play order;
+      each tick advances a cursor past words already used.
+    - Pacing: one sleeping task per room, sleeping between submissions.
+    """
+
+    def __init__(
+        self, game_service: GameService, bridge: WebSocketBridge, room_log: Optional[RoomEventLog] = None
+    ):
+        self.game_service = game_service
+        self.bridge = bridge
+        self.room_log = room_log
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def start(self, room: GameRoom, skill: Optional[float] = None):
+        if room.id in self._tasks:
+            return
+        task = asyncio.create_task(self._play(room, settings.game.bot_skill if skill is None else skill))
+        self._tasks[room.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(room.id, None))
+
+    async def stop(self):
+        for task in list(self._tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    def release(self, room_id: str):
+        """Stop playing a room that moved to another worker."""
+        task = self._tasks.pop(room_id, None)
+        if task:
+            task.cancel()
+
+    def active_rooms(self) -> int:
+        return len(self._tasks)
+
+    def rank_candidates(self, room: GameRoom) -> List[str]:
+        word_service = self.game_service.word_service
+        words = word_service.find_playable_words(room.letter_pool.to_list(), dictionary=room.dictionary)
+        words.sort(key=word_service.get_word_score, reverse=True)
+        return words
+
+    async def _play(self, room: GameRoom, skill: float):
+        bot = room.player2 if room.player2.is_bot else room.player1
+        human = room.get_opponent(bot)
+        rng = random.Random(room.pool_seed)
+        plan: List[str] = []
+        cursor = 0
+        ranked_version = None
+        try:
+            while not room.game_ended:
+                await asyncio.sleep(think_time(skill, rng))
+                if room.game_ended:
+                    break
+                if ranked_version != room.pool_version:
+                    plan, cursor = plan_words(self.rank_candidates(room), skill, rng), 0
+                    ranked_version = room.pool_version
+                word, cursor = choose_word(plan, cursor, room.used_words)
+                if word is None or not self.game_service.validate_word_submission(room, word)["valid"]:
+                    continue
+                result = self.game_service.process_word_submission(room, bot, word)
+                if self.room_log:
+                    await self.room_log.flush(room)
+                await self.bridge.send_to_user(human.id, {
+                    "type": "opponent_word",
+                    "player": bot.username,
+                    "word": result["word"],
+                    "score": result["score"],
+                    "scores": result["scores"],
+                    **self.game_service.pool_update(result),
+                })
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Bot in room {room.id} stopped: {e}")
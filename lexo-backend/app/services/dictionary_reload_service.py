@@ -0,0 +1,126 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.dictionary import PackedDictionary
+from app.core.logging import get_logger
+from app.services.word_service import WordService
+
+logger = get_logger(__name__)
+
+_RELOAD_CHANNEL = "dict:reload"
+_CURRENT_KEY = "dict:current"
+
+
+async def publish_dictionary(redis: aioredis.Redis, dictionary_file: str) -> str:
+    """
+    Announce a new dictionary artifact to every worker; returns its version.
+    The artifact must be readable at ``dictionary_file`` on every host
+    (baked into the image or on a shared volume).
+    """
+    path = str(Path(dictionary_file).resolve())
+    dictionary = await asyncio.to_thread(PackedDictionary, path)
+    version = dictionary.version
+    dictionary.close()
+
+    payload = json.dumps({"version": version, "path": path, "published_at": time.time()})
+    await redis.set(_CURRENT_KEY, payload)
+    await redis.publish(_RELOAD_CHANNEL, payload)
+    logger.info(f"Published dictionary {version} from {path}")
+    return version
+
+
+class DictionaryReloadService:
+    """
+    Keeps this worker's WordService on the dictionary version announced in Redis.
+    - Live: listens on a Pub/Sub channel, like WebSocketBridge does for messages.
+    - Catch-up: on start, applies the version stored under ``dict:current``,
+      so workers that boot or reconnect after a publish still converge. A
+      publish older than the bundled artifact is skipped: a deploy that ships
+      a newer dictionary must not be downgraded to a stale announcement.
+    """
+
+    def __init__(self, word_service: WordService, redis: aioredis.Redis):
+        self.word_service = word_service
+        self.redis = redis
+        self._lock = asyncio.Lock()
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        self._pubsub = self.redis.pubsub()
+        await self._pubsub.subscribe(_RELOAD_CHANNEL)
+        self._listener_task = asyncio.create_task(self._listen())
+        current = await self.redis.get(_CURRENT_KEY)
+        if current and self._published_after_bundle(current):
+            await self.apply(current)
+        logger.info(f"DictionaryReloadService started — dictionary {self.word_service.get_version()}")
+
+    async def stop(self):
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+        if self._pubsub:
+            await self._pubsub.unsubscribe(_RELOAD_CHANNEL)
+            await self._pubsub.aclose()
+        logger.info("DictionaryReloadService stopped")
+
+    # ------------------------------------------------------------------
+    # Reload
+    # ------------------------------------------------------------------
+
+    async def apply(self, raw_payload: str) -> bool:
+        """Switch to the announced dictionary unless already on it. Returns True on swap."""
+        payload = json.loads(raw_payload)
+        version = payload["version"]
+        async with self._lock:
+            if version == self.word_service.get_version():
+                return False
+            try:
+                loaded = await asyncio.to_thread(self.word_service.reload, payload["path"])
+            except Exception as e:
+                logger.error(f"Dictionary reload to {version} failed: {e}")
+                return False
+        if loaded != version:
+            logger.warning(
+                f"Dictionary at {payload['path']} is {loaded}, expected {version} — "
+                f"artifact changed after it was published"
+            )
+        return True
+
+    @staticmethod
+    def _published_after_bundle(raw_payload: str) -> bool:
+        # Payloads from before published_at existed count as older than any bundle
+        published_at = json.loads(raw_payload).get("published_at", 0)
+        try:
+            bundled_at = Path(settings.files.dictionary_file).stat().st_mtime
+        except OSError:
+            return True
+        if published_at <= bundled_at:
+            logger.info("Keeping the bundled dictionary; dict:current was published before it was built")
+            return False
+        return True
+
+    async def _listen(self):
+        try:
+            async for raw in self._pubsub.listen():
+                if raw["type"] != "message":
+                    continue
+                try:
+                    await self.apply(raw["data"])
+                except Exception as e:
+                    logger.error(f"Dictionary reload listener error: {e}")
+        except asyncio.CancelledError:
+            pass
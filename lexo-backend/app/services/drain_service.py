@@ -0,0 +1,91 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.domain import GameRoom
+from app.services.matchmaking_service import MatchmakingService
+from app.services.ws_bridge import WebSocketBridge
+
+logger = get_logger(__name__)
+
+_POLL_INTERVAL = 0.2
+
+# (room, peer worker id) -> True once the peer owns the room; set by the game handler
+RoomHandOff = Callable[[GameRoom, str], Awaitable[bool]]
+
+
+class WorkerDrainService:
+    """
+    Empties this worker before shutdown so deploys do not kill running games.
+    - New rooms: ``draining`` stops matching here and new queue joins are sent away.
+    - Live rooms: games within ``drain_finish_seconds`` of their end finish here;
+      the rest are handed to a peer, which replays the event log and keeps the
+      original deadline. A room only leaves once the peer has taken ownership;
+      otherwise it keeps running here, and that peer gets no further rooms.
+    - Clients: everyone still connected is told to reconnect after the
+      handoffs, so their disconnects already reach the new owners.
+    - Leftovers: rooms that never started are cancelled without a result.
+    """
+
+    def __init__(
+        self,
+        matchmaking_service: MatchmakingService,
+        bridge: WebSocketBridge,
+        hand_off: Optional[RoomHandOff] = None,
+    ):
+        self.matchmaking_service = matchmaking_service
+        self.bridge = bridge
+        self.hand_off = hand_off
+
+    def set_hand_off(self, hand_off: RoomHandOff):
+        self.hand_off = hand_off
+
+    async def drain(self, timeout: Optional[float] = None) -> Dict[str, int]:
+        """Drain until no live game is left here or ``timeout`` passes."""
+        timeout = settings.game.drain_timeout_seconds if timeout is None else timeout
+        await self.matchmaking_service.start_draining()
+        peers = await self.matchmaking_service.get_peer_workers()
+        logger.info(f"Draining worker {self.matchmaking_service.worker_id}, {len(peers)} peer(s)")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        handed_off = 0
+        attempts = 0
+        clients_told = False
+        while True:
+            # Rooms still in countdown become eligible once they start
+            for room in self.matchmaking_service.rooms:
+                if peers and self.hand_off and self._should_hand_off(room):
+                    peer = peers[attempts % len(peers)]
+                    attempts += 1
+                    if await self.hand_off(room, peer):
+                        handed_off += 1
+                    else:
+                        # Each miss costs a full ack timeout; a dead peer would miss every room
+                        peers.remove(peer)
+            if not clients_told:
+                await self.bridge.close_local({
+                    "type": "server_restarting",
+                    "message": "Sunucu yeniden başlatılıyor",
+                })
+                clients_told = True
+            live = [room for room in self.matchmaking_service.rooms if not room.game_ended]
+            if not live or loop.time() >= deadline:
+                break
+            await asyncio.sleep(_POLL_INTERVAL)
+
+        for room in self.matchmaking_service.rooms:
+            if room.game_ended or not room.game_started:
+                # Unstarted rooms have no deadline for a reaper to act on: cancel them now
+                await self.matchmaking_service.cleanup_room(room.id)
+        live = [room for room in live if room.game_started]
+        if live:
+            # Their deadlines stay in Redis; a peer's reaper finishes them once our heartbeat lapses
+            logger.warning(f"Drain timed out with {len(live)} live room(s)")
+        return {"handed_off": handed_off, "remaining": len(live)}
+
+    def _should_hand_off(self, room: GameRoom) -> bool:
+        if not room.game_started or room.game_ended:
+            return False
+        return room.get_time_remaining() > settings.game.drain_finish_seconds
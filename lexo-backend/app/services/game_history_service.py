@@ -4,9 +4,11 @@ from datetime import datetime
 
 from app.models.database import GameHistory
 from app.repositories.game_repository import GameRepository
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.exceptions import DatabaseError
 from app.core.cache import cache_invalidate_prefix
+from app.utils.game_logic import seeded_letter_pool
 
 logger = get_logger(__name__)
 
@@ -29,8 +31,20 @@ class GameHistoryService:
         duration: int,
         letter_pool: List[str],
         started_at: datetime,
-        ended_at: datetime
+        ended_at: datetime,
+        pool_seed: Optional[int] = None,
+        pool_generator_version: Optional[int] = None,
     ) -> GameHistory:
+        """
+        Seeded games store ``(pool_seed, pool_generator_version, pool_size)``
+        instead of the letters, unless HISTORY_STORE_LETTER_POOL keeps both
+        (e.g. while verifying regeneration with app.tools.verify_pool_seeds).
+        """
+        pool_size = None
+        if pool_seed is not None:
+            pool_size = len(letter_pool)
+            if not settings.game.history_store_letter_pool:
+                letter_pool = None
         try:
             return await self.game_repo.create_game(
                 room_id=room_id,
@@ -44,7 +58,10 @@ class GameHistoryService:
                 duration=duration,
                 letter_pool=letter_pool,
                 started_at=started_at,
-                ended_at=ended_at
+                ended_at=ended_at,
+                pool_seed=pool_seed,
+                pool_generator_version=pool_generator_version,
+                pool_size=pool_size,
             )
         except Exception as e:
             logger.error(f"Error creating game history for room {room_id}: {e}")
@@ -58,3 +75,11 @@ class GameHistoryService:
 
     async def get_game_by_room_id(self, room_id: str) -> Optional[GameHistory]:
         return await self.game_repo.get_by_room_id(room_id)
+
+    @staticmethod
+    def get_letter_pool(game: GameHistory) -> List[str]:
+        """Initial letter pool of a stored game, regenerated from its seed when present."""
+        if game.pool_seed is not None:
+            pool, _ = seeded_letter_pool(game.pool_seed, game.pool_size, game.pool_generator_version)
+            return pool
+        return [letter for letter in (game.letter_pool or "").split(",") if letter]
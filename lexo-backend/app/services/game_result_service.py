@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Optional
+
+from app.database.session import AsyncSessionLocal
+from app.models.domain import GameRoom
+from app.services.game_history_service import GameHistoryService
+from app.services.stats_service import StatsService
+from app.services.user_service import UserService
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def save_game_result(
+    room: GameRoom, winner_name: Optional[str], ended_at: Optional[datetime] = None
+):
+    """
+    Write a finished game to history and both players' stats. Callers make sure
+    this runs once per room (see MatchmakingService.claim_game_save).
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            user_service = UserService(db)
+            stats_service = StatsService(db)
+            game_history_service = GameHistoryService(db)
+
+            player1 = await user_service.get_user_by_supabase_id(room.player1.id)
+            player2 = await user_service.get_user_by_supabase_id(room.player2.id)
+            if not player1 or not player2:
+                logger.error(f"Cannot save game {room.id}: player not found")
+                return
+
+            winner_id = None
+            if winner_name == room.player1.username:
+                winner_id = player1.id
+            elif winner_name == room.player2.username:
+                winner_id = player2.id
+
+            await game_history_service.create_game_history(
+                room_id=room.id,
+                player1_id=player1.id,
+                player2_id=player2.id,
+                player1_score=room.player1.score,
+                player2_score=room.player2.score,
+                player1_words=room.player1.words,
+                player2_words=room.player2.words,
+                winner_id=winner_id,
+                duration=room.duration,
+                letter_pool=room.initial_letter_pool,
+                started_at=room.start_time or datetime.now(),
+                ended_at=ended_at or datetime.now(),
+                pool_seed=room.pool_seed,
+                pool_generator_version=room.pool_generator_version,
+            )
+
+            await stats_service.update_stats_after_game(
+                user_id=player1.id,
+                score=room.player1.score,
+                words=room.player1.words,
+                won=winner_id == player1.id if winner_id else False,
+                tied=winner_id is None,
+                game_duration=room.duration,
+            )
+            await stats_service.update_stats_after_game(
+                user_id=player2.id,
+                score=room.player2.score,
+                words=room.player2.words,
+                won=winner_id == player2.id if winner_id else False,
+                tied=winner_id is None,
+                game_duration=room.duration,
+            )
+            logger.info(f"Saved game {room.id} to database")
+    except Exception as e:
+        logger.error(f"Error saving game {room.id}: {e}")
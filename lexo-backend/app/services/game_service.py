@@ -1,11 +1,16 @@
-from typing import Dict
+from typing import Dict, Optional
 import uuid
 
+from app.core.prefix_index import PrefixIndex
+from app.services.room_event_log import word_event
 from app.models.domain import Player, GameRoom
 from app.services.word_service import WordService
+from app.services.pool_bank_service import PoolBankService
 from app.utils.game_logic import (
-    generate_balanced_letter_pool,
-    calculate_word_score,
+    POOL_GENERATOR_VERSION,
+    generate_replacement_letters,
+    new_pool_seed,
+    seeded_letter_pool,
     validate_word_length,
     has_letters_in_pool
 )
@@ -17,8 +22,9 @@ logger = get_logger(__name__)
 
 class GameService:
 
-    def __init__(self, word_service: WordService):
+    def __init__(self, word_service: WordService, pool_bank: Optional[PoolBankService] = None):
         self.word_service = word_service
+        self.pool_bank = pool_bank
     
     def create_game_room(
         self, 
@@ -29,9 +35,15 @@ class GameService:
         duration = settings.game.default_duration
         room = GameRoom(room_id, player1, player2, duration)
         
-        pool_size = settings.game.letter_pool_size
-        letter_pool = generate_balanced_letter_pool(pool_size)
+        seed = self.pool_bank.pop() if self.pool_bank else None
+        if seed is None:
+            logger.debug("Pool bank empty — generating letter pool inline")
+            seed = new_pool_seed()
+        letter_pool, _ = seeded_letter_pool(seed, settings.game.letter_pool_size)
         room.set_letter_pool(letter_pool)
+        room.pool_seed = seed
+        room.pool_generator_version = POOL_GENERATOR_VERSION
+        room.dictionary = self.word_service.get_dictionary()
         
         logger.info(f"Created game room {room_id} with {len(letter_pool)} letters")
         return room
@@ -58,7 +70,7 @@ class GameService:
                 'message': 'Havuzda yeterli harf yok'
             }
         
-        if not self.word_service.is_valid_word(word):
+        if not self.word_service.is_valid_word(word, room.dictionary):
             return {
                 'valid': False,
                 'message': 'Geçerli bir Türkçe kelime değil'
@@ -69,6 +81,32 @@ class GameService:
             'message': 'Kelime geçerli'
         }
     
+    def build_prefix_index(self, room: GameRoom) -> PrefixIndex:
+        """
+        (Re)build the room's prefix index (~1ms). Built lazily by the first
+        ``check_prefix`` after a pool change, so rooms whose players never
+        ask for typing feedback never hold one.
+        """
+        words = self.word_service.find_playable_words(room.letter_pool, dictionary=room.dictionary)
+        room.prefix_index = PrefixIndex(word for word in words if word not in room.used_words)
+        return room.prefix_index
+    
+    def check_prefix(self, room: GameRoom, prefix: str) -> Dict[str, any]:
+        """
+        Whether a typed prefix can still become an unused, playable word from
+        the room's pool. Cheap enough to call on every keystroke.
+        """
+        prefix_lower = prefix.lower()
+        index = room.prefix_index
+        if index is None:
+            index = self.build_prefix_index(room)
+        viable, complete = index.lookup(prefix_lower)
+        return {
+            'prefix': prefix_lower,
+            'viable': viable,
+            'complete': complete,
+        }
+    
     def process_word_submission(
         self, 
         room: GameRoom, 
@@ -76,7 +114,7 @@ class GameService:
         word: str
     ) -> Dict[str, any]:
         word_lower = word.lower()
-        score = calculate_word_score(word)
+        score = self.word_service.get_word_score(word_lower)
         
         room.add_used_word(word_lower)
         
@@ -85,10 +123,25 @@ class GameService:
         
         logger.info(f"{player.username} played word: {word_lower} (+{score} points)")
         
-        return {
+        result = {
             'word': word_lower,
             'score': score,
             'total_score': player.score,
-            'letter_pool': room.letter_pool,
             'scores': room.get_scores()
         }
+        if room.pool_mode == 'consumable':
+            replacements = generate_replacement_letters(len(word_lower), room.refill_rng)
+            changes = room.exchange_letters(word_lower, replacements)
+            result['pool_delta'] = [[position, letter] for position, letter in changes]
+            result['pool_version'] = room.pool_version
+        else:
+            result['letter_pool'] = room.letter_pool.to_list()
+        room.pending_events.append(word_event(player, result))
+        return result
+    
+    @staticmethod
+    def pool_update(result: Dict[str, any]) -> Dict[str, any]:
+        """Pool fields for word broadcasts: full pool when static, changed tiles when consumable."""
+        if 'pool_delta' in result:
+            return {'pool_delta': result['pool_delta'], 'pool_version': result['pool_version']}
+        return {'letter_pool': result['letter_pool']}
@@ -0,0 +1,37 @@
+import bisect
+import hashlib
+from typing import Iterable, List, Optional, Tuple
+
+_REPLICAS = 64
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring over worker ids.
+
+    Each worker owns ``replicas`` points so rooms spread evenly, and a worker
+    joining or leaving only moves the rooms between its points and the
+    previous ones (about 1/N of them) instead of reshuffling everything.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = _REPLICAS):
+        self.replicas = replicas
+        self.nodes = frozenset(nodes)
+        points: List[Tuple[int, str]] = sorted(
+            (_hash(f"{node}#{i}"), node) for node in self.nodes for i in range(replicas)
+        )
+        self._hashes = [h for h, _ in points]
+        self._owners = [node for _, node in points]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def node_for(self, key: str) -> Optional[str]:
+        if not self._hashes:
+            return None
+        i = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._owners[i]
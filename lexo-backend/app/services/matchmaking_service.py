@@ -1,19 +1,33 @@
 import json
+import random
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 
 import redis.asyncio as aioredis
+from redis.exceptions import WatchError
 
 from app.models.domain import Player, GameRoom
 from app.services.game_service import GameService
+from app.services.hash_ring import HashRing
+from app.services.room_event_log import RoomEventLog
+from app.services.room_registry import RoomRegistry
+from app.services.timer_service import TimerService
+from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 _QUEUE_KEY = "mm:queue"
+# Room id -> wall-clock end time of every running game on any worker
+_DEADLINES_KEY = "mm:deadlines"
+# Worker id -> wall-clock expiry of its last heartbeat; live members are read by score, never SCANned
+_WORKERS_KEY = "mm:workers"
 _ROOM_TTL = 7200   # 2 hours
 _INVITE_TTL = 300  # 5 minutes
+_HANDOFF_TTL = 60  # offer to a peer outlives any ack wait
+_BOT_NAMES = ["Kelimatör", "Harfçi", "Sözcük Ustası", "Lexo Bot"]
 
 # Atomic Lua: pop front player, find a different player, return both or push back.
 _LUA_MATCH = """
@@ -41,8 +55,19 @@ class MatchmakingService:
         self.redis = redis
         self.worker_id: str = ""  # set by main.py after init
 
-        # In-memory: rooms owned by this worker
-        self.active_rooms: Dict[str, GameRoom] = {}
+        # In-memory: rooms owned by this worker, indexed by id, player and expiry
+        self.rooms = RoomRegistry()
+        # Game-end and reconnect-grace deadlines for those rooms
+        self.timers = TimerService()
+        # Per-room event stream in Redis: reconnects and takeovers rebuild rooms from it
+        self.room_log = RoomEventLog(redis)
+        # Set on shutdown: no new rooms here, live ones finish or move to a peer
+        self.draining = False
+        # Where clients reach this worker directly; sent as the reconnect hint for its rooms
+        self.endpoint = settings.websocket.public_url
+        # Live workers and the consistent-hash ring that places rooms on them
+        self.workers: Dict[str, str] = {}
+        self.ring = HashRing()
 
     # ------------------------------------------------------------------
     # Queue
@@ -50,7 +75,7 @@ class MatchmakingService:
 
     async def add_to_queue(self, player_id: str, username: str) -> int:
         await self.remove_from_queue_by_id(player_id)
-        entry = json.dumps({"id": player_id, "username": username})
+        entry = json.dumps({"id": player_id, "username": username, "joined_at": time.time()})
         await self.redis.rpush(_QUEUE_KEY, entry)
         length = await self.redis.llen(_QUEUE_KEY)
         logger.info(f"Player {username} ({player_id}) joined queue — depth {length}")
@@ -68,9 +93,18 @@ class MatchmakingService:
         items = await self.redis.lrange(_QUEUE_KEY, 0, -1)
         return any(json.loads(i).get("id") == player_id for i in items)
 
-    async def try_match_players(self) -> Optional[GameRoom]:
+    async def try_match_players(self, bot_fallback_for: Optional[str] = None) -> Optional[GameRoom]:
+        """
+        Pair the two oldest queued players. With ``bot_fallback_for``, a player
+        connected to this worker who has waited alone long enough gets a bot instead.
+        A draining worker leaves the queue to its peers.
+        """
+        if self.draining:
+            return None
         result = await self.redis.eval(_LUA_MATCH, 1, _QUEUE_KEY)
         if not result:
+            if bot_fallback_for and settings.game.bot_enabled:
+                return await self.try_match_bot(bot_fallback_for)
             return None
         p1 = json.loads(result[0])
         p2 = json.loads(result[1])
@@ -78,18 +112,39 @@ class MatchmakingService:
         logger.info(f"Matched {p1['username']} vs {p2['username']} in room {room.id}")
         return room
 
+    async def try_match_bot(self, player_id: str) -> Optional[GameRoom]:
+        """Match ``player_id`` against a bot if they are alone in the queue and waited long enough."""
+        items = await self.redis.lrange(_QUEUE_KEY, 0, -1)
+        if len(items) != 1:
+            return None
+        entry = json.loads(items[0])
+        if entry.get("id") != player_id:
+            return None
+        waited = time.time() - entry.get("joined_at", time.time())
+        if waited < settings.game.bot_match_after_seconds:
+            return None
+        if not await self.redis.lrem(_QUEUE_KEY, 1, items[0]):
+            return None  # matched by another worker in the meantime
+        bot_id = f"bot:{uuid.uuid4().hex}"
+        room = await self._create_and_register_room(
+            entry["id"], entry["username"], bot_id, random.choice(_BOT_NAMES), bot_opponent=True
+        )
+        logger.info(f"Matched {entry['username']} vs bot after {waited:.0f}s in room {room.id}")
+        return room
+
     # ------------------------------------------------------------------
     # Rooms
     # ------------------------------------------------------------------
 
     async def _create_and_register_room(
-        self, p1_id: str, p1_name: str, p2_id: str, p2_name: str
+        self, p1_id: str, p1_name: str, p2_id: str, p2_name: str, bot_opponent: bool = False
     ) -> GameRoom:
         player1 = Player(p1_id, p1_name)
-        player2 = Player(p2_id, p2_name)
+        player2 = Player(p2_id, p2_name, is_bot=bot_opponent)
         room_id = str(uuid.uuid4())
         room = self.game_service.create_game_room(room_id, player1, player2)
-        self.active_rooms[room_id] = room
+        await self.sweep_expired_rooms()
+        self.rooms.add(room, time.monotonic() + _ROOM_TTL)
         await self._register_room_in_redis(room)
         return room
 
@@ -102,48 +157,265 @@ class MatchmakingService:
 
     async def _register_room_in_redis(self, room: GameRoom):
         pipe = self.redis.pipeline()
-        pipe.set(f"mm:player:{room.player1.id}:room", room.id, ex=_ROOM_TTL)
-        pipe.set(f"mm:player:{room.player2.id}:room", room.id, ex=_ROOM_TTL)
+        for player in (room.player1, room.player2):
+            if not player.is_bot:
+                pipe.set(f"mm:player:{player.id}:room", room.id, ex=_ROOM_TTL)
         pipe.set(f"mm:room:{room.id}:worker", self.worker_id, ex=_ROOM_TTL)
+        self.room_log.append_created(pipe, room)
         await pipe.execute()
-        await self._snapshot_room(room)
-
-    async def _snapshot_room(self, room: GameRoom):
-        """Write reconnect state to Redis — any worker can serve a reconnect."""
-        await self.redis.hset(f"mm:room:{room.id}", mapping=room.to_snapshot())
-        await self.redis.expire(f"mm:room:{room.id}", _ROOM_TTL)
 
     def get_room(self, room_id: str) -> Optional[GameRoom]:
-        return self.active_rooms.get(room_id)
+        return self.rooms.get(room_id)
 
     def get_room_by_player(self, player_id: str) -> Optional[GameRoom]:
         """Local in-memory lookup only."""
-        for room in self.active_rooms.values():
-            if room.player1.id == player_id or room.player2.id == player_id:
-                return room
-        return None
+        return self.rooms.get_by_player(player_id)
 
     async def get_room_id_from_redis(self, player_id: str) -> Optional[str]:
         return await self.redis.get(f"mm:player:{player_id}:room")
 
+    async def get_room_worker(self, room_id: str) -> Optional[str]:
+        """Worker that owns the room and runs its game loop."""
+        return await self.redis.get(f"mm:room:{room_id}:worker")
+
+    async def load_room(self, room_id: str) -> Optional[GameRoom]:
+        """Rebuild any worker's room from its event log."""
+        return await self.room_log.load(room_id)
+
     async def get_room_snapshot(self, room_id: str) -> Optional[Dict]:
-        data = await self.redis.hgetall(f"mm:room:{room_id}")
-        return data if data else None
+        room = await self.load_room(room_id)
+        return room.to_snapshot() if room else None
 
     async def is_player_busy(self, player_id: str) -> bool:
         return bool(await self.redis.exists(f"mm:player:{player_id}:room"))
 
     async def cleanup_room(self, room_id: str):
-        room = self.active_rooms.pop(room_id, None)
+        room = self.rooms.remove(room_id)
         if room:
+            self.timers.cancel(f"{room_id}:end")
+            for player in (room.player1, room.player2):
+                self.timers.cancel(f"{room_id}:grace:{player.id}")
             pipe = self.redis.pipeline()
             pipe.delete(f"mm:player:{room.player1.id}:room")
             pipe.delete(f"mm:player:{room.player2.id}:room")
             pipe.delete(f"mm:room:{room_id}:worker")
-            pipe.delete(f"mm:room:{room_id}")
+            pipe.delete(f"mm:room:{room_id}:handoff")
+            self.room_log.close(pipe, room_id, room.get_winner() if room.game_ended else None)
+            pipe.zrem(_DEADLINES_KEY, room_id)
             await pipe.execute()
             logger.info(f"Cleaned up room {room_id}")
 
+    async def schedule_game_end(self, room: GameRoom, callback: Callable[[], Awaitable[None]]):
+        """Arm the local game-end timer and record the deadline where other workers can see it."""
+        deadline = room.started_wall + room.duration
+        # From the wall-clock start, so a room adopted mid-game keeps its original end
+        self.timers.call_later(f"{room.id}:end", max(0.0, deadline - time.time()), callback)
+        await self.redis.zadd(_DEADLINES_KEY, {room.id: deadline})
+
+    async def clear_game_deadline(self, room_id: str):
+        await self.redis.zrem(_DEADLINES_KEY, room_id)
+
+    async def claim_game_save(self, room_id: str) -> bool:
+        """True for exactly one caller per room, across workers."""
+        return bool(await self.redis.set(f"mm:room:{room_id}:saved", self.worker_id, nx=True, ex=_ROOM_TTL))
+
+    def schedule_grace_timeout(
+        self, room: GameRoom, player_id: str, callback: Callable[[], Awaitable[None]]
+    ):
+        self.timers.call_later(f"{room.id}:grace:{player_id}", room.reconnect_grace_period, callback)
+
+    def cancel_grace_timeout(self, room: GameRoom, player_id: str) -> bool:
+        return self.timers.cancel(f"{room.id}:grace:{player_id}")
+
+    async def sweep_expired_rooms(self) -> int:
+        """Drop local rooms whose Redis keys have outlived _ROOM_TTL (leaked by a lost timer)."""
+        expired = self.rooms.pop_expired(time.monotonic())
+        for room in expired:
+            logger.warning(f"Room {room.id} expired without cleanup — removing")
+            room.end_game()
+            await self.cleanup_room(room.id)
+        return len(expired)
+
+    # ------------------------------------------------------------------
+    # Placement and handoff between workers
+    # ------------------------------------------------------------------
+
+    async def refresh_workers(self) -> Dict[str, str]:
+        """
+        Re-read the live, non-draining workers (id -> public endpoint) from
+        the heartbeat ZSET and rebuild the placement ring if membership changed.
+        Only workers with a public endpoint join the ring: players cannot be
+        sent to the others, so a room placed there would be proxied for its
+        whole life. All live workers stay eligible as drain peers.
+        """
+        worker_ids = await self.redis.zrangebyscore(_WORKERS_KEY, time.time(), "+inf")
+        pipe = self.redis.pipeline(transaction=False)
+        for worker_id in worker_ids:
+            pipe.hgetall(f"mm:worker:{worker_id}")
+        workers = {}
+        for worker_id, fields in zip(worker_ids, await pipe.execute()):
+            if fields and fields.get("draining") != "1":
+                workers[worker_id] = fields.get("endpoint", "")
+        self.workers = workers
+        reachable = frozenset(worker_id for worker_id, endpoint in workers.items() if endpoint)
+        if self.ring.nodes != reachable:
+            self.ring = HashRing(reachable)
+        return workers
+
+    async def get_peer_workers(self) -> List[str]:
+        """Other workers that can take rooms."""
+        workers = await self.refresh_workers()
+        return sorted(worker_id for worker_id in workers if worker_id != self.worker_id)
+
+    def place_room(self, room: GameRoom) -> str:
+        """
+        Worker that should own ``room``: the ring owner of its id, so players
+        told to reconnect there share a worker with the room. Bot games stay
+        with the one human, who is already connected here, and so does every
+        room when either side has no public endpoint to send players to.
+        """
+        if room.has_bot or not self.endpoint:
+            return self.worker_id
+        owner = self.ring.node_for(room.id)
+        if not owner or not self.get_worker_endpoint(owner):
+            return self.worker_id
+        return owner
+
+    def get_worker_endpoint(self, worker_id: str) -> str:
+        return self.workers.get(worker_id, "")
+
+    async def start_draining(self):
+        """Stop taking rooms and tell peers to leave this worker off their rings."""
+        self.draining = True
+        key = f"mm:worker:{self.worker_id}"
+        if await self.redis.exists(key):
+            await self.redis.hset(key, "draining", "1")
+
+    async def release_room(self, room: GameRoom):
+        """
+        Stop running a room here without ending it: its timers are dropped and
+        its pending events written, so the adopting worker replays the full game.
+        """
+        self.timers.cancel(f"{room.id}:end")
+        for player_id in self.rooms.players(room):
+            self.cancel_grace_timeout(room, player_id)
+        await self.room_log.flush(room)
+        self.rooms.remove(room.id)
+
+    def reclaim_room(self, room: GameRoom):
+        """Keep running a released room here after no peer took it."""
+        self.rooms.add(room, time.monotonic() + _ROOM_TTL)
+
+    async def offer_room(self, room_id: str, peer: str):
+        """Name ``peer`` as the only worker allowed to take a released room."""
+        await self.redis.set(f"mm:room:{room_id}:handoff", peer, ex=_HANDOFF_TTL)
+
+    async def adopt_room(self, room_id: str, from_worker: str) -> Optional[GameRoom]:
+        """
+        Rebuild a room ``from_worker`` offered here and take over as its owner.
+        Ownership moves with WATCH on the owner and offer keys, so a late adopt
+        cannot steal a room its old owner already settled back.
+        """
+        room = await self.load_room(room_id)
+        if room is None or room.game_ended:
+            return None
+        worker_key, offer_key = f"mm:room:{room_id}:worker", f"mm:room:{room_id}:handoff"
+        async with self.redis.pipeline() as pipe:
+            try:
+                await pipe.watch(worker_key, offer_key)
+                if await pipe.get(worker_key) != from_worker or await pipe.get(offer_key) != self.worker_id:
+                    await pipe.unwatch()
+                    return None
+                pipe.multi()
+                pipe.set(worker_key, self.worker_id, ex=_ROOM_TTL)
+                pipe.delete(offer_key)
+                await pipe.execute()
+            except WatchError:
+                return None
+        self.rooms.add(room, time.monotonic() + _ROOM_TTL)
+        logger.info(f"Adopted room {room_id} from worker {from_worker}")
+        return room
+
+    async def settle_handoff(self, room_id: str, peer: str) -> bool:
+        """
+        Close an offer made by ``offer_room``: True if ``peer`` took the room,
+        False if the offer was withdrawn and the room is still ours.
+        """
+        worker_key, offer_key = f"mm:room:{room_id}:worker", f"mm:room:{room_id}:handoff"
+        async with self.redis.pipeline() as pipe:
+            while True:
+                try:
+                    await pipe.watch(worker_key, offer_key)
+                    if await pipe.get(worker_key) == peer:
+                        await pipe.unwatch()
+                        return True
+                    pipe.multi()
+                    pipe.delete(offer_key)
+                    await pipe.execute()
+                    return False
+                except WatchError:
+                    continue  # the peer moved one of the keys; look again
+
+    # ------------------------------------------------------------------
+    # Orphaned rooms (owner worker died mid-game)
+    # ------------------------------------------------------------------
+
+    async def heartbeat(self, ttl: int):
+        """Mark this worker alive; rooms of a worker without a heartbeat can be claimed."""
+        key = f"mm:worker:{self.worker_id}"
+        now = time.time()
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(key, mapping={"endpoint": self.endpoint, "draining": "1" if self.draining else "0"})
+        pipe.expire(key, ttl)
+        pipe.zadd(_WORKERS_KEY, {self.worker_id: now + ttl})
+        pipe.zremrangebyscore(_WORKERS_KEY, "-inf", now)
+        await pipe.execute()
+
+    async def get_overdue_rooms(self, before: float, limit: int = 100) -> List[str]:
+        return await self.redis.zrangebyscore(_DEADLINES_KEY, "-inf", before, start=0, num=limit)
+
+    async def claim_orphaned_room(self, room_id: str, lease_seconds: int) -> bool:
+        """
+        Take the ``mm:room:{id}:worker`` lease if its holder has no heartbeat.
+        WATCH makes the check-and-set atomic against other claimers.
+        """
+        worker_key = f"mm:room:{room_id}:worker"
+        async with self.redis.pipeline() as pipe:
+            try:
+                await pipe.watch(worker_key)
+                owner = await pipe.get(worker_key)
+                if owner == self.worker_id or (owner and await pipe.exists(f"mm:worker:{owner}")):
+                    await pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.set(worker_key, self.worker_id, ex=lease_seconds)
+                await pipe.execute()
+                return True
+            except WatchError:
+                return False
+
+    async def finalize_orphaned_room(self, room_id: str) -> Optional[GameRoom]:
+        """
+        Rebuild a claimed room from its event log, end it and drop its Redis state.
+        Returns None if there was nothing left to finalize.
+        """
+        room = await self.load_room(room_id)
+        pipe = self.redis.pipeline()
+        pipe.zrem(_DEADLINES_KEY, room_id)
+        pipe.delete(f"mm:room:{room_id}:worker")
+        if room is None:
+            await pipe.execute()
+            return None
+        room.end_game()
+        self.room_log.close(pipe, room_id, room.get_winner())
+        for player in (room.player1, room.player2):
+            # The player may already be in a newer room
+            if await self.redis.get(f"mm:player:{player.id}:room") == room_id:
+                pipe.delete(f"mm:player:{player.id}:room")
+        await pipe.execute()
+        logger.info(f"Finalized orphaned room {room_id}")
+        return room
+
     # ------------------------------------------------------------------
     # Friend invites (Redis-backed)
     # ------------------------------------------------------------------
@@ -262,7 +534,8 @@ class MatchmakingService:
 
     def get_stats(self) -> Dict:
         return {
-            "active_rooms": len(self.active_rooms),
+            **self.rooms.counts(),
+            "pending_timers": self.timers.pending(),
             "waiting_players": -1,  # async — read from Redis if needed
         }
 
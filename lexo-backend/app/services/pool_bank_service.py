@@ -0,0 +1,151 @@
+import asyncio
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.word_service import WordService
+from app.utils.game_logic import POOL_GENERATOR_VERSION, new_pool_seed, seeded_letter_pool
+
+logger = get_logger(__name__)
+
+_BANK_KEY = "pool:bank"
+_IDLE_SECONDS = 5.0
+
+
+def _bank_entry(seed: int) -> str:
+    return f"{POOL_GENERATOR_VERSION}:{settings.game.letter_pool_size}:{seed}"
+
+
+def _parse_bank_entry(entry: str) -> Optional[int]:
+    """Seed of a bank entry, or None if it was banked by another generator or pool size."""
+    version, size, seed = entry.split(":")
+    if int(version) != POOL_GENERATOR_VERSION or int(size) != settings.game.letter_pool_size:
+        return None
+    return int(seed)
+
+
+class PoolBankService:
+    """
+    Keeps a bank of letter-pool seeds whose pools passed a quality bar, so room
+    creation never has to score a pool inline (regenerating from a seed is cheap).
+    - Shared bank: Redis list filled by every worker's producer task.
+    - Local buffer: small in-process deque, popped synchronously in O(1).
+    """
+
+    def __init__(self, word_service: WordService, redis: aioredis.Redis):
+        self.word_service = word_service
+        self.redis = redis
+        self._ready: Deque[int] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        self._task = asyncio.create_task(self._produce())
+        logger.info("PoolBankService producer started")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("PoolBankService producer stopped")
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    def pop(self) -> Optional[int]:
+        """Take a ready pool seed from the local buffer, or None if it is empty."""
+        self._wakeup.set()
+        if not self._ready:
+            return None
+        return self._ready.popleft()
+
+    def local_depth(self) -> int:
+        return len(self._ready)
+
+    async def get_bank_depth(self) -> int:
+        return await self.redis.llen(_BANK_KEY)
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def score_pool(self, letter_pool: List[str]) -> Tuple[int, int]:
+        """(number of playable words, sum of their scores) for a pool."""
+        return self.word_service.score_letter_pool(letter_pool)
+
+    def is_acceptable(self, word_count: int, total_score: int) -> bool:
+        return (
+            word_count >= settings.game.pool_min_words
+            and total_score >= settings.game.pool_min_total_score
+        )
+
+    def generate_candidate(self) -> Optional[int]:
+        """A fresh seed whose pool meets the quality bar, or None."""
+        seed = new_pool_seed()
+        pool, _ = seeded_letter_pool(seed, settings.game.letter_pool_size)
+        if self.is_acceptable(*self.score_pool(pool)):
+            return seed
+        return None
+
+    # ------------------------------------------------------------------
+    # Producer
+    # ------------------------------------------------------------------
+
+    async def _produce(self):
+        while True:
+            try:
+                worked = await self._fill_bank()
+                worked = await self._fill_local_buffer() or worked
+                if not worked:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=_IDLE_SECONDS)
+                    except asyncio.TimeoutError:
+                        pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Pool bank producer error: {e}")
+                await asyncio.sleep(_IDLE_SECONDS)
+
+    async def _fill_bank(self) -> bool:
+        missing = settings.game.pool_bank_size - await self.redis.llen(_BANK_KEY)
+        if missing <= 0:
+            return False
+        accepted = []
+        attempts = 0
+        batch = min(missing, settings.game.pool_bank_batch_size)
+        while len(accepted) < batch and attempts < batch * 20:
+            attempts += 1
+            seed = self.generate_candidate()
+            if seed is not None:
+                accepted.append(_bank_entry(seed))
+            await asyncio.sleep(0)  # scoring is CPU-bound; yield between candidates
+        if accepted:
+            await self.redis.rpush(_BANK_KEY, *accepted)
+            logger.debug(f"Pool bank: accepted {len(accepted)}/{attempts} candidates")
+        else:
+            logger.warning(f"Pool bank: no candidate out of {attempts} met the quality thresholds")
+        return bool(accepted)
+
+    async def _fill_local_buffer(self) -> bool:
+        missing = settings.game.pool_bank_local_buffer - len(self._ready)
+        if missing <= 0:
+            return False
+        items = await self.redis.lpop(_BANK_KEY, missing)
+        for item in items or []:
+            seed = _parse_bank_entry(item)
+            if seed is not None:
+                self._ready.append(seed)
+        return bool(items)
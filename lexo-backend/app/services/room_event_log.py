@@ -0,0 +1,140 @@
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.models.domain import GameRoom, Player
+from app.utils.game_logic import generate_replacement_letters
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_LOG_TTL = 7200        # matches the room keys while the game is live
+_LOG_RETENTION = 600   # ended games stay readable this long as an audit trail
+
+EVENT_CREATED = "created"
+EVENT_STARTED = "started"
+EVENT_WORD = "word"
+EVENT_DISCONNECT = "disconnect"
+EVENT_RECONNECT = "reconnect"
+EVENT_ENDED = "ended"
+
+
+def room_log_key(room_id: str) -> str:
+    return f"mm:room:{room_id}:events"
+
+
+def created_event(room: GameRoom) -> Dict[str, str]:
+    """The one full-state event; everything after it is a small delta."""
+    return {"type": EVENT_CREATED, **room.to_snapshot()}
+
+
+def started_event(room: GameRoom) -> Dict[str, str]:
+    return {"type": EVENT_STARTED, "at": repr(room.started_wall)}
+
+
+def word_event(player: Player, result: Dict) -> Dict[str, str]:
+    event = {"type": EVENT_WORD, "player": player.id, "word": result["word"], "score": str(result["score"])}
+    if "pool_delta" in result:
+        event["refill"] = "".join(letter for _, letter in result["pool_delta"])
+    return event
+
+
+def player_event(kind: str, player_id: str) -> Dict[str, str]:
+    return {"type": kind, "player": player_id}
+
+
+def ended_event(winner: Optional[str]) -> Dict[str, str]:
+    return {"type": EVENT_ENDED, "winner": winner or ""}
+
+
+def replay(events: Iterable[Dict[str, str]]) -> Optional[GameRoom]:
+    """Fold a room's events, oldest first, back into a GameRoom (None without a created event)."""
+    room: Optional[GameRoom] = None
+    for event in events:
+        kind = event.get("type")
+        if kind == EVENT_CREATED:
+            room = GameRoom.from_snapshot(event)
+        elif room is None:
+            continue
+        elif kind == EVENT_STARTED:
+            room.game_started = True
+            room.started_wall = float(event["at"])
+            room.started_monotonic = time.monotonic() - (time.time() - room.started_wall)
+        elif kind == EVENT_WORD:
+            player = room.get_player(event["player"])
+            word = event["word"]
+            room.add_used_word(word)
+            player.add_score(int(event["score"]))
+            player.add_word(word)
+            refill = event.get("refill")
+            if refill:
+                room.exchange_letters(word, list(refill))
+                # Keep the seeded stream in step so a takeover draws the same next tiles
+                generate_replacement_letters(len(refill), room.refill_rng)
+        elif kind in (EVENT_DISCONNECT, EVENT_RECONNECT):
+            player = room.get_player(event["player"])
+            if player:
+                player.connected = kind == EVENT_RECONNECT
+        elif kind == EVENT_ENDED:
+            room.end_game()
+    return room
+
+
+class RoomEventLog:
+    """
+    Per-room Redis stream of game events (created, started, word, disconnect,
+    reconnect, ended). GameService queues word events on the room as it
+    processes them; ``flush`` writes them. Any worker rebuilds the room with ``load``.
+    """
+
+    def __init__(self, redis: aioredis.Redis):
+        self.redis = redis
+
+    def append_created(self, pipe, room: GameRoom):
+        """Queue the created event on ``pipe`` next to the rest of room registration."""
+        pipe.xadd(room_log_key(room.id), created_event(room))
+        pipe.expire(room_log_key(room.id), _LOG_TTL)
+
+    async def flush(self, room: GameRoom):
+        """
+        Write the room's pending events and refresh the log's TTL in one round
+        trip; cost depends only on the new events, never on the game so far.
+        """
+        if not room.pending_events:
+            return
+        events, room.pending_events = room.pending_events, []
+        key = room_log_key(room.id)
+        pipe = self.redis.pipeline(transaction=False)
+        for event in events:
+            # NOMKSTREAM: a late event for a room that is already gone must not recreate its log
+            pipe.xadd(key, event, nomkstream=True)
+        pipe.expire(key, _LOG_TTL)
+        await pipe.execute()
+
+    async def record(self, room: GameRoom, event: Dict[str, str]):
+        room.pending_events.append(event)
+        await self.flush(room)
+
+    async def started(self, room: GameRoom):
+        await self.record(room, started_event(room))
+
+    async def disconnected(self, room: GameRoom, player_id: str):
+        await self.record(room, player_event(EVENT_DISCONNECT, player_id))
+
+    async def reconnected(self, room: GameRoom, player_id: str):
+        await self.record(room, player_event(EVENT_RECONNECT, player_id))
+
+    def close(self, pipe, room_id: str, winner: Optional[str] = None):
+        """Queue the ended event and shorten the stream's lifetime to the audit window."""
+        pipe.xadd(room_log_key(room_id), ended_event(winner), nomkstream=True)
+        pipe.expire(room_log_key(room_id), _LOG_RETENTION)
+
+    async def read(self, room_id: str) -> List[Tuple[str, Dict[str, str]]]:
+        return await self.redis.xrange(room_log_key(room_id))
+
+    async def load(self, room_id: str) -> Optional[GameRoom]:
+        entries = await self.read(room_id)
+        if not entries:
+            return None
+        return replay(fields for _, fields in entries)
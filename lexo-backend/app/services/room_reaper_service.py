@@ -0,0 +1,106 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.domain import GameRoom
+from app.services.game_result_service import save_game_result
+from app.services.matchmaking_service import MatchmakingService
+from app.services.ws_bridge import WebSocketBridge
+
+logger = get_logger(__name__)
+
+GameSaver = Callable[[GameRoom, Optional[str], Optional[datetime]], Awaitable[None]]
+
+
+class RoomReaperService:
+    """
+    Ends and saves games whose owning worker died before their deadline.
+    - Heartbeat: ``mm:worker:{id}`` proves this worker still owns its rooms and
+      its score in the ``mm:workers`` ZSET lists it as live; each beat also
+      refreshes the worker ring used for room placement.
+    - Reaping: overdue entries of the deadline ZSET whose owner has no heartbeat
+      are leased via ``mm:room:{id}:worker``, rebuilt by replaying the room's
+      event log (``RoomEventLog.replay``) and saved once (``claim_game_save`` guards against the owner coming back).
+    """
+
+    def __init__(
+        self,
+        matchmaking_service: MatchmakingService,
+        bridge: WebSocketBridge,
+        save_game: GameSaver = save_game_result,
+    ):
+        self.matchmaking_service = matchmaking_service
+        self.bridge = bridge
+        self.save_game = save_game
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def lease_seconds(self) -> int:
+        return 3 * settings.game.orphan_reap_interval_seconds
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        await self.matchmaking_service.heartbeat(self.lease_seconds)
+        await self.matchmaking_service.refresh_workers()
+        self._task = asyncio.create_task(self._run())
+        logger.info("RoomReaperService started")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("RoomReaperService stopped")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.game.orphan_reap_interval_seconds)
+            try:
+                await self.matchmaking_service.heartbeat(self.lease_seconds)
+                await self.matchmaking_service.refresh_workers()
+                await self.reap_once()
+            except Exception as e:
+                logger.error(f"Room reaper error: {e}")
+
+    # ------------------------------------------------------------------
+    # Reaping
+    # ------------------------------------------------------------------
+
+    async def reap_once(self) -> int:
+        """Finalize every claimable overdue room; returns how many were finalized."""
+        cutoff = time.time() - settings.game.orphan_reap_after_seconds
+        reaped = 0
+        for room_id in await self.matchmaking_service.get_overdue_rooms(cutoff):
+            if self.matchmaking_service.get_room(room_id):
+                continue  # ours; the local timer owns it
+            if not await self.matchmaking_service.claim_orphaned_room(room_id, self.lease_seconds):
+                continue
+            room = await self.matchmaking_service.finalize_orphaned_room(room_id)
+            if room is None:
+                continue
+            reaped += 1
+            await self._finish(room)
+        return reaped
+
+    async def _finish(self, room: GameRoom):
+        winner = room.get_winner()
+        end_message = {
+            "type": "game_end",
+            "winner": winner,
+            "scores": room.get_scores(),
+            "is_tie": winner is None,
+            "game_saved_by_server": True,
+        }
+        await self.bridge.send_many([p.id for p in (room.player1, room.player2) if not p.is_bot], end_message)
+        if room.has_bot or not await self.matchmaking_service.claim_game_save(room.id):
+            return
+        ended_at = datetime.fromtimestamp(room.started_wall + room.duration) if room.started_wall else None
+        await self.save_game(room, winner, ended_at)
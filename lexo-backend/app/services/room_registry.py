@@ -0,0 +1,101 @@
+import heapq
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.models.domain import GameRoom
+
+
+class RoomRegistry:
+    """
+    Rooms owned by this worker, indexed by room id, by player id and by expiry.
+
+    Expiry deadlines are ``time.monotonic()`` values kept in a heap; rescheduling
+    pushes a new entry and the old one is skipped when it reaches the top.
+    """
+
+    def __init__(self):
+        self._rooms: Dict[str, GameRoom] = {}
+        self._by_player: Dict[str, str] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._expiry: List[Tuple[float, str]] = []
+        self._bot_rooms = 0
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def __contains__(self, room_id: str) -> bool:
+        return room_id in self._rooms
+
+    def __iter__(self) -> Iterator[GameRoom]:
+        # Snapshot, so callers may remove rooms while iterating
+        return iter(list(self._rooms.values()))
+
+    def add(self, room: GameRoom, expires_at: float):
+        """Register ``room``; a player still indexed to an older room now resolves to this one."""
+        self._rooms[room.id] = room
+        for player_id in self.players(room):
+            self._by_player[player_id] = room.id
+        self._bot_rooms += room.has_bot
+        self.reschedule(room.id, expires_at)
+
+    def remove(self, room_id: str) -> Optional[GameRoom]:
+        room = self._rooms.pop(room_id, None)
+        if room is None:
+            return None
+        for player_id in self.players(room):
+            if self._by_player.get(player_id) == room_id:
+                del self._by_player[player_id]
+        self._deadlines.pop(room_id, None)
+        self._bot_rooms -= room.has_bot
+        if len(self._expiry) > 2 * len(self._deadlines) + 64:
+            self._compact()
+        return room
+
+    def get(self, room_id: str) -> Optional[GameRoom]:
+        return self._rooms.get(room_id)
+
+    def get_by_player(self, player_id: str) -> Optional[GameRoom]:
+        room_id = self._by_player.get(player_id)
+        return self._rooms.get(room_id) if room_id is not None else None
+
+    @staticmethod
+    def players(room: GameRoom) -> Tuple[str, str]:
+        return room.player1.id, room.player2.id
+
+    def reschedule(self, room_id: str, expires_at: float):
+        if room_id not in self._rooms:
+            return
+        self._deadlines[room_id] = expires_at
+        heapq.heappush(self._expiry, (expires_at, room_id))
+
+    def next_expiry(self) -> Optional[float]:
+        self._drop_stale()
+        return self._expiry[0][0] if self._expiry else None
+
+    def pop_expired(self, now: float) -> List[GameRoom]:
+        """Rooms whose deadline is at or before ``now``, oldest first; they stay registered."""
+        due: List[GameRoom] = []
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, room_id = heapq.heappop(self._expiry)
+            if self._deadlines.get(room_id) == expires_at:
+                del self._deadlines[room_id]
+                due.append(self._rooms[room_id])
+        return due
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "active_rooms": len(self._rooms),
+            "players_in_rooms": len(self._by_player),
+            "bot_rooms": self._bot_rooms,
+            "pending_expiries": len(self._deadlines),
+        }
+
+    def _drop_stale(self):
+        while self._expiry:
+            expires_at, room_id = self._expiry[0]
+            if self._deadlines.get(room_id) == expires_at:
+                return
+            heapq.heappop(self._expiry)
+
+    def _compact(self):
+        self._expiry = [(expires_at, room_id) for room_id, expires_at in self._deadlines.items()]
+        heapq.heapify(self._expiry)
@@ -0,0 +1,113 @@
+import asyncio
+import heapq
+import itertools
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+TimerCallback = Callable[[], Awaitable[None]]
+
+
+class TimerService:
+    """
+    One heap of keyed deadlines for every room timer on this worker.
+
+    Only the earliest deadline is armed with ``loop.call_at``, so 100k pending
+    timers cost 100k heap entries rather than 100k sleeping tasks. Deadlines
+    are in ``loop.time()`` (monotonic) seconds. Scheduling an existing key
+    replaces it; superseded heap entries are skipped when they surface.
+    """
+
+    def __init__(self):
+        self._timers: Dict[str, Tuple[float, int, TimerCallback]] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._armed_at: Optional[float] = None
+        self._running: Set[asyncio.Task] = set()
+
+    def pending(self) -> int:
+        return len(self._timers)
+
+    def deadline(self, key: str) -> Optional[float]:
+        entry = self._timers.get(key)
+        return entry[0] if entry else None
+
+    def call_later(self, key: str, delay: float, callback: TimerCallback):
+        loop = asyncio.get_running_loop()
+        self.call_at(key, loop.time() + delay, callback)
+
+    def call_at(self, key: str, when: float, callback: TimerCallback):
+        seq = next(self._seq)
+        self._timers[key] = (when, seq, callback)
+        heapq.heappush(self._heap, (when, seq, key))
+        self._arm()
+
+    def reschedule(self, key: str, when: float) -> bool:
+        entry = self._timers.get(key)
+        if entry is None:
+            return False
+        self.call_at(key, when, entry[2])
+        return True
+
+    def cancel(self, key: str) -> bool:
+        if self._timers.pop(key, None) is None:
+            return False
+        if len(self._heap) > 2 * len(self._timers) + 64:
+            self._compact()
+        return True
+
+    async def stop(self):
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+            self._armed_at = None
+        self._timers.clear()
+        self._heap.clear()
+        for task in list(self._running):
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+
+    def _arm(self):
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return
+        when = self._heap[0][0]
+        if self._armed_at is not None and self._armed_at <= when:
+            return
+        if self._handle:
+            self._handle.cancel()
+        self._armed_at = when
+        self._handle = asyncio.get_running_loop().call_at(when, self._fire)
+
+    def _fire(self):
+        self._handle = None
+        self._armed_at = None
+        now = asyncio.get_running_loop().time()
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_stale(entry):
+                continue
+            _, _, key = entry
+            _, _, callback = self._timers.pop(key)
+            task = asyncio.create_task(callback())
+            self._running.add(task)
+            task.add_done_callback(self._finished)
+        self._arm()
+
+    def _finished(self, task: asyncio.Task):
+        self._running.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error("Timer callback failed", exc_info=task.exception())
+
+    def _is_stale(self, entry: Tuple[float, int, str]) -> bool:
+        when, seq, key = entry
+        current = self._timers.get(key)
+        return current is None or current[1] != seq
+
+    def _compact(self):
+        self._heap = [(when, seq, key) for key, (when, seq, _) in self._timers.items()]
+        heapq.heapify(self._heap)
@@ -1,40 +1,233 @@
-from typing import Set
+import gzip
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
 from pathlib import Path
 
+import numpy as np
+
+from app.core.anagram_index import AnagramIndex
 from app.core.config import settings
+from app.core.dictionary import (
+    DictionaryFormatError,
+    PackedDictionary,
+    encode_client_dictionary,
+    write_dictionary,
+)
 from app.core.logging import get_logger
+from app.core.word_table import WordMetadata, WordTable
+from app.utils.game_logic import calculate_word_score
 
 logger = get_logger(__name__)
 
 
+def _artifact_is_stale(dictionary_file: Path, words_file: Path) -> bool:
+    if not dictionary_file.exists():
+        return True
+    if not words_file.exists():
+        return False
+    return words_file.stat().st_mtime > dictionary_file.stat().st_mtime
+
+
+@dataclass(frozen=True)
+class ClientDictionary:
+    """Downloadable dictionary encoding, built once per dictionary version."""
+    version: str
+    word_count: int
+    raw: bytes
+    gzipped: bytes
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+    @property
+    def gzip_etag(self) -> str:
+        return f'"{self.version}-gzip"'
+
+
+@dataclass(frozen=True)
+class DictionaryBundle:
+    """One dictionary version with the tables derived from it, swapped in as a unit."""
+    dictionary: PackedDictionary
+    word_table: WordTable
+    anagram_index: AnagramIndex
+
+    @classmethod
+    def build(cls, dictionary: PackedDictionary) -> "DictionaryBundle":
+        word_table = WordTable(dictionary)
+        return cls(dictionary, word_table, AnagramIndex(word_table))
+
+
 class WordService:
-    
+
     def __init__(self):
-        self.valid_words: Set[str] = set()
+        self._bundle: Optional[DictionaryBundle] = None
+        self._client_dictionary: Optional[ClientDictionary] = None
+        self._client_lock = threading.Lock()
         self._load_words()
-    
+
     def _load_words(self):
-        words_file = settings.files.words_file
+        words_file = Path(settings.files.words_file)
+        dictionary_file = Path(settings.files.dictionary_file)
         try:
-            with open(words_file, "r", encoding="utf-8") as f:
-                self.valid_words = set(
-                    line.strip().lower() 
-                    for line in f 
-                    if line.strip()
-                )
-            logger.info(f"Loaded {len(self.valid_words)} Turkish words")
+            if _artifact_is_stale(dictionary_file, words_file):
+                self._compile(words_file, dictionary_file)
+            try:
+                dictionary = PackedDictionary(dictionary_file)
+            except DictionaryFormatError as e:
+                logger.warning(f"Rebuilding dictionary artifact: {e}")
+                self._compile(words_file, dictionary_file)
+                dictionary = PackedDictionary(dictionary_file)
+            self._bundle = DictionaryBundle.build(dictionary)
+            logger.info(
+                f"Loaded {len(dictionary)} Turkish words "
+                f"(dictionary {dictionary.version})"
+            )
         except FileNotFoundError:
             logger.warning(f"{words_file} not found")
-            self.valid_words = set()
-    
-    def is_valid_word(self, word: str) -> bool:
+            self._bundle = None
+
+    def _compile(self, words_file: Path, dictionary_file: Path):
+        logger.warning(
+            f"Compiling {dictionary_file} at startup — run "
+            f"`python -m app.tools.build_dictionary` at build time instead"
+        )
+        with open(words_file, "r", encoding="utf-8") as f:
+            count = write_dictionary(f, dictionary_file)
+        logger.info(f"Built dictionary artifact {dictionary_file} with {count} words")
+
+    def reload(self, dictionary_file: str) -> str:
+        """
+        Load a dictionary artifact and make it current; returns its version.
+        Blocking (checksum + table build) — run it off the event loop. Readers
+        see either the old or the new bundle, never a mix: the swap is one
+        reference assignment. The old dictionary stays mapped for as long as
+        rooms created against it exist.
+        """
+        dictionary = PackedDictionary(dictionary_file)
+        bundle = DictionaryBundle.build(dictionary)
+        previous = self.get_version()
+        self._bundle = bundle
+        logger.info(
+            f"Dictionary reloaded {previous or '-'} -> {dictionary.version} "
+            f"({len(dictionary)} words)"
+        )
+        return dictionary.version
+
+    @property
+    def dictionary(self) -> Optional[PackedDictionary]:
+        bundle = self._bundle
+        return bundle.dictionary if bundle is not None else None
+
+    @property
+    def word_table(self) -> Optional[WordTable]:
+        bundle = self._bundle
+        return bundle.word_table if bundle is not None else None
+
+    @property
+    def anagram_index(self) -> Optional[AnagramIndex]:
+        bundle = self._bundle
+        return bundle.anagram_index if bundle is not None else None
+
+    def get_dictionary(self) -> Optional[PackedDictionary]:
+        """Current dictionary, for callers that must keep validating against one version."""
+        return self.dictionary
+
+    def is_valid_word(self, word: str, dictionary: Optional[PackedDictionary] = None) -> bool:
+        """
+        Check if word is valid against the memory-mapped dictionary, or against
+        a specific pinned ``dictionary`` version when given.
+        """
+        if dictionary is None:
+            dictionary = self.dictionary
+        if dictionary is None:
+            return False
+        return word.lower() in dictionary
+
+    def find_playable_words(
+        self,
+        letter_pool: List[str],
+        min_length: Optional[int] = None,
+        dictionary: Optional[PackedDictionary] = None,
+    ) -> List[str]:
+        """
+        All dictionary words that can be spelled from the letter pool,
+        honouring letter multiplicity (same rule as GameRoom.has_letters).
+        With a pinned ``dictionary`` from before a reload, results are limited
+        to words that version also contains.
+        """
+        anagram_index = self.anagram_index
+        if anagram_index is None:
+            return []
+        if min_length is None:
+            min_length = settings.game.min_word_length
+        words = anagram_index.find_words(letter_pool, min_length)
+        if dictionary is not None and dictionary is not anagram_index.dictionary:
+            words = [word for word in words if word in dictionary]
+        return words
+
+    def get_word_score(self, word: str) -> int:
+        """Score of a word: a table lookup for dictionary words, computed otherwise."""
+        table = self.word_table
+        if table is not None:
+            score = table.score_of(word)
+            if score is not None:
+                return score
+        return calculate_word_score(word)
+
+    def score_words(self, words: Sequence[str]) -> np.ndarray:
+        """Scores for many words at once, for bulk jobs (analytics, pool scoring)."""
+        table = self.word_table
+        if table is None:
+            return np.fromiter((calculate_word_score(word) for word in words), dtype=np.int32, count=len(words))
+        return table.scores_of(words)
+
+    def score_letter_pool(
+        self, letter_pool: List[str], min_length: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """(number of playable words, sum of their scores) for a letter pool."""
+        bundle = self._bundle
+        if bundle is None:
+            return 0, 0
+        if min_length is None:
+            min_length = settings.game.min_word_length
+        indices = bundle.anagram_index.find_indices(letter_pool, min_length)
+        return len(indices), int(bundle.word_table.scores[indices].sum())
+
+    def get_word_metadata(self, word: str) -> Optional[WordMetadata]:
+        """Score, length and letter counts of a dictionary word (for hints and analytics)."""
+        table = self.word_table
+        return table.get(word) if table is not None else None
+
+    def get_client_dictionary(self) -> ClientDictionary:
         """
-        Check if word is valid. Uses cache for frequently checked words.
+        Front-coded, gzip-compressed word list for offline validation on clients.
+        Built lazily (a few hundred ms) and cached until the dictionary changes.
         """
-        word_lower = word.lower()
-        
-        # Check in word set
-        return word_lower in self.valid_words
-    
+        dictionary = self.dictionary
+        version = dictionary.version if dictionary is not None else ""
+        cached = self._client_dictionary
+        if cached is not None and cached.version == version:
+            return cached
+        with self._client_lock:
+            cached = self._client_dictionary
+            if cached is None or cached.version != version:
+                raw = encode_client_dictionary(dictionary if dictionary is not None else [], version)
+                cached = ClientDictionary(
+                    version=version,
+                    word_count=len(dictionary) if dictionary is not None else 0,
+                    raw=raw,
+                    gzipped=gzip.compress(raw, compresslevel=9, mtime=0),
+                )
+                self._client_dictionary = cached
+                logger.info(
+                    f"Built client dictionary {version}: {len(cached.gzipped)} bytes gzipped"
+                )
+        return cached
+
     def get_word_count(self) -> int:
-        return len(self.valid_words)
+        return len(self.dictionary) if self.dictionary is not None else 0
+
+    def get_version(self) -> str:
+        return self.dictionary.version if self.dictionary is not None else ""
@@ -1,10 +1,11 @@
 import asyncio
-import json
 import os
 import uuid
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
 
+import orjson
 import redis.asyncio as aioredis
+from redis.exceptions import WatchError
 from fastapi import WebSocket
 
 from app.core.logging import get_logger
@@ -12,21 +13,58 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 _PLAYER_WORKER_TTL = 90  # seconds — covers ping_interval * 3
+_LOCAL_SEND_TIMEOUT = 2.0  # seconds — one stalled client must not hold up the other player
+
+RoomActionHandler = Callable[[Dict], Awaitable[None]]
+
+
+def _channel(worker_id: str) -> str:
+    return f"ws:worker:{worker_id}:v2"
+
+
+def _legacy_channel(worker_id: str) -> str:
+    return f"ws:worker:{worker_id}"
+
+
+def _legacy_user_payload(user_id: str, text: str) -> str:
+    """Pre-v2 ``{"user_id", "message"}`` envelope around an already encoded message."""
+    return f'{{"user_id":{orjson.dumps(user_id).decode()},"message":{text}}}'
+
+
+def encode_message(message: dict) -> str:
+    """Serialize a client message once; the text is reused for every local socket and Pub/Sub payload."""
+    return orjson.dumps(message).decode()
 
 
 class WebSocketBridge:
     """
     Routes WebSocket messages to users regardless of which worker holds their connection.
     - Local sends: direct in-process call to the WebSocket object.
-    - Remote sends: serialized over Redis Pub/Sub to the owning worker.
+    - Remote sends: serialized over Redis Pub/Sub to the owning worker as
+      ``"<user_id>[,<user_id>...]\n<message json>"``, so the encoded message
+      is forwarded to the sockets verbatim instead of being parsed and re-encoded.
+    - Wire format: that payload goes to ``ws:worker:{id}:v2``. Workers from
+      before it only listen on ``ws:worker:{id}`` for JSON envelopes, so a
+      publish nobody received on v2 is repeated there in the legacy shape, and
+      legacy envelopes arriving here are still understood. Drop the legacy
+      channel one release after v2 is everywhere.
+    - Fan-out: ``send_many`` resolves all remote users in one MGET, publishes
+      once per target worker and writes local sockets concurrently.
+    - Room actions: player messages for a room owned by another worker are
+      forwarded to that worker's channel and run by its room action handler.
+      ``request_worker`` also waits for the receiver to ``ack`` the action.
     """
 
     def __init__(self, redis: aioredis.Redis):
         self.redis = redis
         self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
         self._local: Dict[str, WebSocket] = {}
-        self._channel = f"ws:worker:{self.worker_id}"
+        self._channel = _channel(self.worker_id)
+        self._legacy_channel = _legacy_channel(self.worker_id)
         self._listener_task: Optional[asyncio.Task] = None
+        self._room_action_handler: Optional[RoomActionHandler] = None
+        self._action_tasks: Set[asyncio.Task] = set()
+        self._pending_acks: Dict[str, asyncio.Future] = {}
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -56,8 +94,24 @@ class WebSocketBridge:
         )
 
     async def unregister(self, user_id: str):
+        """
+        Forget the local socket and drop the routing key only while it still names this worker.
+        A client moving to the room owner's worker registers there before its old socket closes
+        here; WATCH keeps that close from deleting the new mapping.
+        """
         self._local.pop(user_id, None)
-        await self.redis.delete(f"player:{user_id}:ws:worker")
+        key = f"player:{user_id}:ws:worker"
+        async with self.redis.pipeline() as pipe:
+            try:
+                await pipe.watch(key)
+                if await pipe.get(key) != self.worker_id:
+                    await pipe.unwatch()
+                    return
+                pipe.multi()
+                pipe.delete(key)
+                await pipe.execute()
+            except WatchError:
+                pass  # re-registered elsewhere in the meantime; that mapping wins
 
     async def refresh_ttl(self, user_id: str):
         """Call periodically (e.g. on each ping) to keep the key alive."""
@@ -81,51 +135,193 @@ class WebSocketBridge:
         Deliver a message to a user — local fast-path or cross-worker Pub/Sub.
         Returns True if the message was dispatched (not necessarily received).
         """
-        ws = self._local.get(user_id)
-        if ws is not None:
-            try:
-                await ws.send_json(message)
-                return True
-            except Exception as e:
-                logger.warning(f"Bridge: local send failed for {user_id}: {e}")
-                self._local.pop(user_id, None)
-                return False
+        return await self.send_encoded(user_id, encode_message(message))
+
+    async def send_many(self, user_ids: Iterable[str], message: dict) -> int:
+        """
+        Deliver one message to several users, encoding it once; returns how many
+        were dispatched. Local writes and remote publishes run concurrently.
+        """
+        text = encode_message(message)
+        local, remote = [], []
+        for user_id in user_ids:
+            (local if user_id in self._local else remote).append(user_id)
+        results = await asyncio.gather(self._send_local_many(local, text), self._publish_many(remote, text))
+        return sum(results)
+
+    async def send_encoded(self, user_id: str, text: str) -> bool:
+        if user_id in self._local:
+            return await self._send_local(user_id, text)
 
         target_worker = await self.redis.get(f"player:{user_id}:ws:worker")
         if not target_worker:
             logger.debug(f"Bridge: no worker registered for {user_id}")
             return False
 
-        await self.redis.publish(
-            f"ws:worker:{target_worker}",
-            json.dumps({"user_id": user_id, "message": message}),
-        )
+        if not await self.redis.publish(_channel(target_worker), f"{user_id}\n{text}"):
+            await self.redis.publish(_legacy_channel(target_worker), _legacy_user_payload(user_id, text))
         return True
 
+    async def _send_local(self, user_id: str, text: str) -> bool:
+        ws = self._local.get(user_id)
+        if ws is None:
+            return False
+        try:
+            await asyncio.wait_for(ws.send_text(text), _LOCAL_SEND_TIMEOUT)
+            return True
+        except asyncio.TimeoutError:
+            # The write was cancelled mid-frame, so the stream is unusable: drop the client
+            logger.warning(f"Bridge: local send to {user_id} timed out — closing")
+            await self._drop_local(user_id, ws)
+            return False
+        except Exception as e:
+            logger.warning(f"Bridge: local send failed for {user_id}: {e}")
+            self._local.pop(user_id, None)
+            return False
+
+    async def _drop_local(self, user_id: str, ws: WebSocket):
+        if self._local.get(user_id) is ws:
+            await self.unregister(user_id)
+        try:
+            await asyncio.wait_for(ws.close(code=1011), _LOCAL_SEND_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Bridge: closing stalled socket of {user_id} failed: {e}")
+
+    async def _send_local_many(self, user_ids: List[str], text: str) -> int:
+        if len(user_ids) == 1:
+            return int(await self._send_local(user_ids[0], text))
+        return sum(await asyncio.gather(*(self._send_local(user_id, text) for user_id in user_ids)))
+
+    async def _publish_many(self, user_ids: List[str], text: str) -> int:
+        if not user_ids:
+            return 0
+        workers = await self.redis.mget([f"player:{user_id}:ws:worker" for user_id in user_ids])
+        by_worker: Dict[str, List[str]] = {}
+        for user_id, worker in zip(user_ids, workers):
+            if worker:
+                by_worker.setdefault(worker, []).append(user_id)
+            else:
+                logger.debug(f"Bridge: no worker registered for {user_id}")
+        if not by_worker:
+            return 0
+        pipe = self.redis.pipeline(transaction=False)
+        for worker, targets in by_worker.items():
+            pipe.publish(_channel(worker), f"{','.join(targets)}\n{text}")
+        received = await pipe.execute()
+        legacy = [(worker, targets) for (worker, targets), n in zip(by_worker.items(), received) if not n]
+        if legacy:
+            # Pre-v2 workers take one user per envelope
+            pipe = self.redis.pipeline(transaction=False)
+            for worker, targets in legacy:
+                for user_id in targets:
+                    pipe.publish(_legacy_channel(worker), _legacy_user_payload(user_id, text))
+            await pipe.execute()
+        return sum(len(targets) for targets in by_worker.values())
+
+    async def close_local(self, message: dict, code: int = 1012):
+        """Send ``message`` to every client connected here and close them (1012: service restart)."""
+        text = encode_message(message)
+        for user_id, ws in list(self._local.items()):
+            try:
+                await ws.send_text(text)
+                await ws.close(code=code)
+            except Exception as e:
+                logger.debug(f"Bridge: closing {user_id} failed: {e}")
+
+    def set_room_action_handler(self, handler: RoomActionHandler):
+        self._room_action_handler = handler
+
+    async def forward_to_worker(self, worker_id: str, action: dict) -> bool:
+        """Hand a room action to the worker that owns the room."""
+        if worker_id == self.worker_id:
+            self._run_room_action(action)
+            return True
+        return await self._publish_envelope(worker_id, orjson.dumps({"room_action": action}))
+
+    async def request_worker(self, worker_id: str, action: dict, timeout: float) -> bool:
+        """
+        Forward a room action and wait for the receiving worker to ``ack`` it.
+        False when nobody received it or no ack arrived within ``timeout``.
+        """
+        request_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending_acks[request_id] = future
+        try:
+            if not await self.forward_to_worker(
+                worker_id, {**action, "reply_to": self.worker_id, "request_id": request_id}
+            ):
+                return False
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._pending_acks.pop(request_id, None)
+
+    async def ack(self, action: dict):
+        """Confirm a forwarded action to the worker waiting in ``request_worker``."""
+        reply_to, request_id = action.get("reply_to"), action.get("request_id")
+        if not reply_to or not request_id:
+            return
+        if reply_to == self.worker_id:
+            self._resolve_ack(request_id)
+            return
+        await self._publish_envelope(reply_to, orjson.dumps({"ack": request_id}))
+
+    async def _publish_envelope(self, worker_id: str, envelope: bytes) -> bool:
+        """JSON envelopes read the same on both channels: v2 first, legacy if nobody listens there."""
+        if await self.redis.publish(_channel(worker_id), envelope):
+            return True
+        return bool(await self.redis.publish(_legacy_channel(worker_id), envelope))
+
+    def _resolve_ack(self, request_id: str):
+        future = self._pending_acks.get(request_id)
+        if future and not future.done():
+            future.set_result(True)
+
+    def _run_room_action(self, action: dict):
+        if self._room_action_handler is None:
+            logger.warning("Bridge: room action received but no handler is set")
+            return
+        # Own task so a slow action never stalls delivery of other messages
+        task = asyncio.create_task(self._room_action_handler(action))
+        self._action_tasks.add(task)
+        task.add_done_callback(self._action_tasks.discard)
+
     # ------------------------------------------------------------------
     # Internal Pub/Sub listener
     # ------------------------------------------------------------------
 
     async def _listen(self):
         pubsub = self.redis.pubsub()
-        await pubsub.subscribe(self._channel)
-        logger.debug(f"Bridge subscribed to {self._channel}")
+        await pubsub.subscribe(self._channel, self._legacy_channel)
+        logger.debug(f"Bridge subscribed to {self._channel} and {self._legacy_channel}")
         try:
             async for raw in pubsub.listen():
                 if raw["type"] != "message":
                     continue
                 try:
-                    payload = json.loads(raw["data"])
-                    user_id = payload["user_id"]
-                    ws = self._local.get(user_id)
-                    if ws:
-                        await ws.send_json(payload["message"])
+                    data = raw["data"]
+                    if data.startswith("{"):
+                        # JSON envelope: room actions, their acks, and legacy user messages
+                        envelope = orjson.loads(data)
+                        if "ack" in envelope:
+                            self._resolve_ack(envelope["ack"])
+                        elif "room_action" in envelope:
+                            self._run_room_action(envelope["room_action"])
+                        elif envelope.get("user_id") in self._local:
+                            await self._send_local(envelope["user_id"], encode_message(envelope["message"]))
+                        continue
+                    user_ids, text = data.split("\n", 1)
+                    targets = [user_id for user_id in user_ids.split(",") if user_id in self._local]
+                    if targets:
+                        await self._send_local_many(targets, text)
                     else:
-                        logger.debug(f"Bridge: no local socket for routed message to {user_id}")
+                        logger.debug(f"Bridge: no local socket for routed message to {user_ids}")
                 except Exception as e:
                     logger.error(f"Bridge listener error: {e}")
         except asyncio.CancelledError:
             pass
         finally:
-            await pubsub.unsubscribe(self._channel)
+            await pubsub.unsubscribe(self._channel, self._legacy_channel)
             await pubsub.aclose()
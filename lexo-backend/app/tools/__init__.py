@@ -0,0 +1 @@
+"""Offline maintenance tools."""
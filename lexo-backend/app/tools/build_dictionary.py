@@ -0,0 +1,66 @@
+"""
+Offline dictionary compiler.
+
+Normalizes and de-duplicates the plain-text word list into the versioned,
+checksummed binary artifact that WordService memory-maps at startup.
+
+Usage (from lexo-backend/):
+    python -m app.tools.build_dictionary [--source turkish_words.txt] [--output turkish_words.dict]
+
+With ``--publish`` the new version is announced over Redis and every running
+worker hot-swaps to it; games already in progress finish on their old version.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.dictionary import PackedDictionary, write_dictionary
+from app.services.dictionary_reload_service import publish_dictionary
+
+
+def build(source: str, output: str) -> PackedDictionary:
+    with open(source, "r", encoding="utf-8") as f:
+        write_dictionary(f, output)
+    return PackedDictionary(output)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compile the word list into a dictionary artifact")
+    parser.add_argument("--source", default=settings.files.words_file)
+    parser.add_argument("--output", default=settings.files.dictionary_file)
+    parser.add_argument("--publish", action="store_true", help="hot-reload running workers")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        dictionary = build(args.source, args.output)
+    except FileNotFoundError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    elapsed = (time.perf_counter() - start) * 1000
+    print(
+        f"{args.output}: {len(dictionary)} words, version {dictionary.version}, "
+        f"sha256 {dictionary.checksum} ({elapsed:.0f} ms)"
+    )
+    dictionary.close()
+
+    if args.publish:
+        asyncio.run(_publish(args.output))
+    return 0
+
+
+async def _publish(dictionary_file: str):
+    redis = aioredis.from_url(settings.redis.url, decode_responses=True)
+    try:
+        version = await publish_dictionary(redis, dictionary_file)
+        print(f"published dictionary {version} to {settings.redis.url}")
+    finally:
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
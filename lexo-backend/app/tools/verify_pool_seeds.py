@@ -0,0 +1,90 @@
+"""
+Verify that stored pool seeds regenerate the letters recorded in game history.
+
+Rows written while HISTORY_STORE_LETTER_POOL=true carry both the seed and the
+letters; every one of them must regenerate exactly. Seed-only rows are checked
+for a supported generator version and the stored pool size. Run it before
+turning dual-writing off, and again after Python or generator upgrades (pools
+come from the stdlib Mersenne Twister and ``random.choices``/``shuffle``).
+
+Usage (from lexo-backend/):
+    python -m app.tools.verify_pool_seeds [--batch-size 1000] [--limit N]
+"""
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass, field
+from typing import List
+
+from app.database.session import AsyncSessionLocal
+from app.repositories.game_repository import GameRepository
+from app.services.game_history_service import GameHistoryService
+
+
+@dataclass
+class VerificationReport:
+    matched: int = 0
+    seed_only: int = 0
+    mismatched: List[str] = field(default_factory=list)
+    unsupported: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatched and not self.unsupported
+
+
+def verify_game(game, report: VerificationReport):
+    try:
+        regenerated = GameHistoryService.get_letter_pool(game)
+    except ValueError:
+        report.unsupported.append(game.room_id)
+        return
+    if len(regenerated) != game.pool_size:
+        report.mismatched.append(game.room_id)
+    elif game.letter_pool is None:
+        report.seed_only += 1
+    elif regenerated == game.letter_pool.split(","):
+        report.matched += 1
+    else:
+        report.mismatched.append(game.room_id)
+
+
+async def verify(batch_size: int, limit: int = 0) -> VerificationReport:
+    report = VerificationReport()
+    after_id = 0
+    seen = 0
+    async with AsyncSessionLocal() as db:
+        repo = GameRepository(db)
+        while True:
+            games = await repo.get_seeded_games(after_id, batch_size)
+            if not games:
+                break
+            for game in games:
+                verify_game(game, report)
+            after_id = games[-1].id
+            seen += len(games)
+            if limit and seen >= limit:
+                break
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check stored pool seeds against game history")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=0, help="stop after N games (0 = all)")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(verify(args.batch_size, args.limit))
+    print(
+        f"matched {report.matched}, seed-only {report.seed_only}, "
+        f"mismatched {len(report.mismatched)}, unsupported generator {len(report.unsupported)}"
+    )
+    for room_id in report.mismatched[:20]:
+        print(f"  mismatch: {room_id}")
+    for room_id in report.unsupported[:20]:
+        print(f"  unsupported: {room_id}")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
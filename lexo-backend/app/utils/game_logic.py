@@ -1,35 +1,64 @@
-from typing import List
+from typing import List, Optional, Tuple, Union
 import random
 
+import numpy as np
+
 from app.core.constants import (
+    ALPHABET,
     LETTER_FREQUENCY, 
     LETTER_SCORES, 
     VOWELS, 
-    CONSONANTS
+    CONSONANTS,
+    LETTER_INDEX,
 )
 from app.core.config import settings
+from app.core.letter_pool import LetterPool
+
 
+# Bump whenever generate_balanced_letter_pool, generate_replacement_letters or the
+# letter tables change, so stored (seed, version) pairs never regenerate differently.
+POOL_GENERATOR_VERSION = 1
 
-def generate_balanced_letter_pool(size: int = 16) -> List[str]:
+
+def generate_balanced_letter_pool(size: int = 16, rng: Optional[random.Random] = None) -> List[str]:
+    rng = rng or random
     pool = []
     min_vowels = int(size * settings.game.min_vowel_ratio)
     min_consonants = int(size * settings.game.min_consonant_ratio)
     
     for _ in range(min_vowels):
-        pool.append(random.choice(VOWELS))
+        pool.append(rng.choice(VOWELS))
     
     for _ in range(min_consonants):
-        pool.append(random.choice(CONSONANTS))
+        pool.append(rng.choice(CONSONANTS))
     
     remaining = size - len(pool)
     letters = list(LETTER_FREQUENCY.keys())
     weights = list(LETTER_FREQUENCY.values())
-    pool.extend(random.choices(letters, weights=weights, k=remaining))
+    pool.extend(rng.choices(letters, weights=weights, k=remaining))
     
-    random.shuffle(pool)
+    rng.shuffle(pool)
     return pool
 
 
+def new_pool_seed() -> int:
+    """Random seed that fits a signed 64-bit column."""
+    return random.getrandbits(63)
+
+
+def seeded_letter_pool(
+    seed: int, size: int, generator_version: int = POOL_GENERATOR_VERSION
+) -> Tuple[List[str], random.Random]:
+    """
+    Regenerate a room's letter pool from ``(seed, generator_version)``.
+    The returned rng continues with the room's refill sequence.
+    """
+    if generator_version != POOL_GENERATOR_VERSION:
+        raise ValueError(f"Unsupported pool generator version {generator_version}")
+    rng = random.Random(seed)
+    return generate_balanced_letter_pool(size, rng), rng
+
+
 def calculate_word_score(word: str) -> int:
     word_lower = word.lower()
     word_length = len(word_lower)
@@ -51,21 +80,39 @@ def calculate_word_score(word: str) -> int:
     return max(total_score, word_length)
 
 
-def generate_replacement_letters(count: int) -> List[str]:
+def calculate_word_scores(letter_counts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_word_score for bulk jobs.
+
+    letter_counts: (n, len(ALPHABET)) per-word letter counts in ALPHABET order.
+    lengths: (n,) word lengths in characters.
+    """
+    letter_values = np.array([LETTER_SCORES[letter] for letter in ALPHABET], dtype=np.int32)
+    base_score = letter_counts.astype(np.int32) @ letter_values
+    lengths = lengths.astype(np.int32)
+
+    threshold_1 = settings.game.length_bonus_threshold_1
+    threshold_2 = settings.game.length_bonus_threshold_2
+    multiplier_1 = settings.game.length_bonus_multiplier_1
+    multiplier_2 = settings.game.length_bonus_multiplier_2
+
+    length_bonus = np.where(lengths >= threshold_1, (lengths - threshold_1 + 1) * multiplier_1, 0)
+    length_bonus += np.where(lengths >= threshold_2, (lengths - threshold_2 + 1) * multiplier_2, 0)
+    return np.maximum(base_score + length_bonus, lengths)
+
+
+def generate_replacement_letters(count: int, rng: Optional[random.Random] = None) -> List[str]:
+    """Frequency-weighted letters; pass a seeded ``rng`` for a reproducible sequence."""
     letters = list(LETTER_FREQUENCY.keys())
     weights = list(LETTER_FREQUENCY.values())
-    return random.choices(letters, weights=weights, k=count)
+    return (rng or random).choices(letters, weights=weights, k=count)
 
 
 def validate_word_length(word: str) -> bool:
     return len(word) >= settings.game.min_word_length
 
 
-def has_letters_in_pool(word: str, pool: List[str]) -> bool:
-    temp_pool = pool.copy()
-    for letter in word.lower():
-        if letter in temp_pool:
-            temp_pool.remove(letter)
-        else:
-            return False
-    return True
+def has_letters_in_pool(word: str, pool: Union[List[str], LetterPool]) -> bool:
+    if not isinstance(pool, LetterPool):
+        pool = LetterPool(letter for letter in pool if letter.lower() in LETTER_INDEX)
+    return pool.contains_word(word)
@@ -3,6 +3,7 @@ WebSocket authentication utilities
 """
 from __future__ import annotations
 
+import re
 from typing import Dict, Any
 
 from fastapi import WebSocket
@@ -12,6 +13,8 @@ from app.security.supabase import verify_supabase_jwt, SupabaseAuthError
 
 logger = get_logger(__name__)
 
+_WORD_PATTERN = re.compile(r"[a-zA-ZçÇğĞıİöÖşŞüÜ]+")
+
 
 class WebSocketAuthError(Exception):
     """Exception raised for WebSocket authentication errors"""
@@ -158,6 +161,7 @@ def validate_message(message: Dict) -> bool:
         "pong",
         "friend_invite",
         "friend_invite_response",
+        "check_prefix",
     ]
     
     if message_type not in valid_types:
@@ -176,12 +180,20 @@ def validate_message(message: Dict) -> bool:
         if not word.strip():
             logger.warning(f"Word is empty or whitespace")
             return False
-        import re
         # Only allow Turkish alphabet (upper/lower), no digits or symbols
-        if not re.fullmatch(r"[a-zA-ZçÇğĞıİöÖşŞüÜ]+", word):
+        if not _WORD_PATTERN.fullmatch(word):
             logger.warning(f"Word contains invalid characters: {word}")
             return False
     
+    elif message_type == "check_prefix":
+        prefix = message.get("prefix", "")
+        if not isinstance(prefix, str):
+            return False
+        if not prefix or len(prefix) > 50:
+            return False
+        if not _WORD_PATTERN.fullmatch(prefix):
+            return False
+    
     elif message_type == "send_emoji":
         emoji = message.get("emoji", "")
         if not isinstance(emoji, str):
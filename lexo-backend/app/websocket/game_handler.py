@@ -6,14 +6,14 @@ from typing import Dict, Optional
 
 from fastapi import WebSocket, WebSocketDisconnect
 
-from app.database.session import AsyncSessionLocal
 from app.models.domain import GameRoom, Player
-from app.services.game_history_service import GameHistoryService
+from app.services.bot_service import BotService
+from app.services.game_result_service import save_game_result
 from app.services.matchmaking_service import MatchmakingService
-from app.services.stats_service import StatsService
-from app.services.user_service import UserService
 from app.services.word_service import WordService
 from app.services.ws_bridge import WebSocketBridge
+from app.core.config import settings
+from app.core.letter_pool import LetterPool
 from app.core.logging import get_logger
 from app.websocket.auth import (
     RateLimiter,
@@ -26,6 +26,18 @@ from app.websocket.auth import (
 logger = get_logger(__name__)
 
 _TOKEN_EXPIRY_WARN_SECS = 120  # warn client when < 2 min remain on JWT
+_HANDOFF_ACK_TIMEOUT = 2.0  # seconds a peer gets to take ownership of a room
+
+
+class _BridgeReply:
+    """Stands in for the WebSocket of a player whose connection lives on another worker."""
+
+    def __init__(self, bridge: WebSocketBridge, user_id: str):
+        self.bridge = bridge
+        self.user_id = user_id
+
+    async def send_json(self, message: Dict):
+        await self.bridge.send_to_user(self.user_id, message)
 
 
 class GameWebSocketHandler:
@@ -35,11 +47,16 @@ class GameWebSocketHandler:
         matchmaking_service: MatchmakingService,
         word_service: WordService,
         bridge: WebSocketBridge,
+        bot_service: Optional[BotService] = None,
     ):
         self.matchmaking_service = matchmaking_service
         self.word_service = word_service
         self.bridge = bridge
+        self.bot_service = bot_service
+        self._bot_wait_task: Optional[asyncio.Task] = None
         self.rate_limiters: Dict[str, RateLimiter] = {}
+        # Typing feedback fires per keystroke, so it gets its own, larger budget
+        self.prefix_rate_limiters: Dict[str, RateLimiter] = {}
         self._token_expiries: Dict[str, int] = {}
 
     # ------------------------------------------------------------------
@@ -64,6 +81,11 @@ class GameWebSocketHandler:
             await self.bridge.register(user_id, websocket)
             if user_id not in self.rate_limiters:
                 self.rate_limiters[user_id] = RateLimiter()
+            if user_id not in self.prefix_rate_limiters:
+                self.prefix_rate_limiters[user_id] = RateLimiter(
+                    max_messages=settings.websocket.prefix_check_max_messages,
+                    window_seconds=settings.websocket.prefix_check_window_seconds,
+                )
             self._token_expiries[user_id] = user_data.get("token_exp", 0)
 
             # --- Reconnect check ---
@@ -74,16 +96,26 @@ class GameWebSocketHandler:
                     snapshot = await self.matchmaking_service.get_room_snapshot(room_id)
                     if snapshot and snapshot.get("game_started") == "1" and snapshot.get("game_ended") == "0":
                         await self._serve_reconnect_from_snapshot(websocket, user_id, snapshot)
+                        await self._forward_to_room_owner(websocket, user_id, {"type": "reconnect"})
                         await self._message_loop(websocket, user_id, username)
                         return
 
-            if existing_room and existing_room.game_started and not existing_room.game_ended:
+            if existing_room and not existing_room.game_started and not existing_room.game_ended:
+                # Back during the countdown, typically after following a reconnect_url
+                existing_player = existing_room.get_player(user_id)
+                existing_player.connected = True
+                existing_player.disconnected_at = None
+                self.matchmaking_service.cancel_grace_timeout(existing_room, user_id)
+                await websocket.send_json(self._match_found_message(existing_room, existing_player))
+            elif existing_room and existing_room.game_started and not existing_room.game_ended:
                 time_remaining = existing_room.get_time_remaining()
                 if time_remaining and time_remaining > 0:
                     existing_player = existing_room.get_player(user_id)
                     if existing_player:
                         existing_player.connected = True
-                        existing_player.last_disconnect_time = None
+                        existing_player.disconnected_at = None
+                        self.matchmaking_service.cancel_grace_timeout(existing_room, user_id)
+                        await self.matchmaking_service.room_log.reconnected(existing_room, user_id)
 
                         opponent = existing_room.get_opponent(existing_player)
                         await websocket.send_json({
@@ -91,20 +123,19 @@ class GameWebSocketHandler:
                             "room_id": existing_room.id,
                             "opponent": opponent.username,
                             "opponent_user_id": opponent.id,
-                            "letter_pool": existing_room.letter_pool,
+                            "letter_pool": existing_room.letter_pool.to_list(),
+                            "pool_mode": existing_room.pool_mode,
+                            "pool_version": existing_room.pool_version,
                             "scores": existing_room.get_scores(),
                             "time_remaining": time_remaining,
-                            "server_start_time": (
-                                int(existing_room.start_time.timestamp() * 1000)
-                                if existing_room.start_time else None
-                            ),
+                            "server_start_time": existing_room.start_time_ms,
                             "duration": existing_room.duration,
                             "server_time": int(time.time() * 1000),
                             "my_words": existing_player.words,
                             "used_words": list(existing_room.used_words),
                         })
 
-                        await self.bridge.send_to_user(opponent.id, {
+                        await self._send(opponent, {
                             "type": "opponent_reconnected",
                             "message": "Rakip oyuna geri döndü",
                         })
@@ -115,6 +146,11 @@ class GameWebSocketHandler:
                     await websocket.send_json({"type": "game_expired", "message": "Oyun süresi doldu"})
                     await websocket.close()
                     return
+            elif self.matchmaking_service.draining:
+                # Shutting down: the client's reconnect lands on a worker that can match it
+                await websocket.send_json({"type": "server_restarting", "message": "Sunucu yeniden başlatılıyor"})
+                await websocket.close(code=1012)
+                return
             else:
                 mode = initial_data.get("mode")
                 invite_id = initial_data.get("invite_id")
@@ -141,6 +177,8 @@ class GameWebSocketHandler:
                     room = await self.matchmaking_service.try_match_players()
                     if room:
                         await self._handle_match_found(room)
+                    elif self.bot_service and settings.game.bot_enabled:
+                        self._bot_wait_task = asyncio.create_task(self._match_bot_after_wait(user_id))
 
             await self._message_loop(websocket, user_id, username)
 
@@ -161,6 +199,10 @@ class GameWebSocketHandler:
                     await send_error_response(websocket, "Invalid message format")
                     continue
 
+                if data.get("type") == "check_prefix":
+                    await self._handle_prefix_check(websocket, user_id, data)
+                    continue
+
                 rate_limiter = self.rate_limiters.get(user_id)
                 if rate_limiter and not rate_limiter.is_allowed(user_id):
                     await send_error_response(websocket, "Too many messages, please slow down")
@@ -232,7 +274,9 @@ class GameWebSocketHandler:
             "room_id": snapshot["id"],
             "opponent": opp_username,
             "opponent_user_id": opp_id,
-            "letter_pool": [l for l in snapshot.get("letter_pool", "").split(",") if l],
+            "letter_pool": LetterPool.decode(snapshot.get("letter_pool", "")).to_list(),
+            "pool_mode": snapshot.get("pool_mode", "static"),
+            "pool_version": int(snapshot.get("pool_version", 0)),
             "scores": [
                 {"username": snapshot["player1_username"], "score": int(snapshot["player1_score"])},
                 {"username": snapshot["player2_username"], "score": int(snapshot["player2_score"])},
@@ -253,46 +297,105 @@ class GameWebSocketHandler:
     # Match flow
     # ------------------------------------------------------------------
 
-    async def _handle_match_found(self, room: GameRoom):
-        await self.bridge.send_to_user(room.player1.id, {
-            "type": "match_found",
-            "room_id": room.id,
-            "opponent": room.player2.username,
-            "opponent_user_id": room.player2.id,
-        })
-        await self.bridge.send_to_user(room.player2.id, {
-            "type": "match_found",
-            "room_id": room.id,
-            "opponent": room.player1.username,
-            "opponent_user_id": room.player1.id,
-        })
+    async def _handle_match_found(self, room: GameRoom, place: bool = True):
+        if place and await self._place_room(room):
+            return
+        await asyncio.gather(
+            self._send(room.player1, self._match_found_message(room, room.player1)),
+            self._send(room.player2, self._match_found_message(room, room.player2)),
+        )
         logger.info(f"Match found — room {room.id}")
         await self._start_game_countdown(room)
 
+    def _match_found_message(self, room: GameRoom, player: Player) -> Dict:
+        opponent = room.get_opponent(player)
+        message = {
+            "type": "match_found",
+            "room_id": room.id,
+            "opponent": opponent.username,
+            "opponent_user_id": opponent.id,
+            "opponent_is_bot": opponent.is_bot,
+        }
+        endpoint = self.matchmaking_service.endpoint
+        if endpoint and not self.bridge.get_local_websocket(player.id):
+            # Reconnecting here puts the player next to the room: sends skip the Pub/Sub hop
+            message["reconnect_url"] = endpoint
+        return message
+
+    async def _place_room(self, room: GameRoom) -> bool:
+        """Move a new room to its ring owner; True if another worker now runs it."""
+        owner = self.matchmaking_service.place_room(room)
+        if owner == self.bridge.worker_id:
+            return False
+        return await self.hand_off_room(room, owner)
+
+    async def hand_off_room(self, room: GameRoom, peer: str) -> bool:
+        """
+        Move ``room`` to ``peer``. The room is frozen here and offered; it is
+        only dropped once the peer has taken ``mm:room:{id}:worker``, otherwise
+        it keeps running here. True if ``peer`` now owns it.
+        """
+        await self.matchmaking_service.release_room(room)
+        if self.bot_service:
+            self.bot_service.release(room.id)
+        await self.matchmaking_service.offer_room(room.id, peer)
+        await self.bridge.request_worker(peer, {
+            "player_id": "",
+            "data": {"type": "adopt_room", "room_id": room.id, "from_worker": self.bridge.worker_id},
+        }, timeout=_HANDOFF_ACK_TIMEOUT)
+        # Redis decides, not the ack: a late adopt after the offer is withdrawn finds nothing to take
+        if await self.matchmaking_service.settle_handoff(room.id, peer):
+            logger.info(f"Handed room {room.id} to worker {peer}")
+            return True
+        logger.warning(f"Worker {peer} did not take room {room.id}; keeping it here")
+        self.matchmaking_service.reclaim_room(room)
+        if room.game_started:
+            await self._resume_room(room)
+        return False
+
+    async def _match_bot_after_wait(self, user_id: str):
+        """Give a lone queued player a bot opponent once the wait threshold passes."""
+        await asyncio.sleep(settings.game.bot_match_after_seconds)
+        room = await self.matchmaking_service.try_match_players(bot_fallback_for=user_id)
+        if room:
+            # Waiting is over: a disconnect from here on must not cancel the countdown
+            self._bot_wait_task = None
+            await self._handle_match_found(room)
+
+    async def _send(self, player: Player, message: Dict):
+        """Deliver to a human player; bots have no connection."""
+        if not player.is_bot:
+            await self.bridge.send_to_user(player.id, message)
+
+    async def _broadcast(self, room: GameRoom, message: Dict):
+        """Deliver the same message to both human players, encoded once."""
+        await self.bridge.send_many([p.id for p in (room.player1, room.player2) if not p.is_bot], message)
+
     async def _start_game_countdown(self, room: GameRoom):
         await asyncio.sleep(1)
         room.start_game()
-        await self.matchmaking_service._snapshot_room(room)
+        await self.matchmaking_service.room_log.started(room)
 
         start_message = {
             "type": "game_start",
-            "letter_pool": room.letter_pool,
+            "letter_pool": room.letter_pool.to_list(),
+            "pool_mode": room.pool_mode,
+            "pool_version": room.pool_version,
             "duration": room.duration,
             "scores": room.get_scores(),
-            "server_start_time": (
-                int(room.start_time.timestamp() * 1000) if room.start_time else None
-            ),
+            "server_start_time": room.start_time_ms,
             "server_time": int(time.time() * 1000),
         }
-        await self.bridge.send_to_user(room.player1.id, start_message)
-        await self.bridge.send_to_user(room.player2.id, start_message)
+        await self._broadcast(room, start_message)
         logger.info(f"Game started in room {room.id}")
-        asyncio.create_task(self._end_game_after_duration(room))
+        if room.has_bot and self.bot_service:
+            self.bot_service.start(room)
+        await self.matchmaking_service.schedule_game_end(room, lambda: self._end_game_on_timeout(room))
 
-    async def _end_game_after_duration(self, room: GameRoom):
-        await asyncio.sleep(room.duration)
+    async def _end_game_on_timeout(self, room: GameRoom):
         if not room.game_ended:
             room.end_game()
+            await self.matchmaking_service.clear_game_deadline(room.id)
             winner = room.get_winner()
             end_message = {
                 "type": "game_end",
@@ -301,8 +404,7 @@ class GameWebSocketHandler:
                 "is_tie": winner is None,
                 "game_saved_by_server": True,
             }
-            await self.bridge.send_to_user(room.player1.id, end_message)
-            await self.bridge.send_to_user(room.player2.id, end_message)
+            await self._broadcast(room, end_message)
             logger.info(f"Game ended in room {room.id}, winner: {winner}")
             await self._save_game_to_database(room, winner)
 
@@ -315,6 +417,7 @@ class GameWebSocketHandler:
     ):
         room = self.matchmaking_service.get_room_by_player(player_id)
         if not room:
+            await self._forward_to_room_owner(websocket, player_id, data, username)
             return
         word = data.get("word", "").strip()
         player = room.get_player(player_id)
@@ -327,30 +430,49 @@ class GameWebSocketHandler:
             return
 
         result = self.matchmaking_service.game_service.process_word_submission(room, player, word)
+        pool_update = self.matchmaking_service.game_service.pool_update(result)
+        # Logged before replying so another worker can finish the game if this one dies
+        await self.matchmaking_service.room_log.flush(room)
         await websocket.send_json({
             "type": "word_valid",
             "word": result["word"],
             "score": result["score"],
             "total_score": result["total_score"],
-            "letter_pool": result["letter_pool"],
             "scores": result["scores"],
+            **pool_update,
         })
 
         opponent = room.get_opponent(player)
-        await self.bridge.send_to_user(opponent.id, {
+        await self._send(opponent, {
             "type": "opponent_word",
             "player": username,
             "word": result["word"],
             "score": result["score"],
-            "letter_pool": result["letter_pool"],
             "scores": result["scores"],
+            **pool_update,
         })
 
+
+    async def _handle_prefix_check(self, websocket: WebSocket, player_id: str, data: Dict):
+        rate_limiter = self.prefix_rate_limiters.get(player_id)
+        if rate_limiter and not rate_limiter.is_allowed(player_id):
+            return  # typing feedback is best-effort; drop silently
+        room = self.matchmaking_service.get_room_by_player(player_id)
+        if not room:
+            await self._forward_to_room_owner(websocket, player_id, data)
+            return
+        if not room.game_started or room.game_ended:
+            return
+        result = self.matchmaking_service.game_service.check_prefix(room, data["prefix"])
+        await websocket.send_json({"type": "prefix_result", **result})
+
     async def _handle_emoji_message(
         self, websocket: WebSocket, player_id: str, data: Dict, username: str
     ):
         room = self.matchmaking_service.get_room_by_player(player_id)
         if not room:
+            if await self._forward_to_room_owner(websocket, player_id, data, username):
+                return
             await websocket.send_json({"type": "emoji_error", "message": "Rakip oyundan ayrıldı"})
             return
         if room.game_ended:
@@ -361,13 +483,101 @@ class GameWebSocketHandler:
             return
         player = room.get_player(player_id)
         opponent = room.get_opponent(player)
-        await self.bridge.send_to_user(opponent.id, {
+        await self._send(opponent, {
             "type": "emoji_received",
             "emoji": emoji,
             "from": username,
             "timestamp": datetime.now().isoformat(),
         })
 
+    # ------------------------------------------------------------------
+    # Cross-worker rooms
+    # ------------------------------------------------------------------
+
+    async def _forward_to_room_owner(
+        self, websocket: Optional[WebSocket], player_id: str, data: Dict, username: str = ""
+    ) -> bool:
+        """
+        Send a message for a room this worker does not hold to the worker named
+        in ``mm:room:{id}:worker``. Actions that already came over the bridge
+        are never passed on again. Returns False when there is nowhere to send it.
+        """
+        if isinstance(websocket, _BridgeReply):
+            return False
+        room_id = await self.matchmaking_service.get_room_id_from_redis(player_id)
+        if not room_id:
+            return False
+        worker_id = await self.matchmaking_service.get_room_worker(room_id)
+        if not worker_id or worker_id == self.bridge.worker_id:
+            return False
+        return await self.bridge.forward_to_worker(worker_id, {
+            "player_id": player_id,
+            "username": username,
+            "data": data,
+        })
+
+    async def handle_forwarded_action(self, action: Dict):
+        """Run a message another worker forwarded for a room this worker owns."""
+        player_id = action.get("player_id", "")
+        username = action.get("username") or "Player"
+        data = action.get("data") or {}
+        reply = _BridgeReply(self.bridge, player_id)
+        msg_type = data.get("type")
+        try:
+            if msg_type == "adopt_room":
+                await self._adopt_room(action)
+            elif msg_type == "submit_word":
+                await self._handle_word_submission(reply, player_id, data, username)
+            elif msg_type == "check_prefix":
+                await self._handle_prefix_check(reply, player_id, data)
+            elif msg_type == "send_emoji":
+                await self._handle_emoji_message(reply, player_id, data, username)
+            elif msg_type == "disconnect":
+                # A room-affinity reconnect may already have landed before the old socket closed
+                if not await self.bridge.is_user_connected(player_id):
+                    await self._handle_room_disconnect(player_id)
+            elif msg_type == "reconnect":
+                await self._handle_room_reconnect(player_id)
+        except Exception as e:
+            logger.error(f"Error processing forwarded {msg_type} from {player_id}: {e}")
+
+    async def _adopt_room(self, action: Dict):
+        """Take over a room another worker offered, ack it, and run it here."""
+        data = action["data"]
+        room = await self.matchmaking_service.adopt_room(data["room_id"], data.get("from_worker", ""))
+        if room is None:
+            return
+        await self.bridge.ack(action)
+        if not room.game_started:
+            # Placed here at match time: this worker announces and starts it
+            await self._handle_match_found(room, place=False)
+            return
+        await self._resume_room(room)
+
+    async def _resume_room(self, room: GameRoom):
+        """Re-arm the timers and bot of a running room that just became ours."""
+        if room.has_bot and self.bot_service:
+            self.bot_service.start(room)
+        await self.matchmaking_service.schedule_game_end(room, lambda: self._end_game_on_timeout(room))
+        for player in (room.player1, room.player2):
+            if not player.is_bot and not player.connected:
+                player.disconnected_at = time.monotonic()
+                self.matchmaking_service.schedule_grace_timeout(
+                    room, player.id, lambda pid=player.id: self._handle_grace_period_timeout(room, pid)
+                )
+
+    async def _handle_room_reconnect(self, player_id: str):
+        """The player is back on another worker, which already sent them the room state."""
+        room = self.matchmaking_service.get_room_by_player(player_id)
+        player = room.get_player(player_id) if room else None
+        if not player or room.game_ended:
+            return
+        player.connected = True
+        player.disconnected_at = None
+        self.matchmaking_service.cancel_grace_timeout(room, player_id)
+        await self.matchmaking_service.room_log.reconnected(room, player_id)
+        logger.info(f"Player {player_id} reconnected to {room.id} via another worker")
+
     # ------------------------------------------------------------------
     # Friend invites
     # ------------------------------------------------------------------
@@ -486,7 +696,10 @@ class GameWebSocketHandler:
     # ------------------------------------------------------------------
 
     async def _handle_disconnect(self, player_id: str):
+        if self._bot_wait_task:
+            self._bot_wait_task.cancel()
         self.rate_limiters.pop(player_id, None)
+        self.prefix_rate_limiters.pop(player_id, None)
         self._token_expiries.pop(player_id, None)
         await self.bridge.unregister(player_id)
 
@@ -502,41 +715,53 @@ class GameWebSocketHandler:
 
         await self.matchmaking_service.remove_from_queue_by_id(player_id)
 
+        if not self.matchmaking_service.get_room_by_player(player_id):
+            await self._forward_to_room_owner(None, player_id, {"type": "disconnect"})
+            return
+        await self._handle_room_disconnect(player_id)
+
+    async def _handle_room_disconnect(self, player_id: str):
         room = self.matchmaking_service.get_room_by_player(player_id)
         if not room:
             return
 
-        if not room.game_ended and room.game_started:
+        # Rooms in countdown get the grace period too: matched players may be
+        # moving to the room's worker after a reconnect_url. If they never come
+        # back, the match is cancelled rather than forfeited.
+        if not room.game_ended:
             disconnected = room.get_player(player_id)
             if disconnected:
                 disconnected.connected = False
-                disconnected.last_disconnect_time = datetime.now()
+                disconnected.disconnected_at = time.monotonic()
+                await self.matchmaking_service.room_log.disconnected(room, player_id)
 
             opponent = room.get_opponent(disconnected) if disconnected else None
-            if opponent:
-                await self.bridge.send_to_user(opponent.id, {
+            if opponent and room.game_started:
+                await self._send(opponent, {
                     "type": "opponent_disconnected_temp",
                     "message": "Rakip bağlantısı kesildi, tekrar bağlanması bekleniyor...",
                 })
-            asyncio.create_task(self._handle_grace_period_timeout(room, player_id))
-        elif not room.game_started:
-            await self.matchmaking_service.cleanup_room(room.id)
+            self.matchmaking_service.schedule_grace_timeout(
+                room, player_id, lambda: self._handle_grace_period_timeout(room, player_id)
+            )
+            logger.info(
+                f"Grace period {room.reconnect_grace_period}s started for {player_id} in room {room.id}"
+            )
         else:
             await self.matchmaking_service.cleanup_room(room.id)
 
     async def _handle_grace_period_timeout(self, room: GameRoom, player_id: str):
-        grace = room.reconnect_grace_period
-        logger.info(f"Grace period {grace}s started for {player_id} in room {room.id}")
-        await asyncio.sleep(grace)
-
         disconnected = room.get_player(player_id)
         if disconnected and not disconnected.connected and not room.game_ended:
+            if self._left_before_start(room, disconnected):
+                await self._cancel_room(room, disconnected)
+                return
             room.end_game()
             opponent = room.get_opponent(disconnected)
             winner = opponent.username if opponent else None
 
             if opponent:
-                await self.bridge.send_to_user(opponent.id, {
+                await self._send(opponent, {
                     "type": "opponent_disconnected",
                     "message": "Rakip oyundan ayrıldı. Siz kazandınız!",
                 })
@@ -546,6 +771,25 @@ class GameWebSocketHandler:
         elif room.game_ended:
             await self.matchmaking_service.cleanup_room(room.id)
 
+    @staticmethod
+    def _left_before_start(room: GameRoom, player: Player) -> bool:
+        return player.disconnected_at is not None and (
+            room.started_monotonic is None or player.disconnected_at <= room.started_monotonic
+        )
+
+    async def _cancel_room(self, room: GameRoom, absent: Player):
+        """Drop a match a player never joined: no winner, nothing persisted."""
+        if self.bot_service:
+            self.bot_service.release(room.id)
+        opponent = room.get_opponent(absent)
+        if opponent:
+            await self._send(opponent, {
+                "type": "match_cancelled",
+                "message": "Rakip bağlanamadı, maç iptal edildi",
+            })
+        await self.matchmaking_service.cleanup_room(room.id)
+        logger.info(f"Room {room.id} cancelled: {absent.id} left before the game started")
+
     # ------------------------------------------------------------------
     # Database persistence
     # ------------------------------------------------------------------
@@ -553,56 +797,10 @@ class GameWebSocketHandler:
     async def _save_game_to_database(self, room: GameRoom, winner_name: Optional[str]):
         if room.game_saved:
             return
-        try:
-            room.game_saved = True
-            async with AsyncSessionLocal() as db:
-                user_service = UserService(db)
-                stats_service = StatsService(db)
-                game_history_service = GameHistoryService(db)
-
-                player1 = await user_service.get_user_by_supabase_id(room.player1.id)
-                player2 = await user_service.get_user_by_supabase_id(room.player2.id)
-                if not player1 or not player2:
-                    logger.error(f"Cannot save game {room.id}: player not found")
-                    return
-
-                winner_id = None
-                if winner_name == room.player1.username:
-                    winner_id = player1.id
-                elif winner_name == room.player2.username:
-                    winner_id = player2.id
-
-                await game_history_service.create_game_history(
-                    room_id=room.id,
-                    player1_id=player1.id,
-                    player2_id=player2.id,
-                    player1_score=room.player1.score,
-                    player2_score=room.player2.score,
-                    player1_words=room.player1.words,
-                    player2_words=room.player2.words,
-                    winner_id=winner_id,
-                    duration=room.duration,
-                    letter_pool=room.letter_pool,
-                    started_at=room.start_time or datetime.now(),
-                    ended_at=datetime.now(),
-                )
-
-                await stats_service.update_stats_after_game(
-                    user_id=player1.id,
-                    score=room.player1.score,
-                    words=room.player1.words,
-                    won=winner_id == player1.id if winner_id else False,
-                    tied=winner_id is None,
-                    game_duration=room.duration,
-                )
-                await stats_service.update_stats_after_game(
-                    user_id=player2.id,
-                    score=room.player2.score,
-                    words=room.player2.words,
-                    won=winner_id == player2.id if winner_id else False,
-                    tied=winner_id is None,
-                    game_duration=room.duration,
-                )
-                logger.info(f"Saved game {room.id} to database")
-        except Exception as e:
-            logger.error(f"Error saving game {room.id}: {e}")
+        room.game_saved = True
+        if room.has_bot:
+            return  # practice games never touch history or stats
+        if not await self.matchmaking_service.claim_game_save(room.id):
+            logger.info(f"Game {room.id} already saved by another worker")
+            return
+        await save_game_result(room, winner_name)
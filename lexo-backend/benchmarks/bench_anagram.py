@@ -0,0 +1,53 @@
+"""
+Throughput of WordService.find_playable_words over pools from generate_balanced_letter_pool.
+
+Usage (from lexo-backend/):
+    python -m benchmarks.bench_anagram [--pools 5000] [--verify 50]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.core.config import settings
+from app.services.word_service import WordService
+from app.utils.game_logic import generate_balanced_letter_pool, has_letters_in_pool
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pools", type=int, default=5000)
+    parser.add_argument("--verify", type=int, default=50, help="pools to cross-check by brute force")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    word_service = WordService()
+    size = settings.game.letter_pool_size
+    pools = [generate_balanced_letter_pool(size) for _ in range(args.pools)]
+
+    timings, found = [], []
+    for pool in pools:
+        start = time.perf_counter()
+        words = word_service.find_playable_words(pool)
+        timings.append((time.perf_counter() - start) * 1000)
+        found.append(len(words))
+
+    timings.sort()
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(f"{args.pools} pools of {size} letters against {word_service.get_word_count()} words")
+    print(f"latency  mean {statistics.mean(timings):.2f}ms  p50 {statistics.median(timings):.2f}ms"
+          f"  p99 {p99:.2f}ms  max {timings[-1]:.2f}ms")
+    print(f"playable words per pool  mean {statistics.mean(found):.0f}  min {min(found)}  max {max(found)}")
+
+    if args.verify:
+        everything = list(word_service.dictionary)
+        min_length = settings.game.min_word_length
+        for pool in pools[:args.verify]:
+            expected = {w for w in everything if len(w) >= min_length and has_letters_in_pool(w, pool)}
+            assert set(word_service.find_playable_words(pool)) == expected, pool
+        print(f"verified {args.verify} pools against brute force")
+
+
+if __name__ == "__main__":
+    main()
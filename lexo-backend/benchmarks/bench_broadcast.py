@@ -0,0 +1,124 @@
+"""
+Encode CPU per game: per-recipient stdlib json vs. serialize-once orjson.
+
+Plays games through GameService and replays the messages the handler sends
+(game_start, word_valid/opponent_word score updates, emojis, game_end) with
+player1 connected locally and player2 on another worker. The old path runs
+``json.dumps`` per recipient the way ``send_json`` does, plus the bridge's
+envelope dump, load and re-dump for the remote player. The new path is one
+``orjson.dumps`` per message, reused for the local socket and prefixed with
+the user id for the Pub/Sub payload.
+
+Usage (from lexo-backend/):
+    python -m benchmarks.bench_broadcast [--games 500] [--words 30] [--emojis 4]
+"""
+import argparse
+import json
+import logging
+import random
+import time
+from datetime import datetime
+
+from app.models.domain import Player
+from app.services.game_service import GameService
+from app.services.word_service import WordService
+from app.services.ws_bridge import encode_message
+
+
+def _send_json(message) -> str:
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def old_path(messages):
+    for message, recipients, _ in messages:
+        for remote in recipients:
+            if remote:
+                payload = json.dumps({"user_id": "p2", "message": message})
+                _send_json(json.loads(payload)["message"])
+            else:
+                _send_json(message)
+
+
+def new_path(messages):
+    for message, recipients, direct in messages:
+        if direct and not recipients[0]:
+            _send_json(message)  # word_valid to a local sender still goes out via send_json
+            continue
+        text = encode_message(message)
+        for remote in recipients:
+            if remote:
+                payload = f"p2\n{text}"
+                payload.split("\n", 1)
+
+
+def game_messages(game_service: GameService, index: int, words: int, emojis: int, rng: random.Random):
+    """(message, [is_remote per recipient], is_direct_reply) in the order one game sends them."""
+    room = game_service.create_game_room(f"room-{index}", Player("p1", "Alice"), Player("p2", "Bob"))
+    room.start_game()
+    both = [False, True]
+    out = [({
+        "type": "game_start",
+        "letter_pool": room.letter_pool.to_list(),
+        "pool_mode": room.pool_mode,
+        "pool_version": room.pool_version,
+        "duration": room.duration,
+        "scores": room.get_scores(),
+        "server_start_time": room.start_time_ms,
+        "server_time": int(time.time() * 1000),
+    }, both, False)]
+    for turn in range(words):
+        playable = [w for w in game_service.word_service.find_playable_words(
+            room.letter_pool, dictionary=room.dictionary) if w not in room.used_words]
+        if not playable:
+            break
+        player = room.player1 if turn % 2 == 0 else room.player2
+        result = game_service.process_word_submission(room, player, rng.choice(playable))
+        update = game_service.pool_update(result)
+        sender_remote = player is room.player2
+        out.append(({"type": "word_valid", "word": result["word"], "score": result["score"],
+                     "total_score": result["total_score"], "scores": result["scores"], **update},
+                    [sender_remote], True))
+        out.append(({"type": "opponent_word", "player": player.username, "word": result["word"],
+                     "score": result["score"], "scores": result["scores"], **update},
+                    [not sender_remote], False))
+    for i in range(emojis):
+        out.append(({"type": "emoji_received", "emoji": "🔥", "from": "Alice" if i % 2 else "Bob",
+                     "timestamp": datetime.now().isoformat()}, [i % 2 == 0], False))
+    room.end_game()
+    winner = room.get_winner()
+    out.append(({"type": "game_end", "winner": winner, "scores": room.get_scores(),
+                 "is_tie": winner is None, "game_saved_by_server": True}, both, False))
+    return out
+
+
+def _cpu_us_per_game(path, games) -> float:
+    start = time.process_time()
+    for messages in games:
+        path(messages)
+    return (time.process_time() - start) / len(games) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--words", type=int, default=30, help="accepted words per game")
+    parser.add_argument("--emojis", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=5, help="best-of timing rounds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rng = random.Random(args.seed)
+    game_service = GameService(WordService())
+    games = [game_messages(game_service, i, args.words, args.emojis, rng) for i in range(args.games)]
+    sends = sum(len(recipients) for messages in games for _, recipients, _ in messages) / args.games
+
+    old = min(_cpu_us_per_game(old_path, games) for _ in range(args.rounds))
+    new = min(_cpu_us_per_game(new_path, games) for _ in range(args.rounds))
+    print(f"{args.games} games, {sends:.0f} sends/game (player2 on another worker)")
+    print(f"  stdlib json per recipient   {old:8,.0f} µs CPU/game")
+    print(f"  orjson serialize-once       {new:8,.0f} µs CPU/game   ({old / new:.1f}x less)")
+
+
+if __name__ == "__main__":
+    main()
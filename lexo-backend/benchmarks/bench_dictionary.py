@@ -0,0 +1,74 @@
+"""
+Memory / lookup-latency comparison: Python ``set`` vs memory-mapped PackedDictionary.
+
+Usage (from lexo-backend/):
+    python -m benchmarks.bench_dictionary [--words turkish_words.txt] [--lookups 200000]
+"""
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from app.core.dictionary import PackedDictionary, write_dictionary
+
+
+def _load_set(words_file: Path) -> set:
+    with open(words_file, "r", encoding="utf-8") as f:
+        return set(line.strip().lower() for line in f if line.strip())
+
+
+def _measure_heap(factory):
+    tracemalloc.start()
+    start = time.perf_counter()
+    obj = factory()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current, peak, elapsed
+
+
+def _time_lookups(container, probes) -> float:
+    start = time.perf_counter()
+    for word in probes:
+        word in container
+    return (time.perf_counter() - start) / len(probes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", default="turkish_words.txt")
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    words_file = Path(args.words)
+    with tempfile.TemporaryDirectory() as tmp:
+        artifact = Path(tmp) / "words.dict"
+        with open(words_file, "r", encoding="utf-8") as f:
+            write_dictionary(f, artifact)
+
+        word_set, set_heap, set_peak, set_load = _measure_heap(lambda: _load_set(words_file))
+        packed, packed_heap, packed_peak, packed_load = _measure_heap(lambda: PackedDictionary(artifact))
+
+        rng = random.Random(0)
+        hits = rng.choices(sorted(word_set), k=args.lookups // 2)
+        misses = [w + "xq" for w in rng.choices(sorted(word_set), k=args.lookups // 2)]
+        probes = hits + misses
+        rng.shuffle(probes)
+
+        set_lookup = _time_lookups(word_set, probes)
+        packed_lookup = _time_lookups(packed, probes)
+
+        print(f"words: {len(word_set)}  artifact: {artifact.stat().st_size / 1024:.0f} KiB (shared, mmap)")
+        print(f"{'':12}{'heap/worker':>14}{'peak':>12}{'load':>10}{'lookup':>12}")
+        print(f"{'set':12}{set_heap / 1024:>11.0f} KiB{set_peak / 1024:>8.0f} KiB"
+              f"{set_load * 1000:>8.1f}ms{set_lookup * 1e9:>10.0f}ns")
+        print(f"{'packed':12}{packed_heap / 1024:>11.0f} KiB{packed_peak / 1024:>8.0f} KiB"
+              f"{packed_load * 1000:>8.1f}ms{packed_lookup * 1e9:>10.0f}ns")
+        packed.close()
+
+
+if __name__ == "__main__":
+    main()
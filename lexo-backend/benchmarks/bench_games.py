@@ -0,0 +1,61 @@
+"""
+End-to-end game throughput with the headless simulator (no sockets).
+
+Reports submissions/s, p50/p99 latency of validate_word_submission +
+process_word_submission, and memory per live room. Use a fixed --seed and
+the same arguments before and after a hot-path change.
+
+Usage (from lexo-backend/):
+    python -m benchmarks.bench_games [--games 20000] [--submissions 30] [--rooms 2000]
+"""
+import argparse
+import asyncio
+import logging
+import random
+
+from app.core.config import settings
+from app.services.word_service import WordService
+from benchmarks.simulator import GameSimulator, SimulationReport, room_object_bytes
+
+
+async def _main(args):
+    random.seed(args.seed)
+    settings.game.pool_mode = args.pool_mode
+    word_service = WordService()
+    simulator = GameSimulator(
+        word_service, seed=args.seed,
+        invalid_ratio=args.invalid_ratio, repeat_ratio=args.repeat_ratio,
+    )
+
+    report = await simulator.run(args.games, args.submissions)
+    print(f"{report.games} games x {args.submissions} submissions ({args.pool_mode} pools), seed {args.seed}")
+    print(f"  wall {report.elapsed:.2f}s  {report.submissions_per_second:,.0f} submissions/s end-to-end, "
+          f"{report.hot_path_per_second:,.0f}/s hot path  ({report.accepted / report.submissions:.0%} accepted)")
+    print(f"  validate+process  p50 {report.percentile_us(50):.1f}us  "
+          f"p99 {report.percentile_us(99):.1f}us  max {report.percentile_us(100):.1f}us")
+
+    if args.rooms:
+        per_room, prefix = await simulator.measure_room_memory(args.rooms, args.submissions)
+        room = await simulator.create_room()
+        simulator.play(room, args.submissions, SimulationReport())
+        print(f"  memory per live room  {per_room / 1024:.1f} KiB traced heap (incl. fakeredis state), "
+              f"{room_object_bytes(room) / 1024:.1f} KiB GameRoom object graph")
+        print(f"  + prefix index        {prefix / 1024:.1f} KiB per room whose players use check_prefix")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--submissions", type=int, default=30, help="word attempts per game")
+    parser.add_argument("--rooms", type=int, default=2000, help="live rooms for the memory phase (0 = skip)")
+    parser.add_argument("--invalid-ratio", type=float, default=0.2)
+    parser.add_argument("--repeat-ratio", type=float, default=0.1)
+    parser.add_argument("--pool-mode", choices=["static", "consumable"], default="static")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
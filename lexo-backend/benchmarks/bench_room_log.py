@@ -0,0 +1,100 @@
+"""
+Write amplification: full-room snapshot per word vs. the per-room event log.
+
+Plays games through GameService and, for every accepted word, packs the
+Redis commands each scheme sends: HSET of the whole ``to_snapshot`` hash
+plus EXPIRE in two round trips (the old ``_snapshot_room``), or the XADD of
+the word event plus the TTL refresh that ``RoomEventLog.flush`` pipelines.
+Reports wire bytes per word and per game, and how the snapshot cost grows
+as words accumulate while the event cost stays flat.
+
+Usage (from lexo-backend/):
+    python -m benchmarks.bench_room_log [--games 200] [--words 30] [--mode static]
+"""
+import argparse
+import logging
+import random
+
+from redis.connection import Connection
+
+from app.core.config import settings
+from app.models.domain import Player
+from app.services.game_service import GameService
+from app.services.room_event_log import created_event, room_log_key, started_event
+from app.services.word_service import WordService
+
+_PACKER = Connection()
+
+
+def _wire_bytes(*args) -> int:
+    return sum(len(chunk) for chunk in _PACKER.pack_command(*args))
+
+
+def _hset(key: str, mapping) -> int:
+    args = [item for pair in mapping.items() for item in pair]
+    return _wire_bytes("HSET", key, *args) + _wire_bytes("EXPIRE", key, 7200)
+
+
+def _xadd(key: str, fields) -> int:
+    args = [item for pair in fields.items() for item in pair]
+    return _wire_bytes("XADD", key, "NOMKSTREAM", "*", *args) + _wire_bytes("EXPIRE", key, 7200)
+
+
+def play(game_service: GameService, games: int, words_per_game: int, rng: random.Random):
+    snapshot_bytes, event_bytes = [], []
+    setup_snapshot = setup_event = 0
+    for i in range(games):
+        room = game_service.create_game_room(f"room-{i}", Player(f"p{i}a", "Alice"), Player(f"p{i}b", "Bob"))
+        snapshot_key, log_key = f"mm:room:{room.id}", room_log_key(room.id)
+        setup_snapshot += _hset(snapshot_key, room.to_snapshot())
+        setup_event += _xadd(log_key, created_event(room))
+        room.start_game()
+        setup_snapshot += _hset(snapshot_key, room.to_snapshot())
+        setup_event += _xadd(log_key, started_event(room))
+
+        for turn in range(words_per_game):
+            words = [w for w in game_service.word_service.find_playable_words(
+                room.letter_pool, dictionary=room.dictionary) if w not in room.used_words]
+            if not words:
+                break
+            player = room.player1 if turn % 2 == 0 else room.player2
+            game_service.process_word_submission(room, player, rng.choice(words))
+            snapshot_bytes.append((turn, _hset(snapshot_key, room.to_snapshot())))
+            event_bytes.append((turn, sum(_xadd(log_key, event) for event in room.pending_events)))
+            room.pending_events.clear()
+    return snapshot_bytes, event_bytes, setup_snapshot / games, setup_event / games
+
+
+def _mean(samples, turn=None):
+    values = [b for t, b in samples if turn is None or t == turn]
+    return sum(values) / len(values) if values else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--words", type=int, default=30, help="accepted words per game")
+    parser.add_argument("--mode", choices=["static", "consumable"], default="static")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    settings.game.pool_mode = args.mode
+    rng = random.Random(args.seed)
+    snapshots, events, setup_snapshot, setup_event = play(
+        GameService(WordService()), args.games, args.words, rng
+    )
+
+    per_game_snapshot = setup_snapshot + sum(b for _, b in snapshots) / args.games
+    per_game_event = setup_event + sum(b for _, b in events) / args.games
+    print(f"{args.games} games, {len(snapshots) / args.games:.1f} words/game, {args.mode} pools")
+    print(f"  snapshot per word   {_mean(snapshots):8,.0f} B   (word 1: {_mean(snapshots, 0):,.0f} B, "
+          f"word {args.words}: {_mean(snapshots, args.words - 1):,.0f} B)")
+    print(f"  event per word      {_mean(events):8,.0f} B   (word 1: {_mean(events, 0):,.0f} B, "
+          f"word {args.words}: {_mean(events, args.words - 1):,.0f} B)")
+    print(f"  per game            {per_game_snapshot:8,.0f} B snapshot vs {per_game_event:,.0f} B event log "
+          f"({per_game_snapshot / per_game_event:.1f}x write amplification)")
+
+
+if __name__ == "__main__":
+    main()
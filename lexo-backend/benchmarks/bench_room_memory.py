@@ -0,0 +1,79 @@
+"""
+Bytes per live room on one worker.
+
+Creates N started rooms through GameService (no Redis, no sockets), plays a
+few words per player so word lists and used-word sets are populated, and
+reports traced heap growth per room plus the GameRoom object graph size.
+Rooms start the way the handler starts them, without a prefix index; the
+index a room gains once its players use check_prefix is reported on its own
+line so it cannot hide inside the per-room figure.
+
+Usage (from lexo-backend/):
+    python -m benchmarks.bench_room_memory [--rooms 10000 100000] [--words 5]
+"""
+import argparse
+import gc
+import logging
+import random
+import time
+import tracemalloc
+
+from app.models.domain import Player
+from app.services.game_service import GameService
+from app.services.word_service import WordService
+from benchmarks.simulator import prefix_index_bytes, room_object_bytes
+
+
+def _live_rooms(game_service: GameService, count: int, words_per_player: int, rng: random.Random):
+    word_service = game_service.word_service
+    candidates = {}
+    rooms = []
+    for i in range(count):
+        room = game_service.create_game_room(f"room-{i}", Player(f"p{i}a", f"Player {i}a"), Player(f"p{i}b", f"Player {i}b"))
+        room.start_game()
+        key = room.letter_pool.encode()
+        if key not in candidates:
+            candidates[key] = word_service.find_playable_words(room.letter_pool.to_list(), dictionary=room.dictionary)
+        words = rng.sample(candidates[key], min(len(candidates[key]), 2 * words_per_player))
+        for turn, word in enumerate(words):
+            game_service.process_word_submission(room, room.player1 if turn % 2 else room.player2, word)
+        rooms.append(room)
+    return rooms
+
+
+def measure(game_service: GameService, count: int, words_per_player: int, seed: int):
+    rng = random.Random(seed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        rooms = _live_rooms(game_service, count, words_per_player, rng)
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    graph = sum(room_object_bytes(room) for room in rooms[:1000]) / min(count, 1000)
+    return traced / count, graph, prefix_index_bytes(game_service, rooms[:1000]), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rooms", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--words", type=int, default=5, help="words played per player")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    random.seed(args.seed)
+    game_service = GameService(WordService())
+    for count in args.rooms:
+        per_room, graph, prefix, elapsed = measure(game_service, count, args.words, args.seed)
+        print(f"{count:>7} rooms  {per_room:,.0f} B/room traced heap  "
+              f"{graph:,.0f} B/room object graph  ({count * per_room / 2**20:,.1f} MiB total, built in {elapsed:.1f}s)")
+        print(f"{'':>7}        + {prefix:,.0f} B/room prefix index once players use check_prefix")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Word scoring: per-call calculate_word_score vs. the precomputed WordTable.
+
+Usage (from lexo-backend/):
+    python -m benchmarks.bench_scoring [--words 100000] [--pools 2000]
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.word_service import WordService
+from app.utils.game_logic import calculate_word_score, generate_balanced_letter_pool
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=100000, help="lookups to time")
+    parser.add_argument("--pools", type=int, default=2000, help="pools to score")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    word_service = WordService()
+    dictionary = list(word_service.dictionary)
+    words = [random.choice(dictionary) for _ in range(args.words)]
+
+    _, compute = _timed(lambda: [calculate_word_score(w) for w in words])
+    _, lookup = _timed(lambda: [word_service.get_word_score(w) for w in words])
+    print(f"{args.words} single-word scores")
+    print(f"  calculate_word_score  {compute / args.words * 1e6:.2f}us/word")
+    print(f"  WordTable lookup      {lookup / args.words * 1e6:.2f}us/word")
+
+    per_call, loop = _timed(lambda: np.fromiter(
+        (word_service.get_word_score(w) for w in words), dtype=np.int32, count=len(words)))
+    bulk, gather = _timed(lambda: word_service.score_words(words))
+    assert (per_call == bulk).all()
+    print(f"{args.words} words scored in bulk")
+    print(f"  per-word lookup loop  {loop / args.words * 1e6:.2f}us/word")
+    print(f"  indices + gather      {gather / args.words * 1e6:.2f}us/word  ({loop / gather:.1f}x)")
+
+    pools = [generate_balanced_letter_pool(settings.game.letter_pool_size) for _ in range(args.pools)]
+
+    def per_word():
+        return [
+            sum(calculate_word_score(w) for w in word_service.find_playable_words(pool))
+            for pool in pools
+        ]
+
+    def vectorized():
+        return [word_service.score_letter_pool(pool)[1] for pool in pools]
+
+    expected, slow = _timed(per_word)
+    actual, fast = _timed(vectorized)
+    assert expected == actual
+    print(f"{args.pools} pool scorings")
+    print(f"  per-word    {slow / args.pools * 1000:.2f}ms/pool")
+    print(f"  vectorized  {fast / args.pools * 1000:.2f}ms/pool  ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Cold-start comparison for the dictionary load done in ``lifespan``/``init_services``.
+
+Each variant runs in a fresh interpreter so nothing is warm except the OS page cache:
+  legacy   line-by-line ``strip().lower()`` into a set (pre-artifact WordService)
+  compile  WordService with no artifact on disk (compiles at startup)
+  artifact WordService memory-mapping a prebuilt artifact (checksum verified)
+
+Usage (from lexo-backend/):
+    python -m benchmarks.bench_startup [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+_LEGACY = """
+import time
+start = time.perf_counter()
+with open({words!r}, "r", encoding="utf-8") as f:
+    words = set(line.strip().lower() for line in f if line.strip())
+print((time.perf_counter() - start) * 1000)
+"""
+
+_SERVICE = """
+import time
+from app.services.word_service import WordService
+start = time.perf_counter()
+WordService()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _run(code: str, env: dict) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", default="turkish_words.txt")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    words = str(Path(args.words).resolve())
+    with tempfile.TemporaryDirectory() as tmp:
+        artifact = os.path.join(tmp, "words.dict")
+        env = {**os.environ, "WORDS_FILE": words, "DICTIONARY_FILE": artifact, "LOG_LEVEL": "ERROR"}
+
+        results = {"legacy": [], "compile": [], "artifact": []}
+        for _ in range(args.runs):
+            results["legacy"].append(_run(_LEGACY.format(words=words), env))
+            if os.path.exists(artifact):
+                os.unlink(artifact)
+            results["compile"].append(_run(_SERVICE, env))
+            results["artifact"].append(_run(_SERVICE, env))
+
+    print(f"{'variant':10}{'median':>10}{'min':>10}  ({args.runs} runs)")
+    for name, samples in results.items():
+        print(f"{name:10}{statistics.median(samples):>8.1f}ms{min(samples):>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Headless game simulator.
+
+Drives MatchmakingService -> GameService -> GameRoom against fakeredis with bot
+players, without sockets or the WebSocket handler. Bots submit dictionary words
+that fit the room's pool, plus a configurable share of invalid and repeated
+words, so both the accept and reject paths of the hot path are exercised.
+
+Rooms are paired through ``MatchmakingService.create_room`` (same registration
+and event-log path as queue matches); the queue's Lua matcher needs ``lupa``,
+which fakeredis only supports when it is installed.
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+import fakeredis.aioredis
+
+from app.models.domain import GameRoom
+from app.services.game_service import GameService
+from app.services.matchmaking_service import MatchmakingService
+from app.services.word_service import WordService
+
+_INVALID_WORDS = ["qwxz", "zzzz", "a", "ğğğğğ"]
+
+
+@dataclass
+class SimulationReport:
+    games: int = 0
+    submissions: int = 0
+    accepted: int = 0
+    elapsed: float = 0.0
+    latencies_ns: List[int] = field(default_factory=list)
+
+    @property
+    def submissions_per_second(self) -> float:
+        """End-to-end rate, including room setup, Redis and bot word picking."""
+        return self.submissions / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def hot_path_per_second(self) -> float:
+        """Rate implied by the timed validate+process calls alone."""
+        total = sum(self.latencies_ns)
+        return len(self.latencies_ns) * 1e9 / total if total else 0.0
+
+    def percentile_us(self, pct: float) -> float:
+        if not self.latencies_ns:
+            return 0.0
+        ordered = sorted(self.latencies_ns)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index] / 1000
+
+
+class BotPlayer:
+    """Picks words for one room from its playable-word list."""
+
+    def __init__(self, words: List[str], rng: random.Random, invalid_ratio: float, repeat_ratio: float):
+        self.words = words
+        self.rng = rng
+        self.invalid_ratio = invalid_ratio
+        self.repeat_ratio = repeat_ratio
+        self.played: List[str] = []
+
+    def next_word(self) -> str:
+        roll = self.rng.random()
+        if roll < self.invalid_ratio or not self.words:
+            return self.rng.choice(_INVALID_WORDS)
+        if roll < self.invalid_ratio + self.repeat_ratio and self.played:
+            return self.rng.choice(self.played)
+        word = self.rng.choice(self.words)
+        self.played.append(word)
+        return word
+
+
+class GameSimulator:
+
+    def __init__(
+        self,
+        word_service: WordService,
+        seed: int = 0,
+        invalid_ratio: float = 0.2,
+        repeat_ratio: float = 0.1,
+    ):
+        self.word_service = word_service
+        self.game_service = GameService(word_service)
+        self.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        self.matchmaking = MatchmakingService(self.game_service, self.redis)
+        self.matchmaking.worker_id = "simulator"
+        self.rng = random.Random(seed)
+        self.invalid_ratio = invalid_ratio
+        self.repeat_ratio = repeat_ratio
+        self._next_player = 0
+
+    async def create_room(self) -> GameRoom:
+        """A started room as the handler's countdown leaves it: no prefix index until a first check_prefix."""
+        p1, p2 = self._next_player, self._next_player + 1
+        self._next_player += 2
+        room = await self.matchmaking.create_room(f"bot-{p1}", f"Bot {p1}", f"bot-{p2}", f"Bot {p2}")
+        room.start_game()
+        await self.matchmaking.room_log.started(room)
+        return room
+
+    def _bot(self, room: GameRoom) -> BotPlayer:
+        words = self.word_service.find_playable_words(room.letter_pool.to_list(), dictionary=room.dictionary)
+        return BotPlayer(words, self.rng, self.invalid_ratio, self.repeat_ratio)
+
+    def play(self, room: GameRoom, submissions: int, report: SimulationReport):
+        """Alternate both players through ``submissions`` word attempts, timing each one."""
+        game_service = self.game_service
+        bot = self._bot(room)
+        players = (room.player1, room.player2)
+        latencies = report.latencies_ns
+        for turn in range(submissions):
+            if room.pool_mode == "consumable" and turn and turn % 4 == 0:
+                bot = self._bot(room)  # pool changed; refresh candidates
+            player = players[turn & 1]
+            word = bot.next_word()
+            start = time.perf_counter_ns()
+            if game_service.validate_word_submission(room, word)["valid"]:
+                game_service.process_word_submission(room, player, word)
+                report.accepted += 1
+            latencies.append(time.perf_counter_ns() - start)
+        report.submissions += submissions
+
+    async def finish(self, room: GameRoom):
+        room.end_game()
+        await self.matchmaking.cleanup_room(room.id)
+
+    async def run(self, games: int, submissions_per_game: int) -> SimulationReport:
+        report = SimulationReport()
+        start = time.perf_counter()
+        for _ in range(games):
+            room = await self.create_room()
+            self.play(room, submissions_per_game, report)
+            await self.finish(room)
+            report.games += 1
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    async def measure_room_memory(self, rooms: int, submissions_per_game: int) -> Tuple[float, float]:
+        """
+        Traced heap bytes per live, played room (includes its fakeredis keys),
+        and the extra bytes per room once players type and its prefix index exists.
+        """
+        report = SimulationReport()
+        live = []
+        gc.collect()
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            for _ in range(rooms):
+                room = await self.create_room()
+                self.play(room, submissions_per_game, report)
+                live.append(room)
+            report.latencies_ns.clear()
+            gc.collect()
+            used = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+        prefix = prefix_index_bytes(self.game_service, live)
+        for room in live:
+            await self.finish(room)
+        return used / rooms, prefix
+
+
+def prefix_index_bytes(game_service: GameService, rooms: Iterable[GameRoom]) -> float:
+    """Traced heap bytes per room of the prefix index its first check_prefix builds."""
+    rooms = list(rooms)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        for room in rooms:
+            game_service.check_prefix(room, room.letter_pool.to_list()[0])
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    return used / len(rooms) if rooms else 0.0
+
+
+def room_object_bytes(room: GameRoom) -> int:
+    """sys.getsizeof over the room's own object graph (shared dictionary excluded)."""
+    seen = {id(room.dictionary)}
+    stack = [room]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, (str, bytes, int, float, bool, type(None))):
+            continue
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            for name in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+    return total
@@ -0,0 +1,49 @@
+"""
+Shared fixtures for multi-worker service tests
+"""
+import asyncio
+
+import pytest
+import fakeredis.aioredis
+
+from app.services.game_service import GameService
+from app.services.matchmaking_service import MatchmakingService
+from app.services.ws_bridge import WebSocketBridge
+from app.websocket.game_handler import GameWebSocketHandler
+
+
+async def _eventually(condition, timeout: float = 3.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def eventually():
+    """Await until a condition holds; Pub/Sub delivery is asynchronous."""
+    return _eventually
+
+
+@pytest.fixture
+async def workers(word_service):
+    """Two heartbeating workers sharing one Redis, each with its bridge and room action handler"""
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    handlers = []
+    for i in range(2):
+        bridge = WebSocketBridge(redis)
+        matchmaking = MatchmakingService(GameService(word_service), redis)
+        matchmaking.worker_id = bridge.worker_id
+        matchmaking.endpoint = f"wss://worker-{i}.example/ws/queue"
+        await matchmaking.heartbeat(30)
+        handler = GameWebSocketHandler(matchmaking, word_service, bridge)
+        bridge.set_room_action_handler(handler.handle_forwarded_action)
+        await bridge.start()
+        handlers.append(handler)
+    for handler in handlers:
+        await handler.matchmaking_service.refresh_workers()
+    await asyncio.sleep(0.05)  # let both listeners subscribe
+    yield handlers
+    for handler in handlers:
+        await handler.matchmaking_service.timers.stop()
+        await handler.bridge.stop()
@@ -0,0 +1,166 @@
+"""
+Tests for BotService and bot matchmaking
+"""
+import asyncio
+import json
+import random
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import fakeredis.aioredis
+
+from app.core.config import settings
+from app.models.domain import Player
+from app.services import bot_service as bot_module
+from app.services.bot_service import BotService, choose_word, plan_words
+from app.services.game_service import GameService
+from app.services.matchmaking_service import MatchmakingService, _QUEUE_KEY
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def game_service(word_service):
+    return GameService(word_service)
+
+
+@pytest.fixture
+def matchmaking(game_service, redis):
+    return MatchmakingService(game_service, redis)
+
+
+async def _enqueue(redis, player_id, waited):
+    entry = {"id": player_id, "username": player_id.title(), "joined_at": time.time() - waited}
+    await redis.rpush(_QUEUE_KEY, json.dumps(entry))
+
+
+class TestBotMatchmaking:
+    """Test suite for the bot fallback in MatchmakingService"""
+
+    @pytest.mark.asyncio
+    async def test_lone_player_gets_bot_after_wait(self, matchmaking, redis):
+        """Test that a player alone in the queue past the threshold is matched with a bot"""
+        await _enqueue(redis, "alice", settings.game.bot_match_after_seconds + 1)
+        room = await matchmaking.try_match_bot("alice")
+
+        assert room is not None
+        assert room.player1.id == "alice"
+        assert room.player2.is_bot and room.has_bot
+        assert await redis.llen(_QUEUE_KEY) == 0
+        assert await redis.get("mm:player:alice:room") == room.id
+        assert await redis.get(f"mm:player:{room.player2.id}:room") is None
+
+    @pytest.mark.asyncio
+    async def test_no_bot_before_threshold(self, matchmaking, redis):
+        """Test that a player who just joined keeps waiting for a human"""
+        await _enqueue(redis, "alice", 0)
+        assert await matchmaking.try_match_bot("alice") is None
+        assert await redis.llen(_QUEUE_KEY) == 1
+
+    @pytest.mark.asyncio
+    async def test_no_bot_when_others_waiting(self, matchmaking, redis):
+        """Test that bots never replace an available human opponent"""
+        await _enqueue(redis, "alice", 60)
+        await _enqueue(redis, "bob", 60)
+        assert await matchmaking.try_match_bot("alice") is None
+        assert await redis.llen(_QUEUE_KEY) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_bot_for_other_player(self, matchmaking, redis):
+        """Test that only the waiting player's own worker can claim them"""
+        await _enqueue(redis, "alice", 60)
+        assert await matchmaking.try_match_bot("bob") is None
+
+
+class TestBotService:
+    """Test suite for bot word selection and play loop"""
+
+    @pytest.mark.unit
+    def test_choose_word_skips_used(self):
+        """Test that the cursor moves past words the opponent already played"""
+        plan = ["kale", "masa", "at", "ev"]
+        word, cursor = choose_word(plan, 0, {"kale", "masa"})
+        assert (word, cursor) == ("at", 3)
+        assert choose_word(plan, cursor, {"kale", "masa", "at", "ev"}) == (None, 4)
+
+    @pytest.mark.unit
+    def test_plan_is_a_permutation(self):
+        """Test that planning reorders the candidates without dropping any"""
+        candidates = [f"w{i}" for i in range(50)]
+        assert sorted(plan_words(candidates, 0.5, random.Random(0))) == sorted(candidates)
+
+    @pytest.mark.unit
+    def test_skill_skews_towards_top_words(self):
+        """Test that higher skill puts higher-ranked candidates first more often"""
+        candidates = [f"w{i}" for i in range(100)]
+
+        def mean_rank(skill):
+            rng = random.Random(1)
+            picks = [candidates.index(plan_words(candidates, skill, rng)[0]) for _ in range(2000)]
+            return sum(picks) / len(picks)
+
+        assert mean_rank(1.0) < mean_rank(0.5) < mean_rank(0.0)
+
+    @pytest.mark.unit
+    def test_rank_candidates_sorted_by_score(self, matchmaking, game_service):
+        """Test that candidates come back best-scoring first"""
+        bots = BotService(game_service, Mock())
+        room = game_service.create_game_room("r1", *_players())
+        ranked = bots.rank_candidates(room)
+        scores = [game_service.word_service.get_word_score(word) for word in ranked]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_bot_plays_and_notifies_human(self, game_service, monkeypatch):
+        """Test that the bot submits valid words and broadcasts them to its opponent"""
+        monkeypatch.setattr(bot_module, "think_time", lambda skill, rng: 0)
+        bridge = Mock(send_to_user=AsyncMock())
+        bots = BotService(game_service, bridge)
+        room = game_service.create_game_room("r1", *_players())
+        room.start_game()
+
+        async def end_after_three(user_id, message):
+            if len(room.player2.words) >= 3:
+                room.end_game()
+
+        bridge.send_to_user.side_effect = end_after_three
+        bots.start(room, skill=1.0)
+        await bots._tasks["r1"]
+
+        assert len(room.player2.words) == 3
+        assert room.player2.score > 0
+        assert set(room.player2.words) <= room.used_words
+        user_id, message = bridge.send_to_user.await_args.args
+        assert user_id == room.player1.id
+        assert message["type"] == "opponent_word"
+        assert bots.active_rooms() == 0
+
+
+    @pytest.mark.asyncio
+    async def test_disconnect_after_bot_match_keeps_countdown(self, workers, eventually, monkeypatch):
+        """Test that a disconnect once the bot match is made leaves the countdown running"""
+        handler, _ = workers
+        handler.bot_service = BotService(handler.matchmaking_service.game_service, handler.bridge)
+        monkeypatch.setattr(settings.game, "bot_match_after_seconds", 0)
+        matchmaking = handler.matchmaking_service
+        # fakeredis has no Lua for the human pairing: go straight to the bot fallback
+        monkeypatch.setattr(
+            matchmaking, "try_match_players", lambda bot_fallback_for: matchmaking.try_match_bot(bot_fallback_for)
+        )
+        await handler.matchmaking_service.add_to_queue("alice", "Alice")
+        handler._bot_wait_task = asyncio.create_task(handler._match_bot_after_wait("alice"))
+
+        await eventually(lambda: handler.matchmaking_service.get_room_by_player("alice") is not None)
+        room = handler.matchmaking_service.get_room_by_player("alice")
+        await handler._handle_disconnect("alice")
+
+        await eventually(lambda: room.game_started)
+        await handler.bot_service.stop()
+
+
+def _players():
+    return Player("alice", "Alice"), Player("bot:1", "Lexo Bot", is_bot=True)
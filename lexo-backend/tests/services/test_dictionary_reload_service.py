@@ -0,0 +1,120 @@
+"""
+Tests for DictionaryReloadService
+"""
+import asyncio
+import json
+
+import pytest
+import fakeredis.aioredis
+
+from app.core.dictionary import write_dictionary
+from app.models.domain import Player
+from app.services.dictionary_reload_service import (
+    _CURRENT_KEY,
+    DictionaryReloadService,
+    publish_dictionary,
+)
+from app.services.game_service import GameService
+from app.services.word_service import WordService
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def small_dictionary(tmp_path):
+    path = tmp_path / "small.dict"
+    write_dictionary(["yenikelime", "masa"], path)
+    return str(path)
+
+
+class TestDictionaryReloadService:
+    """Test suite for DictionaryReloadService"""
+
+    @pytest.mark.asyncio
+    async def test_publish_reloads_running_worker(self, redis, small_dictionary):
+        """Test that a published version is picked up over Pub/Sub"""
+        word_service = WordService()
+        reloader = DictionaryReloadService(word_service, redis)
+        await reloader.start()
+        try:
+            assert not word_service.is_valid_word("yenikelime")
+            version = await publish_dictionary(redis, small_dictionary)
+            for _ in range(100):
+                if word_service.get_version() == version:
+                    break
+                await asyncio.sleep(0.01)
+            assert word_service.get_version() == version
+            assert word_service.is_valid_word("yenikelime")
+            assert word_service.get_word_count() == 2
+        finally:
+            await reloader.stop()
+
+    @pytest.mark.asyncio
+    async def test_late_worker_converges_on_start(self, redis, small_dictionary):
+        """Test that a worker starting after the publish applies dict:current"""
+        word_service = WordService()
+        version = await publish_dictionary(redis, small_dictionary)
+        reloader = DictionaryReloadService(word_service, redis)
+        await reloader.start()
+        try:
+            assert word_service.get_version() == version
+        finally:
+            await reloader.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_keeps_newer_bundled_dictionary(self, redis, small_dictionary):
+        """Test that dict:current published before the bundled artifact was built is not applied on start"""
+        word_service = WordService()
+        bundled = word_service.get_version()
+        await redis.set(_CURRENT_KEY, json.dumps({"version": "old", "path": small_dictionary, "published_at": 0}))
+        reloader = DictionaryReloadService(word_service, redis)
+        await reloader.start()
+        try:
+            assert word_service.get_version() == bundled
+        finally:
+            await reloader.stop()
+
+    @pytest.mark.asyncio
+    async def test_in_flight_room_keeps_its_version(self, redis, small_dictionary):
+        """Test that rooms created before a reload keep validating against their dictionary"""
+        word_service = WordService()
+        game_service = GameService(word_service)
+        room = game_service.create_game_room("room_1", Player("p1", "P1"), Player("p2", "P2"))
+        room.set_letter_pool(list("yenikelime") + ["a", "s", "m", "a"])
+
+        reloader = DictionaryReloadService(word_service, redis)
+        payload = f'{{"version": "new", "path": "{small_dictionary}"}}'
+        assert await reloader.apply(payload) is True
+
+        assert game_service.validate_word_submission(room, "kelime")["valid"] is True
+        assert game_service.validate_word_submission(room, "yenikelime")["valid"] is False
+
+        new_room = game_service.create_game_room("room_2", Player("p3", "P3"), Player("p4", "P4"))
+        new_room.set_letter_pool(room.letter_pool)
+        assert game_service.validate_word_submission(new_room, "yenikelime")["valid"] is True
+        assert game_service.validate_word_submission(new_room, "kelime")["valid"] is False
+
+    @pytest.mark.asyncio
+    async def test_apply_same_version_is_noop(self, redis):
+        """Test that re-announcing the current version does nothing"""
+        word_service = WordService()
+        reloader = DictionaryReloadService(word_service, redis)
+        payload = f'{{"version": "{word_service.get_version()}", "path": "/nonexistent"}}'
+        assert await reloader.apply(payload) is False
+
+    @pytest.mark.unit
+    def test_reload_swaps_one_consistent_bundle(self, small_dictionary):
+        """Test that the dictionary, word table and anagram index always come from the same version"""
+        word_service = WordService()
+        before = word_service._bundle
+
+        word_service.reload(small_dictionary)
+
+        bundle = word_service._bundle
+        assert bundle is not before
+        assert bundle.word_table.dictionary is bundle.dictionary is bundle.anagram_index.dictionary
+        assert word_service.dictionary is bundle.dictionary
+        assert word_service.score_letter_pool(list("masa")) == (1, word_service.get_word_score("masa"))
@@ -0,0 +1,128 @@
+"""
+Tests for draining a worker and handing its rooms to a peer
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.services.drain_service import WorkerDrainService
+from app.services.matchmaking_service import _DEADLINES_KEY
+from app.websocket import game_handler
+
+
+async def _running_game(handler, time_left):
+    matchmaking = handler.matchmaking_service
+    room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+    room.start_game()
+    seconds_ago = room.duration - time_left
+    room.started_wall -= seconds_ago
+    room.started_monotonic -= seconds_ago
+    await matchmaking.room_log.started(room)
+    await matchmaking.schedule_game_end(room, lambda: handler._end_game_on_timeout(room))
+    return room
+
+
+class TestWorkerDrain:
+    """Test suite for WorkerDrainService"""
+
+    @pytest.mark.asyncio
+    async def test_long_game_moves_to_peer_with_its_deadline(self, workers, eventually):
+        """Test that a game with time left is adopted by a peer that keeps the original end time"""
+        owner, peer = workers
+        room = await _running_game(owner, time_left=45)
+        word = sorted(owner.word_service.find_playable_words(room.letter_pool, dictionary=room.dictionary))[0]
+        owner.matchmaking_service.game_service.process_word_submission(room, room.player1, word)
+        alice = Mock(send_text=AsyncMock(), close=AsyncMock())
+        await owner.bridge.register("alice", alice)
+
+        result = await WorkerDrainService(owner.matchmaking_service, owner.bridge, owner.hand_off_room).drain(timeout=1)
+
+        assert result == {"handed_off": 1, "remaining": 0}
+        assert owner.matchmaking_service.get_room(room.id) is None
+        await eventually(lambda: peer.matchmaking_service.get_room(room.id) is not None)
+        adopted = peer.matchmaking_service.get_room(room.id)
+        assert adopted.player1.words == [word]
+        assert await peer.matchmaking_service.get_room_worker(room.id) == peer.bridge.worker_id
+        remaining = peer.matchmaking_service.timers.deadline(f"{room.id}:end") - asyncio.get_running_loop().time()
+        assert abs(remaining - 45) < 1
+        assert json.loads(alice.send_text.await_args.args[0]) == {
+            "type": "server_restarting", "message": "Sunucu yeniden başlatılıyor"}
+        alice.close.assert_awaited_with(code=1012)
+
+    @pytest.mark.asyncio
+    async def test_short_game_finishes_locally(self, workers):
+        """Test that a game near its end is not moved and keeps its deadline for the reaper"""
+        owner, peer = workers
+        room = await _running_game(owner, time_left=5)
+
+        result = await WorkerDrainService(owner.matchmaking_service, owner.bridge, owner.hand_off_room).drain(timeout=0)
+
+        assert result == {"handed_off": 0, "remaining": 1}
+        assert owner.matchmaking_service.get_room(room.id) is room
+        assert peer.matchmaking_service.get_room(room.id) is None
+        assert await owner.matchmaking_service.redis.zscore(_DEADLINES_KEY, room.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_draining_worker_stops_matching(self, workers):
+        """Test that a draining worker leaves queued players to its peers"""
+        owner, _ = workers
+        owner.matchmaking_service.draining = True
+        assert await owner.matchmaking_service.try_match_players() is None
+
+    @pytest.mark.asyncio
+    async def test_disconnected_player_gets_grace_on_peer(self, workers, eventually):
+        """Test that the adopting worker restarts the grace timer for a player who dropped during the move"""
+        owner, peer = workers
+        room = await _running_game(owner, time_left=60)
+        room.player2.connected = False
+        await owner.matchmaking_service.room_log.disconnected(room, "bob")
+
+        await WorkerDrainService(owner.matchmaking_service, owner.bridge, owner.hand_off_room).drain(timeout=0)
+
+        await eventually(lambda: peer.matchmaking_service.timers.deadline(f"{room.id}:grace:bob") is not None)
+        assert peer.matchmaking_service.timers.deadline(f"{room.id}:grace:alice") is None
+
+    @pytest.mark.asyncio
+    async def test_room_stays_when_peer_never_takes_it(self, workers, monkeypatch):
+        """Test that an unacked handoff keeps the room running here and a late adopt finds nothing to take"""
+        monkeypatch.setattr(game_handler, "_HANDOFF_ACK_TIMEOUT", 0.1)
+        owner, peer = workers
+        peer.bridge.set_room_action_handler(AsyncMock())  # receives the offer, never adopts
+        room = await _running_game(owner, time_left=45)
+
+        assert not await owner.hand_off_room(room, peer.bridge.worker_id)
+
+        assert owner.matchmaking_service.get_room(room.id) is room
+        assert owner.matchmaking_service.timers.deadline(f"{room.id}:end") is not None
+        assert await owner.matchmaking_service.get_room_worker(room.id) == owner.bridge.worker_id
+        assert await peer.matchmaking_service.adopt_room(room.id, owner.bridge.worker_id) is None
+
+    @pytest.mark.asyncio
+    async def test_peer_that_never_acks_is_tried_once(self, workers, monkeypatch):
+        """Test that a drain stops offering rooms to a peer after its first missed ack"""
+        monkeypatch.setattr(game_handler, "_HANDOFF_ACK_TIMEOUT", 0.1)
+        owner, peer = workers
+        peer.bridge.set_room_action_handler(AsyncMock())  # receives the offer, never adopts
+        rooms = [await _running_game(owner, time_left=45) for _ in range(3)]
+        hand_off = AsyncMock(side_effect=owner.hand_off_room)
+
+        result = await WorkerDrainService(owner.matchmaking_service, owner.bridge, hand_off).drain(timeout=0.5)
+
+        assert hand_off.await_count == 1
+        assert result == {"handed_off": 0, "remaining": 3}
+        for room in rooms:
+            assert await owner.matchmaking_service.get_room_worker(room.id) == owner.bridge.worker_id
+
+    @pytest.mark.asyncio
+    async def test_unstarted_room_is_cancelled_without_result(self, workers):
+        """Test that a room still in countdown when the drain ends is dropped instead of left for the reaper"""
+        owner, _ = workers
+        room = await owner.matchmaking_service.create_room("alice", "Alice", "bob", "Bob")
+
+        result = await WorkerDrainService(owner.matchmaking_service, owner.bridge, owner.hand_off_room).drain(timeout=0)
+
+        assert result == {"handed_off": 0, "remaining": 0}
+        assert owner.matchmaking_service.get_room(room.id) is None
+        assert await owner.matchmaking_service.get_room_worker(room.id) is None
@@ -0,0 +1,41 @@
+"""
+Tests for the consistent hash ring used to place rooms on workers
+"""
+from collections import Counter
+
+import pytest
+
+from app.services.hash_ring import HashRing
+
+
+class TestHashRing:
+    """Test suite for HashRing"""
+
+    @pytest.mark.unit
+    def test_empty_ring_has_no_owner(self):
+        """Test that a ring without workers places nothing"""
+        assert HashRing().node_for("room-1") is None
+
+    @pytest.mark.unit
+    def test_placement_is_deterministic(self):
+        """Test that every worker computes the same owner regardless of join order"""
+        a, b = HashRing(["w1", "w2", "w3"]), HashRing(["w3", "w1", "w2"])
+        assert all(a.node_for(f"room-{i}") == b.node_for(f"room-{i}") for i in range(1000))
+
+    @pytest.mark.unit
+    def test_rooms_spread_evenly(self):
+        """Test that virtual nodes keep each worker's share near 1/N"""
+        ring = HashRing([f"w{i}" for i in range(4)])
+        shares = Counter(ring.node_for(f"room-{i}") for i in range(20000))
+        assert set(shares) == {"w0", "w1", "w2", "w3"}
+        assert all(3500 < count < 6500 for count in shares.values())
+
+    @pytest.mark.unit
+    def test_worker_leaving_moves_only_its_rooms(self):
+        """Test that removing a worker reassigns just the rooms it owned"""
+        before = HashRing(["w1", "w2", "w3", "w4"])
+        after = HashRing(["w1", "w2", "w3"])
+        for i in range(5000):
+            owner = before.node_for(f"room-{i}")
+            if owner != "w4":
+                assert after.node_for(f"room-{i}") == owner
@@ -0,0 +1,92 @@
+"""
+Tests for PoolBankService
+"""
+import pytest
+import fakeredis.aioredis
+
+from app.core.config import settings
+from app.models.domain import Player
+from app.services.game_service import GameService
+from app.services.pool_bank_service import PoolBankService, _BANK_KEY
+from app.utils.game_logic import POOL_GENERATOR_VERSION, seeded_letter_pool
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def pool_bank(word_service, redis):
+    return PoolBankService(word_service, redis)
+
+
+class TestPoolBankService:
+    """Test suite for PoolBankService"""
+
+    @pytest.mark.unit
+    def test_pop_empty_returns_none(self, pool_bank):
+        """Test that an empty local buffer yields None"""
+        assert pool_bank.pop() is None
+
+    @pytest.mark.unit
+    def test_score_pool(self, pool_bank, word_service, sample_letter_pool):
+        """Test that scoring counts playable words and sums their scores"""
+        count, total = pool_bank.score_pool(sample_letter_pool)
+        assert count == len(word_service.find_playable_words(sample_letter_pool))
+        assert total >= count * 2
+
+    @pytest.mark.unit
+    def test_rejects_low_quality_pool(self, pool_bank):
+        """Test that a pool with no playable words is rejected"""
+        assert not pool_bank.is_acceptable(*pool_bank.score_pool(['j'] * 16))
+
+    @pytest.mark.asyncio
+    async def test_fill_bank_and_local_buffer(self, pool_bank, redis, monkeypatch):
+        """Test that the producer fills Redis and the local buffer with accepted pools"""
+        monkeypatch.setattr(settings.game, "pool_bank_size", 5)
+        monkeypatch.setattr(settings.game, "pool_bank_local_buffer", 3)
+
+        assert await pool_bank._fill_bank() is True
+        assert await redis.llen(_BANK_KEY) == 5
+        assert await pool_bank._fill_bank() is False
+
+        assert await pool_bank._fill_local_buffer() is True
+        assert pool_bank.local_depth() == 3
+        assert await redis.llen(_BANK_KEY) == 2
+
+        pool, _ = seeded_letter_pool(pool_bank.pop(), settings.game.letter_pool_size)
+        assert len(pool) == settings.game.letter_pool_size
+        assert pool_bank.is_acceptable(*pool_bank.score_pool(pool))
+
+    @pytest.mark.asyncio
+    async def test_game_service_uses_banked_pool(self, pool_bank, word_service, redis, monkeypatch):
+        """Test that room creation pops a banked pool, then falls back to inline generation"""
+        monkeypatch.setattr(settings.game, "pool_bank_size", 1)
+        monkeypatch.setattr(settings.game, "pool_bank_local_buffer", 1)
+        await pool_bank._fill_bank()
+        await pool_bank._fill_local_buffer()
+        banked = pool_bank._ready[0]
+
+        game_service = GameService(word_service, pool_bank)
+        room = game_service.create_game_room("room_1", Player("p1", "P1"), Player("p2", "P2"))
+        assert room.pool_seed == banked
+        assert room.pool_generator_version == POOL_GENERATOR_VERSION
+        assert room.letter_pool.to_list() == seeded_letter_pool(banked, settings.game.letter_pool_size)[0]
+
+        fallback = game_service.create_game_room("room_2", Player("p3", "P3"), Player("p4", "P4"))
+        assert len(fallback.letter_pool) == settings.game.letter_pool_size
+
+    @pytest.mark.asyncio
+    async def test_stale_bank_entries_are_skipped(self, pool_bank, redis, monkeypatch):
+        """Test that seeds banked for another generator version or pool size are dropped"""
+        monkeypatch.setattr(settings.game, "pool_bank_local_buffer", 3)
+        size = settings.game.letter_pool_size
+        await redis.rpush(
+            _BANK_KEY,
+            f"{POOL_GENERATOR_VERSION + 1}:{size}:1",
+            f"{POOL_GENERATOR_VERSION}:{size + 1}:2",
+            f"{POOL_GENERATOR_VERSION}:{size}:3",
+        )
+        await pool_bank._fill_local_buffer()
+        assert list(pool_bank._ready) == [3]
@@ -0,0 +1,109 @@
+"""
+Tests for the per-room event log
+"""
+import pytest
+import fakeredis.aioredis
+
+from app.core.config import settings
+from app.services.game_service import GameService
+from app.services.matchmaking_service import MatchmakingService
+from app.services.room_event_log import room_log_key
+
+
+@pytest.fixture
+def matchmaking(word_service):
+    return MatchmakingService(GameService(word_service), fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+
+async def _play(matchmaking, room, words):
+    for turn, word in enumerate(words):
+        player = room.player1 if turn % 2 == 0 else room.player2
+        matchmaking.game_service.process_word_submission(room, player, word)
+        await matchmaking.room_log.flush(room)
+
+
+def _playable(matchmaking, room, count):
+    words = matchmaking.game_service.word_service.find_playable_words(room.letter_pool, dictionary=room.dictionary)
+    return sorted(words)[:count]
+
+
+class TestRoomEventLog:
+    """Test suite for RoomEventLog"""
+
+    @pytest.mark.asyncio
+    async def test_any_worker_rebuilds_the_room(self, matchmaking, word_service):
+        """Test that a second worker replays the log into the same room state"""
+        room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+        room.start_game()
+        await matchmaking.room_log.started(room)
+        await _play(matchmaking, room, _playable(matchmaking, room, 4))
+        room.player2.connected = False
+        await matchmaking.room_log.disconnected(room, "bob")
+
+        other = MatchmakingService(GameService(word_service), matchmaking.redis)
+        rebuilt = await other.load_room(room.id)
+
+        expected, actual = room.to_snapshot(), rebuilt.to_snapshot()
+        assert set(actual.pop("used_words").split(",")) == set(expected.pop("used_words").split(","))
+        assert actual == expected
+        assert rebuilt.get_time_remaining() == room.get_time_remaining()
+
+    @pytest.mark.asyncio
+    async def test_consumable_refills_replay(self, matchmaking, monkeypatch):
+        """Test that refilled tiles replay in place and the seeded refill stream stays in step"""
+        monkeypatch.setattr(settings.game, "pool_mode", "consumable")
+        room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+        room.start_game()
+        await matchmaking.room_log.started(room)
+        for _ in range(3):
+            await _play(matchmaking, room, _playable(matchmaking, room, 1))
+
+        rebuilt = await matchmaking.load_room(room.id)
+        assert rebuilt.letter_pool == room.letter_pool
+        assert rebuilt.pool_version == room.pool_version == 3
+        assert rebuilt.refill_rng.random() == room.refill_rng.random()
+
+    @pytest.mark.asyncio
+    async def test_word_append_is_constant_size(self, matchmaking):
+        """Test that each word adds one small entry rather than rewriting the room"""
+        room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+        room.start_game()
+        await matchmaking.room_log.started(room)
+        await _play(matchmaking, room, _playable(matchmaking, room, 6))
+
+        entries = await matchmaking.room_log.read(room.id)
+        assert [fields["type"] for _, fields in entries] == ["created", "started"] + ["word"] * 6
+        assert all(len(fields) <= 5 for _, fields in entries[2:])
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_queued_words_and_refreshes_ttl(self, matchmaking):
+        """Test that submissions queue events on the room and one flush writes them all"""
+        room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+        room.start_game()
+        await matchmaking.room_log.started(room)
+        await matchmaking.redis.expire(room_log_key(room.id), 5)
+        for turn, word in enumerate(_playable(matchmaking, room, 3)):
+            matchmaking.game_service.process_word_submission(room, (room.player1, room.player2)[turn % 2], word)
+        assert len(room.pending_events) == 3
+
+        await matchmaking.room_log.flush(room)
+        assert room.pending_events == []
+        assert len(await matchmaking.room_log.read(room.id)) == 5
+        assert await matchmaking.redis.ttl(room_log_key(room.id)) > 5
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_a_short_audit_trail(self, matchmaking):
+        """Test that cleanup closes the log with an ended event and late events are dropped"""
+        room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+        room.start_game()
+        room.end_game()
+        await matchmaking.cleanup_room(room.id)
+
+        entries = await matchmaking.room_log.read(room.id)
+        assert entries[-1][1] == {"type": "ended", "winner": ""}
+        assert 0 < await matchmaking.redis.ttl(room_log_key(room.id)) <= 600
+
+        await matchmaking.redis.delete(room_log_key(room.id))
+        await matchmaking.room_log.disconnected(room, "alice")
+        assert await matchmaking.redis.exists(room_log_key(room.id)) == 0
+        assert await matchmaking.load_room(room.id) is None
@@ -0,0 +1,101 @@
+"""
+Tests for placing matched rooms on their ring owner
+"""
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.models.domain import Player
+from app.services.matchmaking_service import _WORKERS_KEY
+
+
+async def _room_owned_by(matchmaking, worker_id):
+    """Create rooms until one hashes onto ``worker_id``."""
+    for i in range(100):
+        room = await matchmaking.create_room(f"alice{i}", "Alice", f"bob{i}", "Bob")
+        if matchmaking.place_room(room) == worker_id:
+            return room
+        await matchmaking.cleanup_room(room.id)
+    raise AssertionError("no room hashed onto the worker")
+
+
+def _messages(socket, msg_type):
+    return [m for m in map(json.loads, (c.args[0] for c in socket.send_text.await_args_list))
+            if m.get("type") == msg_type]
+
+
+class TestRoomPlacement:
+    """Test suite for consistent-hash room placement"""
+
+    @pytest.mark.asyncio
+    async def test_both_workers_share_one_ring(self, workers):
+        """Test that every worker agrees on the owner of a room"""
+        first, second = workers
+        assert first.matchmaking_service.ring.nodes == {first.bridge.worker_id, second.bridge.worker_id}
+        assert all(
+            first.matchmaking_service.ring.node_for(f"r{i}") == second.matchmaking_service.ring.node_for(f"r{i}")
+            for i in range(100)
+        )
+
+    @pytest.mark.asyncio
+    async def test_match_moves_to_ring_owner_with_reconnect_hint(self, workers, eventually):
+        """Test that the ring owner adopts and starts the room and points remote players at itself"""
+        matcher, owner = workers
+        room = await _room_owned_by(matcher.matchmaking_service, owner.bridge.worker_id)
+        alice, bob = Mock(send_text=AsyncMock()), Mock(send_text=AsyncMock())
+        await matcher.bridge.register(room.player1.id, alice)
+        await owner.bridge.register(room.player2.id, bob)
+
+        await matcher._handle_match_found(room)
+
+        assert matcher.matchmaking_service.get_room(room.id) is None
+        await eventually(lambda: _messages(alice, "game_start") and _messages(bob, "game_start"))
+        assert owner.matchmaking_service.get_room(room.id).game_started
+        assert await owner.matchmaking_service.get_room_worker(room.id) == owner.bridge.worker_id
+        assert _messages(alice, "match_found")[0]["reconnect_url"] == "wss://worker-1.example/ws/queue"
+        assert "reconnect_url" not in _messages(bob, "match_found")[0]
+
+    @pytest.mark.asyncio
+    async def test_bot_rooms_stay_with_the_human(self, workers):
+        """Test that bot games are never moved off the worker that matched them"""
+        matcher, _ = workers
+        room = matcher.matchmaking_service.game_service.create_game_room(
+            "r1", Player("alice", "Alice"), Player("bot:1", "Bot", is_bot=True)
+        )
+        assert matcher.matchmaking_service.place_room(room) == matcher.bridge.worker_id
+
+    @pytest.mark.asyncio
+    async def test_draining_worker_leaves_the_ring(self, workers):
+        """Test that peers stop placing rooms on a worker once it starts draining"""
+        draining, other = workers
+        await draining.matchmaking_service.start_draining()
+        await other.matchmaking_service.refresh_workers()
+        assert other.matchmaking_service.ring.nodes == {other.bridge.worker_id}
+
+    @pytest.mark.asyncio
+    async def test_lapsed_heartbeat_leaves_the_ring(self, workers):
+        """Test that membership comes from the heartbeat ZSET and lapsed workers are pruned by score"""
+        gone, other = workers
+        redis = other.matchmaking_service.redis
+        await redis.zadd(_WORKERS_KEY, {gone.bridge.worker_id: 1})
+
+        await other.matchmaking_service.refresh_workers()
+        assert other.matchmaking_service.ring.nodes == {other.bridge.worker_id}
+
+        await other.matchmaking_service.heartbeat(30)
+        assert await redis.zrange(_WORKERS_KEY, 0, -1) == [other.bridge.worker_id]
+
+    @pytest.mark.asyncio
+    async def test_rooms_stay_local_without_public_endpoints(self, workers):
+        """Test that workers without WS_PUBLIC_URL keep their rooms instead of proxying them to peers"""
+        here, peer = workers
+        peer.matchmaking_service.endpoint = ""
+        await peer.matchmaking_service.heartbeat(30)
+        await here.matchmaking_service.refresh_workers()
+        assert here.matchmaking_service.ring.nodes == {here.bridge.worker_id}
+
+        here.matchmaking_service.endpoint = ""
+        for i in range(20):
+            room = await here.matchmaking_service.create_room(f"alice{i}", "Alice", f"bob{i}", "Bob")
+            assert here.matchmaking_service.place_room(room) == here.bridge.worker_id
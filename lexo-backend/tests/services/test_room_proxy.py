@@ -0,0 +1,103 @@
+"""
+Tests for forwarding room messages to the worker that owns the room
+"""
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+
+def _socket():
+    return Mock(send_json=AsyncMock(), send_text=AsyncMock())
+
+
+def _sent(socket, msg_type):
+    """Messages of ``msg_type`` a socket got, whether sent directly or through the bridge."""
+    messages = [c.args[0] for c in socket.send_json.await_args_list]
+    messages += [json.loads(c.args[0]) for c in socket.send_text.await_args_list]
+    return [m for m in messages if m.get("type") == msg_type]
+
+
+async def _remote_game(owner, other):
+    """alice plays on the owner worker, bob's connection sits on the other one."""
+    room = await owner.matchmaking_service.create_room("alice", "Alice", "bob", "Bob")
+    room.start_game()
+    await owner.matchmaking_service.room_log.started(room)
+    alice, bob = _socket(), _socket()
+    await owner.bridge.register("alice", alice)
+    await other.bridge.register("bob", bob)
+    return room, alice, bob
+
+
+class TestRoomProxy:
+    """Test suite for cross-worker room proxying"""
+
+    @pytest.mark.asyncio
+    async def test_word_from_other_worker_is_played_by_owner(self, workers, eventually):
+        """Test that a word sent on a non-owner worker is scored by the owner and both players hear back"""
+        owner, other = workers
+        room, alice, bob = await _remote_game(owner, other)
+        word = sorted(owner.word_service.find_playable_words(room.letter_pool, dictionary=room.dictionary))[0]
+
+        await other._handle_word_submission(bob, "bob", {"type": "submit_word", "word": word}, "Bob")
+
+        await eventually(lambda: _sent(bob, "word_valid") and _sent(alice, "opponent_word"))
+        assert room.player2.words == [word]
+        assert _sent(alice, "opponent_word")[0]["player"] == "Bob"
+        assert [f["type"] for _, f in await owner.matchmaking_service.room_log.read(room.id)][-1] == "word"
+
+    @pytest.mark.asyncio
+    async def test_emoji_and_prefix_checks_are_forwarded(self, workers, eventually):
+        """Test that emoji and prefix checks reach the owner and replies go to the sender's socket"""
+        owner, other = workers
+        room, alice, bob = await _remote_game(owner, other)
+
+        await other._handle_emoji_message(bob, "bob", {"type": "send_emoji", "emoji": "👍"}, "Bob")
+        await other._handle_prefix_check(bob, "bob", {"type": "check_prefix", "prefix": room.letter_pool.to_list()[0]})
+
+        await eventually(lambda: _sent(alice, "emoji_received") and _sent(bob, "prefix_result"))
+        assert not _sent(bob, "emoji_error")
+
+    @pytest.mark.asyncio
+    async def test_disconnect_and_reconnect_drive_owner_grace_timer(self, workers, eventually):
+        """Test that a remote disconnect starts the owner's grace timer and a remote reconnect cancels it"""
+        owner, other = workers
+        room, alice, bob = await _remote_game(owner, other)
+        grace_key = f"{room.id}:grace:bob"
+
+        await other._handle_disconnect("bob")
+        await eventually(lambda: owner.matchmaking_service.timers.deadline(grace_key) is not None)
+        assert not room.player2.connected
+        assert _sent(alice, "opponent_disconnected_temp")
+
+        await other._forward_to_room_owner(_socket(), "bob", {"type": "reconnect"})
+        await eventually(lambda: room.player2.connected)
+        assert owner.matchmaking_service.timers.deadline(grace_key) is None
+
+    @pytest.mark.asyncio
+    async def test_no_owner_keeps_local_behaviour(self, workers):
+        """Test that players without a room anywhere still get the local error reply"""
+        _, other = workers
+        bob = _socket()
+        await other._handle_emoji_message(bob, "bob", {"type": "send_emoji", "emoji": "👍"}, "Bob")
+        assert _sent(bob, "emoji_error")
+
+    @pytest.mark.asyncio
+    async def test_countdown_disconnect_cancels_without_result(self, workers, eventually):
+        """Test that a player who drops before the game starts and never returns cancels the match instead of forfeiting"""
+        owner, other = workers
+        room = await owner.matchmaking_service.create_room("alice", "Alice", "bob", "Bob")
+        alice = _socket()
+        await owner.bridge.register("alice", alice)
+        await other.bridge.register("bob", _socket())
+        owner._save_game_to_database = AsyncMock()
+
+        await other._handle_disconnect("bob")
+        await eventually(lambda: not room.player2.connected)
+        room.start_game()  # countdown finishes while bob is still away
+        await owner._handle_grace_period_timeout(room, "bob")
+
+        await eventually(lambda: _sent(alice, "match_cancelled"))
+        owner._save_game_to_database.assert_not_awaited()
+        assert not _sent(alice, "opponent_disconnected")
+        assert owner.matchmaking_service.get_room(room.id) is None
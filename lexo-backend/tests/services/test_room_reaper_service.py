@@ -0,0 +1,125 @@
+"""
+Tests for crash-durable game deadlines and RoomReaperService
+"""
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import fakeredis.aioredis
+
+from app.models.domain import GameRoom, Player
+from app.services.game_service import GameService
+from app.services.matchmaking_service import MatchmakingService, _DEADLINES_KEY
+from app.services.room_reaper_service import RoomReaperService
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+def _worker(word_service, redis, worker_id):
+    matchmaking = MatchmakingService(GameService(word_service), redis)
+    matchmaking.worker_id = worker_id
+    save_game = AsyncMock()
+    bridge = Mock(send_many=AsyncMock(return_value=2))
+    return matchmaking, RoomReaperService(matchmaking, bridge, save_game=save_game), save_game
+
+
+async def _started_game(matchmaking, seconds_ago):
+    room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+    room.start_game()
+    room.started_wall -= seconds_ago
+    await matchmaking.room_log.started(room)
+    matchmaking.game_service.process_word_submission(room, room.player1, "kalem")
+    await matchmaking.room_log.flush(room)
+
+    async def never():
+        raise AssertionError("dead worker's timer fired")
+
+    await matchmaking.schedule_game_end(room, never)
+    await matchmaking.timers.stop()  # the owner dies with its timers
+    return room
+
+
+class TestRoomSnapshot:
+    """Test suite for GameRoom.from_snapshot"""
+
+    @pytest.mark.unit
+    def test_snapshot_round_trip(self, word_service):
+        """Test that a room rebuilt from its snapshot keeps scores, words and the seeded pool"""
+        room = GameService(word_service).create_game_room("r1", Player("alice", "Alice"), Player("bob", "Bob"))
+        room.start_game()
+        room.player1.add_word("kalem")
+        room.player1.add_score(9)
+        room.add_used_word("kalem")
+
+        rebuilt = GameRoom.from_snapshot(room.to_snapshot())
+        assert rebuilt.player1.words == ["kalem"] and rebuilt.player1.score == 9
+        assert rebuilt.used_words == {"kalem"}
+        assert rebuilt.initial_letter_pool == room.initial_letter_pool
+        assert rebuilt.pool_seed == room.pool_seed
+        assert int(rebuilt.started_wall) == int(room.started_wall)
+        assert rebuilt.get_time_remaining() == room.get_time_remaining()
+
+
+class TestRoomReaper:
+    """Test suite for finalizing games of dead workers"""
+
+    @pytest.mark.asyncio
+    async def test_orphaned_game_finalized_once(self, word_service, redis):
+        """Test that an overdue room of a dead worker is ended, saved once and cleaned up"""
+        dead, _, _ = _worker(word_service, redis, "dead")
+        room = await _started_game(dead, seconds_ago=120)
+
+        survivor, reaper, save_game = _worker(word_service, redis, "alive")
+        _, other_reaper, other_save = _worker(word_service, redis, "alive-2")
+        await survivor.heartbeat(30)
+
+        assert await reaper.reap_once() == 1
+        assert await other_reaper.reap_once() == 0
+
+        save_game.assert_awaited_once()
+        other_save.assert_not_awaited()
+        saved_room, winner, _ = save_game.await_args.args
+        assert saved_room.id == room.id and saved_room.game_ended
+        assert winner == "Alice"
+        assert saved_room.player1.words == room.player1.words
+        reaper.bridge.send_many.assert_awaited_once_with(["alice", "bob"], {
+            "type": "game_end",
+            "winner": "Alice",
+            "scores": room.get_scores(),
+            "is_tie": False,
+            "game_saved_by_server": True,
+        })
+        assert await redis.zcard(_DEADLINES_KEY) == 0
+        assert await redis.ttl(f"mm:room:{room.id}:events") <= 600
+        assert await redis.get("mm:player:alice:room") is None
+
+    @pytest.mark.asyncio
+    async def test_live_owner_keeps_its_room(self, word_service, redis):
+        """Test that rooms whose owner still heartbeats are never claimed"""
+        owner, _, _ = _worker(word_service, redis, "owner")
+        await owner.heartbeat(30)
+        await _started_game(owner, seconds_ago=120)
+
+        _, reaper, save_game = _worker(word_service, redis, "other")
+        assert await reaper.reap_once() == 0
+        save_game.assert_not_awaited()
+        assert await redis.zcard(_DEADLINES_KEY) == 1
+
+    @pytest.mark.asyncio
+    async def test_running_game_not_reaped(self, word_service, redis):
+        """Test that a dead worker's game is left alone until its deadline plus the reap delay"""
+        dead, _, _ = _worker(word_service, redis, "dead")
+        await _started_game(dead, seconds_ago=5)
+
+        _, reaper, _ = _worker(word_service, redis, "alive")
+        assert await reaper.reap_once() == 0
+
+    @pytest.mark.asyncio
+    async def test_owner_save_claim_blocks_second_save(self, word_service, redis):
+        """Test that the save claim is granted to one worker only"""
+        first, _, _ = _worker(word_service, redis, "w1")
+        second, _, _ = _worker(word_service, redis, "w2")
+        assert await first.claim_game_save("room-1")
+        assert not await second.claim_game_save("room-1")
@@ -0,0 +1,128 @@
+"""
+Tests for RoomRegistry and its use in MatchmakingService
+"""
+import time
+
+import pytest
+import fakeredis.aioredis
+
+from app.models.domain import GameRoom, Player
+from app.services.game_service import GameService
+from app.services.matchmaking_service import MatchmakingService
+from app.services.room_registry import RoomRegistry
+
+
+def _room(room_id, p1, p2, bot=False):
+    return GameRoom(room_id, Player(p1, p1.title()), Player(p2, p2.title(), is_bot=bot))
+
+
+class TestRoomRegistry:
+    """Test suite for RoomRegistry"""
+
+    @pytest.mark.unit
+    def test_player_and_room_indexes(self):
+        """Test that rooms resolve by id and by either player"""
+        registry = RoomRegistry()
+        room = _room("r1", "alice", "bob")
+        registry.add(room, 100.0)
+
+        assert registry.get("r1") is room
+        assert registry.get_by_player("alice") is room
+        assert registry.get_by_player("bob") is room
+        assert registry.get_by_player("carol") is None
+        assert "r1" in registry and len(registry) == 1
+
+    @pytest.mark.unit
+    def test_remove_clears_every_index(self):
+        """Test that removing a room drops its players and its deadline"""
+        registry = RoomRegistry()
+        registry.add(_room("r1", "alice", "bob"), 100.0)
+        registry.add(_room("r2", "carol", "bot:1", bot=True), 50.0)
+
+        assert registry.remove("r2").id == "r2"
+        assert registry.remove("r2") is None
+        assert registry.get_by_player("carol") is None
+        assert registry.counts() == {
+            "active_rooms": 1,
+            "players_in_rooms": 2,
+            "bot_rooms": 0,
+            "pending_expiries": 1,
+        }
+        assert registry.pop_expired(1000.0)[0].id == "r1"
+
+    @pytest.mark.unit
+    def test_newer_room_owns_player(self):
+        """Test that cleaning up an old room keeps the player's newer room indexed"""
+        registry = RoomRegistry()
+        registry.add(_room("old", "alice", "bob"), 100.0)
+        registry.add(_room("new", "alice", "carol"), 200.0)
+        registry.remove("old")
+
+        assert registry.get_by_player("alice").id == "new"
+        assert registry.get_by_player("bob") is None
+
+    @pytest.mark.unit
+    def test_expiry_order_and_reschedule(self):
+        """Test that rooms expire oldest first and a reschedule supersedes the old deadline"""
+        registry = RoomRegistry()
+        registry.add(_room("r1", "a", "b"), 30.0)
+        registry.add(_room("r2", "c", "d"), 10.0)
+        registry.add(_room("r3", "e", "f"), 20.0)
+        registry.reschedule("r3", 99.0)
+
+        assert registry.next_expiry() == 10.0
+        assert [room.id for room in registry.pop_expired(50.0)] == ["r2", "r1"]
+        assert registry.pop_expired(50.0) == []
+        assert registry.next_expiry() == 99.0
+        assert len(registry) == 3
+
+
+class TestMatchmakingRegistry:
+    """Test suite for MatchmakingService room bookkeeping"""
+
+    @pytest.fixture
+    def matchmaking(self, word_service):
+        return MatchmakingService(GameService(word_service), fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+    @pytest.mark.asyncio
+    async def test_create_and_cleanup_keep_indexes_consistent(self, matchmaking):
+        """Test that room creation and cleanup update lookups and stats together"""
+        room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+        assert matchmaking.get_room_by_player("bob") is room
+        assert matchmaking.get_stats()["players_in_rooms"] == 2
+
+        await matchmaking.cleanup_room(room.id)
+        assert matchmaking.get_room_by_player("alice") is None
+        assert matchmaking.get_stats()["active_rooms"] == 0
+        assert await matchmaking.redis.get("mm:player:alice:room") is None
+
+    @pytest.mark.asyncio
+    async def test_sweep_removes_expired_rooms(self, matchmaking, monkeypatch):
+        """Test that rooms past the TTL are swept out locally and in Redis"""
+        room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 7201)
+
+        assert await matchmaking.sweep_expired_rooms() == 1
+        assert room.game_ended
+        assert matchmaking.get_room(room.id) is None
+        assert await matchmaking.redis.exists(f"mm:room:{room.id}") == 0
+
+    @pytest.mark.asyncio
+    async def test_cleanup_cancels_room_timers(self, matchmaking):
+        """Test that cleaning up a room drops its game-end and grace timers"""
+        room = await matchmaking.create_room("alice", "Alice", "bob", "Bob")
+
+        async def never():
+            raise AssertionError("timer should have been cancelled")
+
+        room.start_game()
+        await matchmaking.schedule_game_end(room, never)
+        matchmaking.schedule_grace_timeout(room, "alice", never)
+        assert matchmaking.get_stats()["pending_timers"] == 2
+        assert matchmaking.cancel_grace_timeout(room, "alice")
+        matchmaking.schedule_grace_timeout(room, "alice", never)
+
+        await matchmaking.cleanup_room(room.id)
+        assert matchmaking.get_stats()["pending_timers"] == 0
+        assert await matchmaking.redis.zcard("mm:deadlines") == 0
@@ -0,0 +1,135 @@
+"""
+Tests for TimerService
+"""
+import asyncio
+import tracemalloc
+
+import pytest
+
+from app.services.timer_service import TimerService
+
+
+class TestTimerService:
+    """Test suite for TimerService"""
+
+    @pytest.mark.asyncio
+    async def test_fires_in_deadline_order(self):
+        """Test that timers fire once each, earliest deadline first"""
+        timers = TimerService()
+        fired = []
+
+        def record(key):
+            async def callback():
+                fired.append(key)
+            return callback
+
+        for key, delay in (("c", 0.03), ("a", 0.01), ("b", 0.02)):
+            timers.call_later(key, delay, record(key))
+        assert timers.pending() == 3
+
+        await asyncio.sleep(0.06)
+        assert fired == ["a", "b", "c"]
+        assert timers.pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_and_reschedule(self):
+        """Test that cancelled timers never fire and rescheduled ones fire at the new deadline"""
+        timers = TimerService()
+        fired = []
+
+        async def end():
+            fired.append("end")
+
+        async def grace():
+            fired.append("grace")
+
+        loop = asyncio.get_running_loop()
+        timers.call_later("room:end", 0.01, end)
+        timers.call_later("room:grace", 0.01, grace)
+        assert timers.cancel("room:grace")
+        assert not timers.cancel("room:grace")
+        assert timers.reschedule("room:end", loop.time() + 0.04)
+        assert not timers.reschedule("missing", loop.time())
+
+        await asyncio.sleep(0.02)
+        assert fired == []
+        await asyncio.sleep(0.04)
+        assert fired == ["end"]
+
+    @pytest.mark.asyncio
+    async def test_scheduling_same_key_replaces_timer(self):
+        """Test that a key holds at most one pending timer"""
+        timers = TimerService()
+        fired = []
+
+        async def first():
+            fired.append(1)
+
+        async def second():
+            fired.append(2)
+
+        timers.call_later("room:grace:alice", 0.01, first)
+        timers.call_later("room:grace:alice", 0.02, second)
+        assert timers.pending() == 1
+
+        await asyncio.sleep(0.04)
+        assert fired == [2]
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_everything(self):
+        """Test that stop drops pending timers"""
+        timers = TimerService()
+        fired = []
+
+        async def callback():
+            fired.append(1)
+
+        timers.call_later("room:end", 0.01, callback)
+        await timers.stop()
+        await asyncio.sleep(0.02)
+        assert fired == [] and timers.pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_100k_rooms_bounded_and_on_time(self):
+        """Test 100k concurrent room deadlines: small per-timer memory, heap stays compact, fires on time"""
+        rooms = 100_000
+        timers = TimerService()
+        loop = asyncio.get_running_loop()
+        lateness = []
+
+        def make(when):
+            async def callback():
+                lateness.append(loop.time() - when)
+            return callback
+
+        async def noop():
+            pass
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for i in range(rooms):
+                timers.call_at(f"room-{i}:end", loop.time() + 3600, noop)
+            per_timer = (tracemalloc.get_traced_memory()[0] - before) / rooms
+        finally:
+            tracemalloc.stop()
+        assert per_timer < 1024
+
+        # A 60s game over 100k rooms ends ~1.7k rooms/s; bring 2k of them due within the next second
+        due = 2000
+        start = loop.time() + 0.2
+        for i in range(0, rooms, rooms // due):
+            when = start + i / rooms
+            timers.call_at(f"room-{i}:end", when, make(when))
+        for i in range(1, rooms, 2):
+            timers.cancel(f"room-{i}:end")
+        assert timers.pending() == rooms // 2
+        assert len(timers._heap) <= 2 * timers.pending() + 64
+
+        await asyncio.sleep(1.5)
+        assert len(lateness) == due
+        assert timers.pending() == rooms // 2 - due
+        lateness.sort()
+        assert lateness[0] >= 0
+        assert lateness[len(lateness) // 2] < 0.02
+        await timers.stop()
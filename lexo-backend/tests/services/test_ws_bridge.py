@@ -0,0 +1,144 @@
+"""
+Tests for WebSocketBridge message delivery
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import fakeredis.aioredis
+
+from app.services import ws_bridge
+from app.services.ws_bridge import WebSocketBridge
+
+
+@pytest.fixture
+async def bridges():
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    pair = [WebSocketBridge(redis), WebSocketBridge(redis)]
+    for bridge in pair:
+        await bridge.start()
+    await asyncio.sleep(0.05)  # let both listeners subscribe
+    yield pair
+    for bridge in pair:
+        await bridge.stop()
+
+
+class TestWebSocketBridge:
+    """Test suite for WebSocketBridge"""
+
+    @pytest.mark.asyncio
+    async def test_send_many_encodes_once(self, bridges, eventually):
+        """Test that one send_many to a local and a remote user serializes the message a single time"""
+        here, there = bridges
+        alice, bob = Mock(send_text=AsyncMock()), Mock(send_text=AsyncMock())
+        await here.register("alice", alice)
+        await there.register("bob", bob)
+        message = {"type": "game_end", "winner": "Ayşe", "scores": [{"username": "Ayşe", "score": 12}]}
+
+        with patch.object(ws_bridge.orjson, "dumps", wraps=ws_bridge.orjson.dumps) as dumps:
+            assert await here.send_many(["alice", "bob"], message) == 2
+            await eventually(lambda: bob.send_text.await_count == 1)
+
+        assert dumps.call_count == 1
+        assert alice.send_text.await_args.args[0] == bob.send_text.await_args.args[0]
+        assert json.loads(bob.send_text.await_args.args[0]) == message
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_not_dispatched(self, bridges):
+        """Test that users with no connection anywhere are skipped"""
+        here, _ = bridges
+        assert await here.send_many(["nobody"], {"type": "game_start"}) == 0
+        assert not await here.send_to_user("nobody", {"type": "ping"})
+
+    @pytest.mark.asyncio
+    async def test_send_many_groups_remote_users_per_worker(self, bridges, eventually):
+        """Test that remote users are resolved in one MGET and share one payload per worker"""
+        here, there = bridges
+        bob, carol = Mock(send_text=AsyncMock()), Mock(send_text=AsyncMock())
+        await there.register("bob", bob)
+        await there.register("carol", carol)
+
+        with patch.object(here.redis, "get", wraps=here.redis.get) as get, \
+                patch.object(there, "_send_local_many", wraps=there._send_local_many) as delivered:
+            assert await here.send_many(["bob", "carol"], {"type": "game_start"}) == 2
+            await eventually(lambda: bob.send_text.await_count and carol.send_text.await_count)
+
+        get.assert_not_called()
+        delivered.assert_awaited_once()
+        assert sorted(delivered.await_args.args[0]) == ["bob", "carol"]
+
+    @pytest.mark.asyncio
+    async def test_slow_socket_does_not_delay_the_other(self, bridges, monkeypatch):
+        """Test that local sends run concurrently and a stalled client is closed after the timeout"""
+        here, _ = bridges
+        monkeypatch.setattr(ws_bridge, "_LOCAL_SEND_TIMEOUT", 0.1)
+
+        async def stalled(_):
+            await asyncio.sleep(5)
+
+        slow, fast = Mock(send_text=AsyncMock(side_effect=stalled), close=AsyncMock()), Mock(send_text=AsyncMock())
+        await here.register("slow", slow)
+        await here.register("fast", fast)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert await here.send_many(["slow", "fast"], {"type": "game_end"}) == 1
+        assert loop.time() - started < 1
+        fast.send_text.assert_awaited_once()
+        # The cancelled write may have left half a frame: the socket is closed, not reused
+        slow.close.assert_awaited_once_with(code=1011)
+        assert here.get_local_websocket("slow") is None
+        assert await here.redis.get("player:slow:ws:worker") is None
+
+    @pytest.mark.asyncio
+    async def test_unregister_keeps_mapping_owned_by_another_worker(self, bridges):
+        """Test that closing the old socket after a move to another worker does not wipe the new mapping"""
+        old, new = bridges
+        await old.register("alice", Mock(send_text=AsyncMock()))
+        await new.register("alice", Mock(send_text=AsyncMock()))
+
+        await old.unregister("alice")
+
+        assert await old.redis.get("player:alice:ws:worker") == new.worker_id
+        assert await old.is_user_connected("alice")
+
+        await new.unregister("alice")
+        assert not await new.redis.exists("player:alice:ws:worker")
+
+    @pytest.mark.asyncio
+    async def test_legacy_envelope_is_still_delivered(self, bridges, eventually):
+        """Test that a pre-v2 worker's JSON envelope on the old channel reaches the local socket"""
+        here, _ = bridges
+        alice = Mock(send_text=AsyncMock())
+        await here.register("alice", alice)
+
+        await here.redis.publish(
+            f"ws:worker:{here.worker_id}", json.dumps({"user_id": "alice", "message": {"type": "game_start"}})
+        )
+
+        await eventually(lambda: alice.send_text.await_count == 1)
+        assert json.loads(alice.send_text.await_args.args[0]) == {"type": "game_start"}
+
+    @pytest.mark.asyncio
+    async def test_pre_v2_worker_gets_legacy_envelopes(self, bridges):
+        """Test that users on a worker listening only on the old channel get the JSON shape it parses"""
+        here, _ = bridges
+        pubsub = here.redis.pubsub()
+        await pubsub.subscribe("ws:worker:old-worker")
+        await pubsub.get_message(timeout=1)  # subscribe confirmation
+        for user_id in ("bob", "carol"):
+            await here.redis.set(f"player:{user_id}:ws:worker", "old-worker")
+
+        assert await here.send_many(["bob", "carol"], {"type": "game_end"}) == 2
+
+        received = []
+        while len(received) < 2:
+            raw = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+            assert raw is not None, "legacy envelope not published"
+            received.append(json.loads(raw["data"]))
+        await pubsub.aclose()
+        assert sorted(received, key=lambda e: e["user_id"]) == [
+            {"user_id": "bob", "message": {"type": "game_end"}},
+            {"user_id": "carol", "message": {"type": "game_end"}},
+        ]
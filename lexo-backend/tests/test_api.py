@@ -5,6 +5,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.api.dependencies.auth import get_current_user
+from app.api.v1.endpoints.words import _accepts_gzip
 
 
 class TestHealthEndpoint:
@@ -52,6 +53,85 @@ class TestWordValidationEndpoint:
         assert response.status_code in [200, 422]
 
 
+class TestBatchWordValidationEndpoint:
+    """Tests for the batch word validation endpoint"""
+
+    @pytest.mark.integration
+    def test_validate_words_batch(self, client: TestClient):
+        """Test validity and score for each word in one response"""
+        response = client.post(
+            "/api/v1/words/validate-words",
+            json={"words": ["Masa", "xyzq", "a", "kelime"]},
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["word"] for r in results] == ["masa", "xyzq", "a", "kelime"]
+        assert [r["valid"] for r in results] == [True, False, False, True]
+        assert results[0]["score"] > 0
+        assert results[1]["score"] == 0
+
+    @pytest.mark.integration
+    def test_validate_words_marks_overlong_word_invalid(self, client: TestClient):
+        """Test that one overlong word is invalid on its own instead of failing the batch"""
+        response = client.post(
+            "/api/v1/words/validate-words", json={"words": ["masa", "a" * 51]}
+        )
+
+        assert response.status_code == 200
+        assert [r["valid"] for r in response.json()["results"]] == [True, False]
+
+    @pytest.mark.integration
+    def test_validate_words_rejects_empty_and_oversized(self, client: TestClient):
+        """Test request size limits"""
+        assert client.post("/api/v1/words/validate-words", json={"words": []}).status_code == 422
+        assert client.post(
+            "/api/v1/words/validate-words", json={"words": ["ev"] * 101}
+        ).status_code == 422
+
+
+class TestAcceptEncoding:
+    """Tests for Accept-Encoding negotiation of the dictionary download"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("header,expected", [
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.8", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, identity", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0.5, *;q=0", True),
+        ("identity", False),
+        ("", False),
+    ])
+    def test_accepts_gzip(self, header, expected):
+        """Test that q-values are honoured, including an explicit gzip;q=0"""
+        assert _accepts_gzip(header) is expected
+
+
+class TestDictionaryDownloadEndpoint:
+    """Tests for the client dictionary download endpoint"""
+
+    @pytest.mark.integration
+    def test_download_returns_versioned_etag(self, client: TestClient):
+        """Test that the dictionary is served with a strong ETag"""
+        response = client.get("/api/v1/words/dictionary")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.text.startswith("LEXODICT-FC1\t")
+
+    @pytest.mark.integration
+    def test_if_none_match_returns_304(self, client: TestClient):
+        """Test that a matching If-None-Match yields an empty 304"""
+        etag = client.get("/api/v1/words/dictionary").headers["etag"]
+        response = client.get("/api/v1/words/dictionary", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+
 class TestGameEndpoints:
     """Tests for game-related endpoints"""
     
@@ -0,0 +1,141 @@
+"""
+Unit tests for the packed, memory-mapped dictionary
+"""
+import pytest
+
+from app.core.dictionary import (
+    DictionaryFormatError,
+    PackedDictionary,
+    UNPLAYABLE_MASK,
+    decode_client_dictionary,
+    encode_client_dictionary,
+    letter_signature,
+    normalize_words,
+    write_dictionary,
+)
+from app.tools import build_dictionary
+
+
+@pytest.fixture
+def dictionary_path(tmp_path):
+    path = tmp_path / "words.dict"
+    write_dictionary(["kelime\n", "Masa\n", "  ev  \n", "\n", "masa\n", "şeker\n", "çay\n"], path)
+    return path
+
+
+class TestPackedDictionary:
+    """Tests for PackedDictionary"""
+
+    @pytest.mark.unit
+    def test_normalize_words_dedupes_and_sorts(self):
+        """Test that raw lines are stripped, lowercased, de-duplicated and sorted"""
+        keys = normalize_words(["b\n", "A\n", " a ", "", "b"])
+        assert keys == [b"a", b"b"]
+
+    @pytest.mark.unit
+    def test_membership(self, dictionary_path):
+        """Test lookups of present and absent words"""
+        dictionary = PackedDictionary(dictionary_path)
+        try:
+            for word in ("kelime", "masa", "ev", "şeker", "çay"):
+                assert word in dictionary
+            for word in ("kel", "masas", "", "xyz", "Masa"):
+                assert word not in dictionary
+        finally:
+            dictionary.close()
+
+    @pytest.mark.unit
+    def test_len_and_iteration_are_sorted(self, dictionary_path):
+        """Test word count and byte-ordered iteration"""
+        dictionary = PackedDictionary(dictionary_path)
+        try:
+            words = list(dictionary)
+            assert len(dictionary) == 5
+            assert words == sorted(words, key=lambda w: w.encode("utf-8"))
+            assert dictionary.word_at(dictionary.index_of("masa")) == "masa"
+        finally:
+            dictionary.close()
+
+    @pytest.mark.unit
+    def test_empty_dictionary(self, tmp_path):
+        """Test that an artifact with no words loads and rejects everything"""
+        path = tmp_path / "empty.dict"
+        assert write_dictionary([], path) == 0
+        dictionary = PackedDictionary(path)
+        try:
+            assert len(dictionary) == 0
+            assert "ev" not in dictionary
+        finally:
+            dictionary.close()
+
+    @pytest.mark.unit
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test that non-artifact files raise DictionaryFormatError"""
+        path = tmp_path / "words.txt"
+        path.write_text("ev\nat\nmasa\nkelime\n", encoding="utf-8")
+        with pytest.raises(DictionaryFormatError):
+            PackedDictionary(path)
+
+    @pytest.mark.unit
+    def test_checksum_detects_corruption(self, dictionary_path):
+        """Test that a modified payload fails verification"""
+        data = bytearray(dictionary_path.read_bytes())
+        data[-1] ^= 0xFF
+        dictionary_path.write_bytes(bytes(data))
+        with pytest.raises(DictionaryFormatError, match="checksum"):
+            PackedDictionary(dictionary_path)
+
+    @pytest.mark.unit
+    def test_version_is_content_addressed(self, tmp_path):
+        """Test that identical word sets produce identical versions"""
+        first, second, other = tmp_path / "a.dict", tmp_path / "b.dict", tmp_path / "c.dict"
+        write_dictionary(["ev", "at", "masa"], first)
+        write_dictionary(["masa\n", "EV", "at", "at"], second)
+        write_dictionary(["ev", "at"], other)
+        versions = [PackedDictionary(p).version for p in (first, second, other)]
+        assert versions[0] == versions[1]
+        assert versions[0] != versions[2]
+
+    @pytest.mark.unit
+    def test_build_dictionary_tool(self, tmp_path):
+        """Test the offline compiler entry point"""
+        source = tmp_path / "words.txt"
+        source.write_text("Ev\nat\n\nev\n", encoding="utf-8")
+        output = tmp_path / "words.dict"
+        assert build_dictionary.main(["--source", str(source), "--output", str(output)]) == 0
+        dictionary = PackedDictionary(output)
+        try:
+            assert len(dictionary) == 2
+            assert "ev" in dictionary
+        finally:
+            dictionary.close()
+
+    @pytest.mark.unit
+    def test_letter_signature(self):
+        """Test letter bitmasks and count vectors"""
+        from app.core.constants import LETTER_INDEX
+        mask, counts = letter_signature("masa")
+        assert counts[LETTER_INDEX['a']] == 2
+        assert counts[LETTER_INDEX['m']] == 1
+        assert mask == (1 << LETTER_INDEX['m']) | (1 << LETTER_INDEX['a']) | (1 << LETTER_INDEX['s'])
+        assert letter_signature("taxi")[0] & UNPLAYABLE_MASK
+
+    @pytest.mark.unit
+    def test_client_encoding_round_trip(self, dictionary_path):
+        """Test that the front-coded client encoding decodes to the same words"""
+        dictionary = PackedDictionary(dictionary_path)
+        try:
+            data = encode_client_dictionary(dictionary, dictionary.version)
+            assert data.startswith(f"LEXODICT-FC1\t{dictionary.version}\t5\n".encode("utf-8"))
+            assert decode_client_dictionary(data) == list(dictionary)
+        finally:
+            dictionary.close()
+
+    @pytest.mark.unit
+    def test_matches_source_word_list(self, word_service):
+        """Test that the artifact agrees with a plain set built from the word list"""
+        with open("turkish_words.txt", "r", encoding="utf-8") as f:
+            expected = set(line.strip().lower() for line in f if line.strip())
+        assert word_service.get_word_count() == len(expected)
+        for word in list(expected)[:2000]:
+            assert word_service.is_valid_word(word)
@@ -123,6 +123,15 @@ class TestGenerateReplacementLetters:
         letters2 = generate_replacement_letters(10)
         # Should be different most of the time
         assert letters1 != letters2 or len(set(letters1)) > 1
+    
+    @pytest.mark.unit
+    def test_seeded_rng_is_deterministic(self):
+        """Test that a seeded rng reproduces the same refill sequence"""
+        import random
+        rng1, rng2 = random.Random(42), random.Random(42)
+        sequence1 = [generate_replacement_letters(n, rng1) for n in (3, 5, 2)]
+        sequence2 = [generate_replacement_letters(n, rng2) for n in (3, 5, 2)]
+        assert sequence1 == sequence2
 
 
 class TestValidateWordLength:
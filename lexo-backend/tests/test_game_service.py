@@ -6,6 +6,7 @@ from unittest.mock import Mock, MagicMock
 from app.services.game_service import GameService
 from app.services.word_service import WordService
 from app.models.domain import Player, GameRoom
+from app.utils.game_logic import calculate_word_score
 
 
 @pytest.fixture
@@ -13,6 +14,7 @@ def mock_word_service():
     """Create mock WordService"""
     service = Mock(spec=WordService)
     service.is_valid_word = Mock(return_value=True)
+    service.get_word_score = Mock(side_effect=calculate_word_score)
     return service
 
 
@@ -146,3 +148,153 @@ class TestGameService:
         # Second submission should be rejected as duplicate
         validation = game_service.validate_word_submission(game_room, "Test")
         assert validation['valid'] is False
+
+
+class TestPrefixCheck:
+    """Tests for live prefix checks against the room's pool"""
+
+    @pytest.fixture
+    def room(self):
+        room = GameRoom("room_456", Player("user1", "Player1"), Player("user2", "Player2"))
+        room.set_letter_pool(list("kelimeas"))
+        return room
+
+    @pytest.fixture
+    def service(self, mock_word_service):
+        mock_word_service.find_playable_words = Mock(return_value=["kelime", "kel", "masa", "elma"])
+        return GameService(mock_word_service)
+
+    @pytest.mark.unit
+    def test_prefix_lookup(self, service, room):
+        """Test viable and complete flags for typed prefixes"""
+        assert service.check_prefix(room, "KEL") == {'prefix': 'kel', 'viable': True, 'complete': True}
+        assert service.check_prefix(room, "keli")['complete'] is False
+        assert service.check_prefix(room, "keli")['viable'] is True
+        assert service.check_prefix(room, "kx")['viable'] is False
+
+    @pytest.mark.unit
+    def test_prefix_index_built_once(self, service, room):
+        """Test the playable-word lookup only runs when the pool changes"""
+        service.check_prefix(room, "k")
+        service.check_prefix(room, "ke")
+        assert service.word_service.find_playable_words.call_count == 1
+        room.set_letter_pool(list("kelimeas"))
+        service.check_prefix(room, "k")
+        assert service.word_service.find_playable_words.call_count == 2
+
+    @pytest.mark.unit
+    def test_prefix_index_is_lazy_and_dropped_at_end(self, service, room):
+        """Test that rooms hold no prefix index until a prefix check and release it when the game ends"""
+        room.start_game()
+        assert room.prefix_index is None
+        service.check_prefix(room, "k")
+        assert room.prefix_index is not None
+        room.end_game()
+        assert room.prefix_index is None
+
+    @pytest.mark.unit
+    def test_used_words_are_not_viable(self, service, room):
+        """Test that a prefix leading only to played words stops being viable"""
+        service.check_prefix(room, "m")
+        room.add_used_word("masa")
+        assert service.check_prefix(room, "ma") == {'prefix': 'ma', 'viable': False, 'complete': False}
+        assert service.check_prefix(room, "kel")['viable'] is True
+
+
+class TestConsumablePool:
+    """Tests for the consumable-pool game mode"""
+
+    @pytest.fixture
+    def room(self):
+        room = GameRoom("room_789", Player("user1", "Player1"), Player("user2", "Player2"))
+        room.set_letter_pool(list("kalemsuyeni"))
+        room.pool_mode = 'consumable'
+        return room
+
+    @pytest.mark.unit
+    def test_word_letters_are_replaced(self, mock_word_service, room):
+        """Test that played tiles are swapped in place and only the delta is returned"""
+        service = GameService(mock_word_service)
+        result = service.process_word_submission(room, room.player1, "kalem")
+
+        assert 'letter_pool' not in result
+        assert [position for position, _ in result['pool_delta']] == [0, 1, 2, 3, 4]
+        assert result['pool_version'] == room.pool_version == 1
+        pool = room.letter_pool.to_list()
+        assert len(pool) == 11
+        assert pool[5:] == list("suyeni")
+        assert [letter for _, letter in result['pool_delta']] == pool[:5]
+
+    @pytest.mark.unit
+    def test_refills_are_deterministic_per_room(self, mock_word_service, room):
+        """Test that two rooms with the same seed draw the same refill letters"""
+        import random
+        twin = GameRoom("room_790", Player("user3", "Player3"), Player("user4", "Player4"))
+        twin.set_letter_pool(list("kalemsuyeni"))
+        twin.pool_mode = 'consumable'
+        seed = 1234
+        room.refill_rng = random.Random(seed)
+        twin.refill_rng = random.Random(seed)
+
+        service = GameService(mock_word_service)
+        first = service.process_word_submission(room, room.player1, "kalem")
+        second = service.process_word_submission(twin, twin.player1, "kalem")
+        assert first['pool_delta'] == second['pool_delta']
+
+    @pytest.mark.unit
+    def test_refill_stream_resumes_from_seed(self, mock_word_service):
+        """Test that a seeded room builds its refill rng lazily from the seed"""
+        from app.utils.game_logic import POOL_GENERATOR_VERSION, seeded_letter_pool
+        room = GameService(mock_word_service).create_game_room(
+            "room_791", Player("user1", "Player1"), Player("user2", "Player2")
+        )
+        assert room._refill_rng is None
+        pool, rng = seeded_letter_pool(room.pool_seed, len(room.initial_letter_pool), POOL_GENERATOR_VERSION)
+        assert pool == room.initial_letter_pool
+        assert room.refill_rng.random() == rng.random()
+
+    @pytest.mark.unit
+    def test_static_mode_sends_full_pool(self, mock_word_service, room):
+        """Test that static rooms keep the pool and send it whole"""
+        room.pool_mode = 'static'
+        result = GameService(mock_word_service).process_word_submission(room, room.player1, "kalem")
+        assert result['letter_pool'] == list("kalemsuyeni")
+        assert 'pool_delta' not in result
+
+
+class TestRoomTiming:
+    """Tests for monotonic in-game timing"""
+
+    @pytest.mark.unit
+    def test_time_remaining_ignores_wall_clock_jumps(self, game_room, monkeypatch):
+        """Test that a wall-clock step does not change the remaining time"""
+        import time
+        game_room.start_game()
+        monkeypatch.setattr(time, "time", lambda: game_room.started_wall + 3600)
+        assert game_room.get_time_remaining() == 60
+
+    @pytest.mark.unit
+    def test_time_remaining_follows_monotonic_clock(self, game_room, monkeypatch):
+        """Test that elapsed time is measured on the monotonic clock"""
+        import time
+        game_room.start_game()
+        started = game_room.started_monotonic
+        monkeypatch.setattr(time, "monotonic", lambda: started + 45.5)
+        assert game_room.get_time_remaining() == 15
+        monkeypatch.setattr(time, "monotonic", lambda: started + 90)
+        assert game_room.get_time_remaining() == 0
+
+    @pytest.mark.unit
+    def test_wall_clock_start_kept_for_persistence(self, game_room):
+        """Test that the wall-clock start is exposed for clients and snapshots"""
+        assert game_room.start_time is None
+        assert game_room.start_time_ms is None
+        game_room.start_game()
+        assert game_room.start_time_ms == int(game_room.started_wall * 1000)
+        assert game_room.to_snapshot()["start_time"] == game_room.start_time.isoformat()
+
+    @pytest.mark.unit
+    def test_rooms_are_slotted(self, game_room, player1):
+        """Test that rooms and players carry no per-instance __dict__"""
+        assert not hasattr(game_room, "__dict__")
+        assert not hasattr(player1, "__dict__")
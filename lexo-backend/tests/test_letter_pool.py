@@ -0,0 +1,67 @@
+"""
+Unit tests for the counted LetterPool
+"""
+import pytest
+
+from app.core.letter_pool import LetterPool
+
+
+class TestLetterPool:
+    """Tests for LetterPool class"""
+
+    @pytest.mark.unit
+    def test_contains_word_respects_multiplicity(self):
+        """Test containment checks count repeated letters"""
+        pool = LetterPool(["m", "a", "s", "ş"])
+        assert pool.contains_word("mas") is True
+        assert pool.contains_word("MAŞ") is True
+        assert pool.contains_word("masa") is False
+        assert pool.contains_word("max") is False
+        assert pool.contains_word("") is True
+
+    @pytest.mark.unit
+    def test_consume_and_refill(self):
+        """Test consuming keeps display order of the remaining letters"""
+        pool = LetterPool(list("kalem"))
+        with pytest.raises(ValueError):
+            pool.consume("ele")
+        assert pool.to_list() == list("kalem")
+
+        assert pool.consume("LA") == ["l", "a"]
+        assert pool.to_list() == ["k", "e", "m"]
+        assert pool.count("a") == 0
+        with pytest.raises(ValueError):
+            pool.consume("aa")
+        assert pool.to_list() == ["k", "e", "m"]
+
+        pool.refill(["ç", "A"])
+        assert pool.to_list() == ["k", "e", "m", "ç", "a"]
+        assert pool.count("a") == 1
+
+    @pytest.mark.unit
+    def test_exchange_replaces_tiles_in_place(self):
+        """Test that exchanged tiles keep their positions and counts stay in sync"""
+        pool = LetterPool(list("kalemak"))
+        changes = pool.exchange("kak", ["e", "i", "o"])
+        assert changes == [(0, "e"), (1, "i"), (6, "o")]
+        assert pool.to_list() == ["e", "i", "l", "e", "m", "a", "o"]
+        assert pool.count("k") == 0 and pool.count("e") == 2
+        with pytest.raises(ValueError):
+            pool.exchange("kk", ["a", "a"])
+        with pytest.raises(ValueError):
+            pool.exchange("le", ["a"])
+
+    @pytest.mark.unit
+    def test_refill_rejects_unknown_letters(self):
+        """Test that non-alphabet characters never enter the pool"""
+        with pytest.raises(ValueError):
+            LetterPool(["a", "x"])
+
+    @pytest.mark.unit
+    def test_snapshot_round_trip(self):
+        """Test compact encoding and decoding of legacy comma-joined snapshots"""
+        pool = LetterPool(list("ığüşöç") + ["a", "a"])
+        assert pool.encode() == "ığüşöçaa"
+        assert LetterPool.decode(pool.encode()) == pool
+        assert LetterPool.decode("ı,ğ,ü,ş,ö,ç,a,a") == pool
+        assert LetterPool.decode("") == LetterPool()
@@ -0,0 +1,69 @@
+"""
+Tests for seeded letter pools and their regeneration from game history
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.game_history_service import GameHistoryService
+from app.tools.verify_pool_seeds import VerificationReport, verify_game
+from app.utils.game_logic import (
+    POOL_GENERATOR_VERSION,
+    generate_replacement_letters,
+    seeded_letter_pool,
+)
+
+
+def _game(seed, letter_pool=None, size=16, version=POOL_GENERATOR_VERSION, room_id="room"):
+    return SimpleNamespace(
+        room_id=room_id, pool_seed=seed, pool_size=size,
+        pool_generator_version=version, letter_pool=letter_pool,
+    )
+
+
+class TestSeededLetterPool:
+    """Tests for seed-driven pool generation"""
+
+    @pytest.mark.unit
+    def test_same_seed_same_pool_and_refills(self):
+        """Test that pool and refill stream are reproducible from the seed"""
+        pool1, rng1 = seeded_letter_pool(42, 16)
+        pool2, rng2 = seeded_letter_pool(42, 16)
+        assert pool1 == pool2
+        assert len(pool1) == 16
+        assert generate_replacement_letters(8, rng1) == generate_replacement_letters(8, rng2)
+        assert seeded_letter_pool(43, 16)[0] != pool1
+
+    @pytest.mark.unit
+    def test_unknown_generator_version(self):
+        """Test that unsupported generator versions are refused"""
+        with pytest.raises(ValueError):
+            seeded_letter_pool(42, 16, POOL_GENERATOR_VERSION + 1)
+
+    @pytest.mark.unit
+    def test_history_letter_pool(self):
+        """Test pool reconstruction from seeded and legacy history rows"""
+        pool, _ = seeded_letter_pool(7, 16)
+        assert GameHistoryService.get_letter_pool(_game(7)) == pool
+        legacy = SimpleNamespace(pool_seed=None, letter_pool="a,b,c")
+        assert GameHistoryService.get_letter_pool(legacy) == ["a", "b", "c"]
+
+
+class TestVerifyPoolSeeds:
+    """Tests for the pool-seed verification tool"""
+
+    @pytest.mark.unit
+    def test_report(self):
+        """Test that matches, seed-only rows and mismatches are classified"""
+        pool, _ = seeded_letter_pool(7, 16)
+        report = VerificationReport()
+        verify_game(_game(7, ",".join(pool)), report)
+        verify_game(_game(8), report)
+        verify_game(_game(9, ",".join(pool), room_id="bad"), report)
+        verify_game(_game(10, version=POOL_GENERATOR_VERSION + 1, room_id="future"), report)
+
+        assert report.matched == 1
+        assert report.seed_only == 1
+        assert report.mismatched == ["bad"]
+        assert report.unsupported == ["future"]
+        assert not report.ok
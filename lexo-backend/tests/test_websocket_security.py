@@ -209,6 +209,14 @@ class TestMessageValidation:
         for msg in invalid_words:
             assert validate_message(msg) is False
     
+    def test_validate_message_check_prefix(self):
+        """Test validation of typing-feedback prefix checks"""
+        assert validate_message({"type": "check_prefix", "prefix": "kel"}) is True
+        assert validate_message({"type": "check_prefix", "prefix": ""}) is False
+        assert validate_message({"type": "check_prefix", "prefix": "k3l"}) is False
+        assert validate_message({"type": "check_prefix", "prefix": 5}) is False
+        assert validate_message({"type": "check_prefix", "prefix": "a" * 51}) is False
+    
     def test_validate_message_emoji_too_long(self):
         """Test validation fails for excessively long emoji strings"""
         message = {"type": "send_emoji", "emoji": "😀" * 20}
@@ -69,3 +69,84 @@ class TestWordService:
         # Most single letters shouldn't be valid words
         result = word_service.is_valid_word("a")
         assert isinstance(result, bool)
+
+    @pytest.mark.unit
+    def test_find_playable_words_respects_pool(self, word_service, sample_letter_pool):
+        """Test that every playable word can be spelled from the pool"""
+        from app.utils.game_logic import has_letters_in_pool
+        words = word_service.find_playable_words(sample_letter_pool)
+        assert words
+        for word in words:
+            assert has_letters_in_pool(word, sample_letter_pool)
+            assert word_service.is_valid_word(word)
+            assert len(word) >= 2
+
+    @pytest.mark.unit
+    def test_find_playable_words_respects_multiplicity(self, word_service):
+        """Test that letters are not reused beyond their count in the pool"""
+        words = word_service.find_playable_words(['m', 'a', 's'])
+        assert "masa" not in words
+        assert "masa" in word_service.find_playable_words(['m', 'a', 's', 'a'])
+
+    @pytest.mark.unit
+    def test_find_playable_words_min_length(self, word_service, sample_letter_pool):
+        """Test the minimum length filter"""
+        words = word_service.find_playable_words(sample_letter_pool, min_length=5)
+        assert words
+        assert all(len(word) >= 5 for word in words)
+        assert set(words) <= set(word_service.find_playable_words(sample_letter_pool))
+
+    @pytest.mark.unit
+    def test_client_dictionary_is_cached_per_version(self, word_service):
+        """Test that the downloadable dictionary is built once and tagged with the version"""
+        import gzip
+        bundle = word_service.get_client_dictionary()
+        assert bundle is word_service.get_client_dictionary()
+        assert bundle.version == word_service.get_version()
+        assert bundle.etag == f'"{bundle.version}"'
+        assert gzip.decompress(bundle.gzipped) == bundle.raw
+        assert len(bundle.gzipped) < len(bundle.raw) // 2
+
+    @pytest.mark.unit
+    def test_word_table_matches_calculate_word_score(self, word_service):
+        """Test that precomputed scores and lengths agree with the per-word scorer"""
+        from app.utils.game_logic import calculate_word_score
+        table = word_service.word_table
+        for index, word in enumerate(word_service.dictionary):
+            assert table.scores[index] == calculate_word_score(word), word
+            assert table.lengths[index] == len(word), word
+
+    @pytest.mark.unit
+    def test_get_word_score_falls_back_for_unknown_words(self, word_service):
+        """Test that words outside the dictionary are still scored"""
+        from app.utils.game_logic import calculate_word_score
+        assert word_service.get_word_score("KELIME") == calculate_word_score("kelime")
+        assert word_service.get_word_score("xqzwv") == calculate_word_score("xqzwv")
+        assert list(word_service.score_words(["masa", "xqzwv"])) == [
+            calculate_word_score("masa"), calculate_word_score("xqzwv")
+        ]
+
+    @pytest.mark.unit
+    def test_score_words_matches_single_lookups(self, word_service):
+        """Test that bulk scoring agrees with get_word_score for known, unknown and mixed-case words"""
+        words = list(word_service.dictionary)[:500] + ["MASA", "xqzwv", ""]
+        assert list(word_service.score_words(words)) == [word_service.get_word_score(w) for w in words]
+        assert word_service.score_words([]).shape == (0,)
+
+    @pytest.mark.unit
+    def test_score_letter_pool(self, word_service, sample_letter_pool):
+        """Test that pool scoring sums the scores of the playable words"""
+        from app.utils.game_logic import calculate_word_score
+        words = word_service.find_playable_words(sample_letter_pool)
+        assert word_service.score_letter_pool(sample_letter_pool) == (
+            len(words), sum(calculate_word_score(w) for w in words)
+        )
+
+    @pytest.mark.unit
+    def test_word_metadata(self, word_service):
+        """Test per-word metadata lookup"""
+        metadata = word_service.get_word_metadata("Masa")
+        assert metadata.word == "masa"
+        assert metadata.length == 4
+        assert metadata.letter_counts == {"m": 1, "a": 2, "s": 1}
+        assert word_service.get_word_metadata("xqzwv") is None
@@ -103,6 +103,8 @@ export default function Multiplayer() {
   const isMounted = useRef(true);
   const serverTimeOffsetRef = useRef(0);
   const serverStartTimeRef = useRef<number | null>(null);
+  const poolVersionRef = useRef(0);
+  const selectedIndicesRef = useRef<number[]>([]);
   const gameDataRef = useRef({
     startTime: null as Date | null,
     roomId: '',
@@ -163,6 +165,10 @@ export default function Multiplayer() {
     }, 15000) as any;
   }, [sendPing, stopPingLoop]);
 
+  useEffect(() => {
+    selectedIndicesRef.current = selectedIndices;
+  }, [selectedIndices]);
+
   useEffect(() => {
     isMounted.current = true;
     if (user && !createUserMutation.isPending && !createUserMutation.isSuccess) {
@@ -368,6 +374,30 @@ export default function Multiplayer() {
     }
   };
 
+  // Consumable pools arrive as [position, letter] deltas; static pools as the full list
+  const applyPoolUpdate = (data: any) => {
+    if (Array.isArray(data.letter_pool)) {
+      setLetterPool(data.letter_pool);
+      return;
+    }
+    if (!Array.isArray(data.pool_delta) || typeof data.pool_version !== 'number') return;
+    if (data.pool_version <= poolVersionRef.current) return;
+    poolVersionRef.current = data.pool_version;
+    const changed = data.pool_delta.map(([position]: [number, string]) => position);
+    setLetterPool(prev => {
+      const next = [...prev];
+      for (const [position, letter] of data.pool_delta as [number, string][]) {
+        next[position] = letter;
+      }
+      return next;
+    });
+    // A selection over a replaced tile would spell a different word
+    if (selectedIndicesRef.current.some(i => changed.includes(i))) {
+      setSelectedIndices([]);
+      setCurrentWord('');
+    }
+  };
+
   const handleMessage = (data: any) => {
     switch (data.type) {
       case 'queue_joined':
@@ -407,6 +437,7 @@ export default function Multiplayer() {
         setEndReason(null);
         setLetterPool(data.letter_pool);
         setInitialLetterPool(data.letter_pool);
+        poolVersionRef.current = data.pool_version ?? 0;
         setScores(data.scores);
         gameDataRef.current.scores = data.scores;
         setGameState('playing');
@@ -443,6 +474,7 @@ export default function Multiplayer() {
         gameDataRef.current.scores = data.scores;
         setCurrentWord('');
         setSelectedIndices([]);
+        applyPoolUpdate(data);
         Toast.show({
           type: 'success',
           text1: 'Harika!',
@@ -475,6 +507,7 @@ export default function Multiplayer() {
         });
         setScores(data.scores);
         gameDataRef.current.scores = data.scores;
+        applyPoolUpdate(data);
         break;
 
       case 'game_end':
@@ -554,6 +587,7 @@ export default function Multiplayer() {
         setOpponentUserId(data.opponent_user_id);
         setLetterPool(data.letter_pool);
         setInitialLetterPool(data.letter_pool);
+        poolVersionRef.current = data.pool_version ?? 0;
         setScores(data.scores);
         gameDataRef.current.scores = data.scores;
         setGameState('playing');
@@ -585,6 +619,29 @@ export default function Multiplayer() {
         });
         break;
 
+      case 'match_cancelled':
+        if (timerRef.current !== null) {
+          clearInterval(timerRef.current);
+          timerRef.current = null;
+        }
+        if (gameEndTimeoutRef.current !== null) {
+          clearTimeout(gameEndTimeoutRef.current);
+          gameEndTimeoutRef.current = null;
+        }
+        clearActiveGameFromStorage();
+        serverStartTimeRef.current = null;
+        Alert.alert(
+          'Maç İptal Edildi',
+          data.message,
+          [
+            {
+              text: 'Tamam',
+              onPress: () => router.replace('/(home)')
+            }
+          ]
+        );
+        break;
+
       case 'game_expired':
         clearActiveGameFromStorage();
         Alert.alert(
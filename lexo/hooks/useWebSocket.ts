@@ -41,6 +41,8 @@ export const useWebSocket = ({
 
   // Keep stable refs for callbacks so reconnect closure stays current
   const urlRef = useRef<string>('');
+  // URL the consumer asked for; a room's worker URL only applies until that match is over
+  const homeUrlRef = useRef<string>('');
   const initialDataRef = useRef<any>(null);
   const onMessageRef = useRef(onMessage);
   const onConnectRef = useRef(onConnect);
@@ -94,8 +96,10 @@ export const useWebSocket = ({
 
       const websocket = new WebSocket(url);
       wsRef.current = websocket;
+      let opened = false;
 
       websocket.onopen = () => {
+        opened = true;
         setIsConnected(true);
         reconnectAttemptsRef.current = 0;
         setReconnectAttempts(0);
@@ -124,6 +128,15 @@ export const useWebSocket = ({
           }
 
           onMessageRef.current(data);
+
+          // Room affinity: move to the server that owns the room so game messages stay local
+          if (data.type === 'match_found' && data.reconnect_url && data.reconnect_url !== urlRef.current) {
+            urlRef.current = data.reconnect_url;
+            websocket.close(1000, 'room_affinity');
+          } else if (data.type === 'game_end' || data.type === 'server_restarting') {
+            // The match is over or its worker is going away: next connect goes through the front door
+            urlRef.current = homeUrlRef.current;
+          }
         } catch {
           // silent parse error
         }
@@ -139,6 +152,7 @@ export const useWebSocket = ({
         wsRef.current = null;
         clearTimers();
         onDisconnectRef.current?.();
+        if (!opened) urlRef.current = homeUrlRef.current;
 
         if (!autoReconnect || isManualClose.current) return;
 
@@ -156,6 +170,7 @@ export const useWebSocket = ({
         }, delay);
       };
     } catch (error) {
+      urlRef.current = homeUrlRef.current;
       onErrorRef.current?.(error as Error);
     }
   }, [autoReconnect, getToken, startPingInterval, clearTimers]);
@@ -189,6 +204,7 @@ export const useWebSocket = ({
   const connectWrapped = useCallback((url: string, initialData?: any) => {
     isManualClose.current = false;
     reconnectAttemptsRef.current = 0;
+    homeUrlRef.current = url;
     return connect(url, initialData);
   }, [connect]);
 